@@ -0,0 +1,48 @@
+"""Measure the import time of tppt and fail when it exceeds the budget.
+
+Usage:
+    python benchmarks/import_time.py --budget-ms 20
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+def measure_import_time(module: str) -> float:
+    """Measure the cumulative import time of the module in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Each line is "import time: <self [us]> | <cumulative [us]> | <module>"
+    for line in result.stderr.splitlines():
+        columns = line.removeprefix("import time:").split("|")
+        if len(columns) == 3 and columns[2].strip() == module:
+            return int(columns[1]) / 1000
+
+    raise RuntimeError(f"{module} was not found in the importtime output.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="tppt", help="Module to import.")
+    parser.add_argument(
+        "--budget-ms", type=float, default=20.0, help="Import time budget [ms]."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements.")
+    args = parser.parse_args()
+
+    # The fastest run is the least affected by the noise of the machine.
+    elapsed = min(measure_import_time(args.module) for _ in range(args.repeat))
+
+    print(f"import {args.module}: {elapsed:.2f} ms (budget: {args.budget_ms} ms)")
+    if elapsed > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
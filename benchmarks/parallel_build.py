@@ -0,0 +1,61 @@
+"""Compare the sequential and the parallel build of a deck of table slides.
+
+Usage:
+    python benchmarks/parallel_build.py --slides 200 --rows 30 --workers 4
+"""
+
+import argparse
+import functools
+import time
+
+import tppt
+from tppt.template.default import DefaultSlideMaster
+
+
+def table_slide(slide: type[DefaultSlideMaster], rows: int):
+    data = [["no", "name", "value"], *[[i, f"item {i}", i * 1.5] for i in range(rows)]]
+    return (
+        slide.BlankLayout()
+        .builder()
+        .table(
+            data,
+            left=(0.5, "in"),
+            top=(0.5, "in"),
+            width=(9, "in"),
+            height=(6.5, "in"),
+            column_formats={"value": ",.2f"},
+        )
+    )
+
+
+def measure(slides: int, rows: int, workers: int | None) -> float:
+    """Measure the time to build the deck in seconds."""
+    start = time.perf_counter()
+    builder = tppt.Presentation.builder()
+    if workers is not None:
+        builder.parallel(workers)
+    for _ in range(slides):
+        builder.slide(functools.partial(table_slide, rows=rows))
+    builder.build()
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--slides", type=int, default=200, help="Number of slides.")
+    parser.add_argument("--rows", type=int, default=30, help="Rows of each table.")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Number of worker processes."
+    )
+    args = parser.parse_args()
+
+    sequential = measure(args.slides, args.rows, None)
+    parallel = measure(args.slides, args.rows, args.workers or 0)
+
+    print(f"sequential: {sequential:.3f} s")
+    print(f"parallel:   {parallel:.3f} s ({sequential / parallel:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
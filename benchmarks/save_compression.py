@@ -0,0 +1,69 @@
+"""Compare the save time and the file size of the compression policies.
+
+The decks are loaded from their files, so "as loaded" copies the entries
+as they are, and each policy compresses the entries again as it says.
+
+Usage:
+    python benchmarks/save_compression.py examples/*.pptx --repeat 5
+"""
+
+import argparse
+import io
+import pathlib
+import time
+
+import tppt
+from tppt.pptx.package_writer import (
+    DEFAULT_COMPRESSION,
+    FAST_COMPRESSION,
+    SMALL_COMPRESSION,
+    CompressionPolicy,
+)
+
+POLICIES: dict[str, CompressionPolicy | None] = {
+    "as loaded": None,
+    "default": DEFAULT_COMPRESSION,
+    "fast": FAST_COMPRESSION,
+    "small": SMALL_COMPRESSION,
+}
+
+
+def measure(
+    presentation: tppt.Presentation, policy: CompressionPolicy | None, repeat: int
+) -> tuple[float, int]:
+    """Measure the fastest save time in seconds and the file size in bytes."""
+    elapsed = []
+    for _ in range(repeat):
+        file = io.BytesIO()
+        start = time.perf_counter()
+        presentation.save(file, compression=policy)
+        elapsed.append(time.perf_counter() - start)
+
+    return min(elapsed), len(file.getvalue())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("decks", nargs="*", type=pathlib.Path, help="Decks to save.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements.")
+    args = parser.parse_args()
+
+    decks = args.decks or sorted(pathlib.Path("examples").glob("*.pptx"))
+    print(f"{'deck':<32} {'policy':<12} {'time [ms]':>10} {'size [KiB]':>11}")
+    for deck in decks:
+        presentation = tppt.Presentation(deck)
+        sizes = {}
+        for name, policy in POLICIES.items():
+            elapsed, sizes[name] = measure(presentation, policy, args.repeat)
+            print(
+                f"{deck.name:<32} {name:<12} {elapsed * 1000:>10.2f}"
+                f" {sizes[name] / 1024:>11.1f}"
+            )
+
+        assert sizes["fast"] != sizes["small"], (
+            f"{deck.name}: the policies were not applied to the loaded deck."
+        )
+
+
+if __name__ == "__main__":
+    main()
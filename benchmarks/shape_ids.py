@@ -0,0 +1,94 @@
+"""Compare the time to add many shapes to one slide with and without the allocator.
+
+Without the allocator, python-pptx scans every shape id of the slide
+for each new shape, so the time per shape grows with the number of shapes.
+
+Usage:
+    python benchmarks/shape_ids.py --shapes 100 200 400 800
+"""
+
+import argparse
+import time
+from unittest import mock
+
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
+
+import tppt
+from tppt.pptx import slide as slide_module
+from tppt.template.default import DefaultSlideMaster
+
+
+def dashboard_slide(slide: type[DefaultSlideMaster], shapes: int):
+    builder = slide.BlankLayout().builder()
+    for i in range(shapes):
+        left, top = (i % 40) * 0.25, (i // 40) * 0.35
+        if i % 2:
+            builder.text(
+                f"{i}",
+                left=(left, "in"),
+                top=(top, "in"),
+                width=(0.25, "in"),
+                height=(0.3, "in"),
+            )
+        else:
+            builder.add_shape(
+                MSO_AUTO_SHAPE_TYPE.RECTANGLE,
+                left=(left, "in"),
+                top=(top, "in"),
+                width=(0.2, "in"),
+                height=(0.3, "in"),
+            )
+
+    return builder
+
+
+class _Unallocated:
+    """Stand-in for the allocator that leaves the numbering to python-pptx."""
+
+    def __init__(self, shapes) -> None:
+        pass
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+def measure(shapes: int) -> float:
+    """Measure the time to build a slide of the shapes in seconds."""
+    start = time.perf_counter()
+    (
+        tppt.Presentation.builder()
+        .slide(lambda slide: dashboard_slide(slide, shapes))
+        .build()
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--shapes",
+        type=int,
+        nargs="+",
+        default=[100, 200, 400, 800],
+        help="Numbers of shapes on the slide.",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'shapes':>6} {'scan [ms]':>10} {'allocator [ms]':>15} {'per shape [us]':>15}"
+    )
+    for shapes in args.shapes:
+        with mock.patch.object(slide_module, "ShapeIdAllocator", _Unallocated):
+            scan = measure(shapes)
+        allocator = measure(shapes)
+        print(
+            f"{shapes:>6} {scan * 1000:>10.1f} {allocator * 1000:>15.1f}"
+            f" {allocator / shapes * 1e6:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measure the time per access of the lazy slide view of decks of many slides.
+
+The time per `len`, indexing and lookup by slide id should not grow
+with the number of slides.
+python-pptx adds slides in quadratic time, so the decks are built from their parts.
+
+Usage:
+    python benchmarks/slide_access.py --slides 1000 5000 10000
+"""
+
+import argparse
+import functools
+import time
+from collections.abc import Callable
+
+import pptx
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import SlidePart
+
+import tppt
+
+
+def deck(slides: int) -> tppt.Presentation:
+    """Build a deck of blank slides."""
+    presentation = pptx.Presentation()
+    presentation_part = presentation.part
+    layout_part = presentation.slide_layouts[6].part
+    sld_id_lst = presentation_part._element.get_or_add_sldIdLst()
+    for index in range(slides):
+        slide_part = SlidePart.new(
+            PackURI(f"/ppt/slides/slide{index + 1}.xml"),
+            presentation_part.package,
+            layout_part,
+        )
+        r_id = presentation_part.rels._add_relationship(RT.SLIDE, slide_part)
+        sld_id_lst._add_sldId(id=256 + index, rId=r_id)
+
+    return tppt.Presentation(presentation)
+
+
+def measure(access: Callable[[], object], number: int) -> float:
+    """Measure the time per access in microseconds."""
+    start = time.perf_counter()
+    for _ in range(number):
+        access()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--slides",
+        type=int,
+        nargs="+",
+        default=[1000, 5000, 10000],
+        help="Numbers of slides in the deck.",
+    )
+    parser.add_argument("--number", type=int, default=10000, help="Number of accesses.")
+    args = parser.parse_args()
+
+    print(f"{'slides':>6} {'len [us]':>9} {'index [us]':>11} {'get [us]':>9}")
+    for slides in args.slides:
+        view = deck(slides).slides
+        middle = slides // 2
+        # The first access indexes the slides.
+        slide_id = view[middle].slide_id
+
+        length = measure(view.__len__, args.number)
+        index = measure(functools.partial(view.__getitem__, middle), args.number)
+        get = measure(functools.partial(view.get, slide_id), args.number)
+        print(f"{slides:>6} {length:>9.2f} {index:>11.2f} {get:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare the bulk XML table writer with the per-cell python-pptx path.
+
+Usage:
+    python benchmarks/table_write.py --rows 50 --cols 20 --tables 100
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import pptx
+from pptx.table import Table as PptxTable
+from pptx.util import Pt
+
+from tppt.pptx.table._xml import write_table_data
+
+
+def write_per_cell(table: PptxTable, data: list[list[str]]) -> None:
+    """Write the data through the python-pptx cell proxies."""
+    for i, row in enumerate(data):
+        for j, value in enumerate(row):
+            table.cell(i, j).text = str(value)
+
+
+def write_bulk(table: PptxTable, data: list[list[str]]) -> None:
+    """Write the data with the bulk XML writer."""
+    write_table_data(table._tbl, data)
+
+
+def measure(
+    writer: Callable[[PptxTable, list[list[str]]], None],
+    data: list[list[str]],
+    tables: int,
+) -> float:
+    """Measure the time to write the data into new tables in seconds."""
+    prs = pptx.Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    rows, cols = len(data), len(data[0])
+    elapsed = 0.0
+    for _ in range(tables):
+        table = slide.shapes.add_table(rows, cols, 0, 0, Pt(700), Pt(500)).table
+        start = time.perf_counter()
+        writer(table, data)
+        elapsed += time.perf_counter() - start
+
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--tables", type=int, default=100)
+    args = parser.parse_args()
+
+    data = [[f"{i * j:,.2f}" for j in range(args.cols)] for i in range(args.rows)]
+
+    per_cell = measure(write_per_cell, data, args.tables)
+    bulk = measure(write_bulk, data, args.tables)
+
+    print(f"table: {args.rows} x {args.cols}, {args.tables} tables")
+    print(f"per-cell: {per_cell:.3f} s")
+    print(f"bulk:     {bulk:.3f} s ({per_cell / bulk:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compare the time a new worker process takes to get its first template.
+
+Each measurement starts a fresh interpreter, imports tppt and python-pptx,
+and then times the first `template_cache.get` of the template,
+either parsed from the template file or loaded from a snapshot.
+
+Usage:
+    python benchmarks/template_startup.py --template examples/custom_slide_master_base.pptx
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+from tppt.template.snapshot import dump_template_snapshot
+
+_WORKER = """
+import sys, time
+import pptx, tppt.pptx
+from tppt.template.cache import template_cache
+from tppt.template.snapshot import load_template_snapshot
+
+source, snapshot = sys.argv[1], sys.argv[2]
+start = time.perf_counter()
+if snapshot:
+    load_template_snapshot(snapshot)
+template_cache.get(source)
+print(time.perf_counter() - start)
+"""
+
+
+def measure(source: str, snapshot: str = "") -> float:
+    """Measure the time to the first template of a new process in seconds."""
+    result = subprocess.run(
+        [sys.executable, "-c", _WORKER, source, snapshot],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--template", default="default", help="Template file, or 'default'."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Number of measurements."
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = os.path.join(directory, "template.snapshot")
+        dump_template_snapshot(args.template, snapshot)
+
+        # The fastest run is the least affected by the noise of the machine.
+        parse = min(measure(args.template) for _ in range(args.repeat))
+        load = min(measure(args.template, snapshot) for _ in range(args.repeat))
+
+    print(f"template: {args.template}")
+    print(f"{'parse [ms]':>10} {'snapshot [ms]':>14} {'speedup':>8}")
+    print(f"{parse * 1000:>10.2f} {load * 1000:>14.2f} {parse / load:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
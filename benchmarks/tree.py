@@ -0,0 +1,97 @@
+"""Compare the time to extract the tree of a deck with both engines of ppt2tree.
+
+Each engine reads a freshly loaded copy of the same deck, since the
+python-pptx engine adds properties to the text it reads.
+
+Usage:
+    python benchmarks/tree.py --slides 100 300 600
+"""
+
+import argparse
+import io
+import pathlib
+import time
+
+import pptx
+
+import tppt
+from tppt.pptx.tree import ppt2tree
+from tppt.template.default import DefaultSlideMaster
+
+LOGO = pathlib.Path(__file__).parent.parent / "examples" / "images" / "python-logo.png"
+
+
+def report_slide(slide: type[DefaultSlideMaster], index: int):
+    builder = slide.BlankLayout().builder()
+    for i in range(4):
+        builder.text(
+            f"Item {index}.{i}",
+            left=(1, "in"),
+            top=(0.5 + i * 0.5, "in"),
+            width=(3, "in"),
+            height=(0.4, "in"),
+            size=(14, "pt"),
+            bold=bool(i % 2),
+        )
+
+    return builder.picture(
+        LOGO, left=(5, "in"), top=(0.5, "in"), width=(2, "in")
+    ).table(
+        [["name", "value", "unit"]] + [[f"row {i}", i * index, "pt"] for i in range(8)],
+        left=(1, "in"),
+        top=(3, "in"),
+        width=(6, "in"),
+        height=(3, "in"),
+    )
+
+
+def deck(slides: int) -> bytes:
+    """Build a deck of title, text, picture and table slides."""
+    builder = tppt.Presentation.builder()
+    for index in range(slides):
+        if index % 10 == 0:
+            builder.slide(
+                lambda slide, index=index: slide.TitleLayout(title=f"Part {index}")
+            )
+        else:
+            builder.slide(lambda slide, index=index: report_slide(slide, index))
+
+    file = io.BytesIO()
+    builder.save(file)
+    return file.getvalue()
+
+
+def measure(blob: bytes, engine: str) -> float:
+    """Measure the time to extract the tree of the deck in seconds."""
+    presentation = pptx.Presentation(io.BytesIO(blob))
+    start = time.perf_counter()
+    ppt2tree(presentation, engine=engine)  # type: ignore[arg-type]
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--slides",
+        type=int,
+        nargs="+",
+        default=[100, 300, 600],
+        help="Numbers of slides in the deck.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Number of measurements.")
+    args = parser.parse_args()
+
+    print(f"{'slides':>6} {'python-pptx [ms]':>17} {'xml [ms]':>9} {'speedup':>8}")
+    for slides in args.slides:
+        blob = deck(slides)
+        # The fastest run is the least affected by the noise of the machine.
+        walker = min(measure(blob, "python-pptx") for _ in range(args.repeat))
+        xml = min(measure(blob, "xml") for _ in range(args.repeat))
+        print(
+            f"{slides:>6} {walker * 1000:>17.1f} {xml * 1000:>9.1f}"
+            f" {walker / xml:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -21,19 +21,40 @@
 
 """
 
-import importlib.metadata
-from typing import Callable, Concatenate, ParamSpec, TypeVar
+import importlib
+from typing import TYPE_CHECKING, Any, Callable, Concatenate, ParamSpec, TypeVar
 
-from . import pptx as pptx
-from . import types as types
-from .pptx import Presentation as Presentation
-from .template.slide_layout import Placeholder as Placeholder
-from .template.slide_layout import SlideLayout as SlideLayout
-from .template.slide_master import Layout as Layout
-from .template.slide_master import SlideMaster as SlideMaster
-from .template.slide_master import slide_master as slide_master
+if TYPE_CHECKING:
+    from . import batch as batch
+    from . import pptx as pptx
+    from . import types as types
+    from .pptx import Presentation as Presentation
+    from .pptx.merge import merge as merge
+    from .pptx.recipe import Slot as Slot
+    from .pptx.recipe import compile_slide as compile_slide
+    from .template.slide_layout import Placeholder as Placeholder
+    from .template.slide_layout import SlideLayout as SlideLayout
+    from .template.slide_master import Layout as Layout
+    from .template.slide_master import SlideMaster as SlideMaster
+    from .template.slide_master import slide_master as slide_master
 
-__version__ = importlib.metadata.version("tppt")
+    __version__: str
+
+# NOTE: Public attributes are imported on first access,
+#       so that `import tppt` does not load python-pptx and the templates.
+_LAZY_SUBMODULES = frozenset(("batch", "pptx", "types"))
+
+_LAZY_ATTRIBUTES = {
+    "Presentation": "tppt.pptx",
+    "merge": "tppt.pptx.merge",
+    "Slot": "tppt.pptx.recipe",
+    "compile_slide": "tppt.pptx.recipe",
+    "Placeholder": "tppt.template.slide_layout",
+    "SlideLayout": "tppt.template.slide_layout",
+    "Layout": "tppt.template.slide_master",
+    "SlideMaster": "tppt.template.slide_master",
+    "slide_master": "tppt.template.slide_master",
+}
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -59,3 +80,27 @@ def apply(
         return func(x, *args, **kwargs)
 
     return wrapper
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+
+    elif (module_name := _LAZY_ATTRIBUTES.get(name)) is not None:
+        value = getattr(importlib.import_module(module_name), name)
+
+    elif name == "__version__":
+        from importlib import metadata
+
+        value = metadata.version("tppt")
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_SUBMODULES, *_LAZY_ATTRIBUTES, "__version__"})
@@ -1,4 +1,14 @@
-from typing import ClassVar, Protocol, TypeVar
+"""Optional dependency detection.
+
+The optional libraries are never imported when `tppt` is imported.
+`USE_*` flags only look the libraries up, and the type aliases import them on first access.
+"""
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, TypeVar
 
 from typing_extensions import TypeAlias
 
@@ -15,38 +25,78 @@ class Dataclass(Protocol):
     __dataclass_fields__: ClassVar[dict]
 
 
-try:
-    import pydantic  # type: ignore[import]  # noqa: F401
+if TYPE_CHECKING:
+    import pandas  # type: ignore[import]
+    import polars  # type: ignore[import]
+    import pyarrow  # type: ignore[import]
+    import pydantic  # type: ignore[import]
+
+    USE_PYDANTIC: bool
+    USE_PANDAS: bool
+    USE_POLARS: bool
+    USE_PYARROW: bool
 
-    USE_PYDANTIC = True
     PydanticModel: TypeAlias = pydantic.BaseModel  # type: ignore
+    PandasDataFrame: TypeAlias = pandas.DataFrame  # type: ignore
+    PolarsDataFrame: TypeAlias = polars.DataFrame  # type: ignore
+    PolarsLazyFrame: TypeAlias = polars.LazyFrame  # type: ignore
+    ArrowTable: TypeAlias = pyarrow.Table  # type: ignore
+    ArrowRecordBatch: TypeAlias = pyarrow.RecordBatch  # type: ignore
+    ArrowRecordBatchReader: TypeAlias = pyarrow.RecordBatchReader  # type: ignore
 
-except ImportError:
-    USE_PYDANTIC = False
-    PydanticModel: TypeAlias = _NotSupportFeature  # type: ignore
 
+_FEATURE_MODULES = {
+    "USE_PYDANTIC": "pydantic",
+    "USE_PANDAS": "pandas",
+    "USE_POLARS": "polars",
+    "USE_PYARROW": "pyarrow",
+}
 
-try:
-    import pandas  # type: ignore[import]  # noqa: F401
+_FEATURE_TYPES = {
+    "PydanticModel": ("pydantic", "BaseModel"),
+    "PandasDataFrame": ("pandas", "DataFrame"),
+    "PolarsDataFrame": ("polars", "DataFrame"),
+    "PolarsLazyFrame": ("polars", "LazyFrame"),
+    "ArrowTable": ("pyarrow", "Table"),
+    "ArrowRecordBatch": ("pyarrow", "RecordBatch"),
+    "ArrowRecordBatchReader": ("pyarrow", "RecordBatchReader"),
+}
 
-    USE_PANDAS = True
-    PandasDataFrame: TypeAlias = pandas.DataFrame  # type: ignore
 
+def loaded_module(name: str) -> ModuleType | None:
+    """Get the module only if it has already been imported.
 
-except ImportError:
-    USE_PANDAS = False
-    PandasDataFrame: TypeAlias = _NotSupportFeature  # type: ignore
+    An object of an optional library type can only exist after the library is imported,
+    so this is enough to detect such objects without importing anything.
+    """
+    return sys.modules.get(name)
 
 
-try:
-    import polars  # type: ignore[import]  # noqa: F401
+def is_instance_of(obj: object, module_name: str, *type_names: str) -> bool:
+    """Check the type of an object defined in an optional library without importing it."""
+    if (module := loaded_module(module_name)) is None:
+        return False
 
-    USE_POLARS = True
-    PolarsDataFrame: TypeAlias = polars.DataFrame  # type: ignore
-    PolarsLazyFrame: TypeAlias = polars.LazyFrame  # type: ignore
+    return isinstance(obj, tuple(getattr(module, name) for name in type_names))
+
+
+def __getattr__(name: str) -> Any:
+    if (module_name := _FEATURE_MODULES.get(name)) is not None:
+        value: Any = (
+            module_name in sys.modules
+            or importlib.util.find_spec(module_name) is not None
+        )
+
+    elif (feature_type := _FEATURE_TYPES.get(name)) is not None:
+        module_name, type_name = feature_type
+        try:
+            value = getattr(importlib.import_module(module_name), type_name)
+        except ImportError:
+            value = _NotSupportFeature
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+    globals()[name] = value
 
-except ImportError:
-    USE_POLARS = False
-    PolarsDataFrame: TypeAlias = _NotSupportFeature  # type: ignore
-    PolarsLazyFrame: TypeAlias = _NotSupportFeature  # type: ignore
+    return value
@@ -0,0 +1,141 @@
+"""Batch deck generation from one slide master and many data records."""
+
+import os
+import pathlib
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TypeVar
+
+from tppt.pptx.presentation import PresentationBuilder
+from tppt.template.slide_master import GenericTpptSlideMaster
+from tppt.types import FilePath
+
+Record = TypeVar("Record")
+
+Recipe = Callable[
+    [PresentationBuilder[GenericTpptSlideMaster], Record],
+    PresentationBuilder[GenericTpptSlideMaster],
+]
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """Result of rendering one deck."""
+
+    index: int
+    """Position of the record in the input."""
+
+    path: pathlib.Path
+    """Path of the saved deck."""
+
+    seconds: float
+    """Time spent building and saving the deck."""
+
+
+def render(
+    slide_master: type[GenericTpptSlideMaster],
+    recipe: Recipe[GenericTpptSlideMaster, Record],
+    records: Iterable[Record],
+    out_dir: FilePath,
+    *,
+    workers: int | None = None,
+    filename: str | Callable[[int, Record], str] = "{index}.pptx",
+    template_snapshot: FilePath | None = None,
+) -> list[RenderResult]:
+    """Render one deck per record and save them into `out_dir`.
+
+    The recipe receives a fresh builder and a record, and returns the builder.
+    With more than one worker the decks are built in a process pool,
+    so the recipe, the slide master and the records must be picklable.
+    Each worker parses the template once and reuses it for all of its records,
+    or loads it from `template_snapshot`,
+    written by `tppt.template.snapshot.dump_template_snapshot`.
+    """
+    out_dir = pathlib.Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    jobs = (
+        (index, record, out_dir / _make_filename(filename, index, record))
+        for index, record in enumerate(records)
+    )
+
+    if workers <= 1:
+        if template_snapshot is not None:
+            _warm_template(slide_master, template_snapshot)
+        return [
+            RenderResult(index, path, _render_one(slide_master, recipe, record, path))
+            for index, record, path in jobs
+        ]
+
+    results: list[RenderResult] = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_warm_template,
+        initargs=(slide_master, template_snapshot),
+    ) as executor:
+        pending: dict[Future[float], tuple[int, pathlib.Path]] = {}
+        for index, record, path in jobs:
+            # Keep the number of in-flight records bounded,
+            # so that the record iterable is consumed as a stream.
+            if len(pending) >= workers * 2:
+                results.extend(_collect(pending))
+
+            future = executor.submit(_render_one, slide_master, recipe, record, path)
+            pending[future] = (index, path)
+
+        while pending:
+            results.extend(_collect(pending))
+
+    return sorted(results, key=lambda result: result.index)
+
+
+def _make_filename(
+    filename: str | Callable[[int, Record], str], index: int, record: Record
+) -> str:
+    if isinstance(filename, str):
+        return filename.format(index=index)
+
+    return filename(index, record)
+
+
+def _collect(
+    pending: dict[Future[float], tuple[int, pathlib.Path]],
+) -> list[RenderResult]:
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    results = []
+    for future in done:
+        index, path = pending.pop(future)
+        results.append(RenderResult(index, path, future.result()))
+
+    return results
+
+
+def _warm_template(
+    slide_master: type[GenericTpptSlideMaster],
+    template_snapshot: FilePath | None = None,
+) -> None:
+    from tppt.template.cache import template_cache
+
+    if template_snapshot is not None:
+        from tppt.template.snapshot import load_template_snapshot
+
+        load_template_snapshot(template_snapshot)
+
+    template_cache.get(slide_master.__slide_master_source__ or "default")
+
+
+def _render_one(
+    slide_master: type[GenericTpptSlideMaster],
+    recipe: Recipe[GenericTpptSlideMaster, Record],
+    record: Record,
+    path: pathlib.Path,
+) -> float:
+    start = time.perf_counter()
+    recipe(PresentationBuilder(slide_master), record).save(path)
+
+    return time.perf_counter() - start
@@ -112,3 +112,85 @@ class InvalidColorValueError(TpptException, ValueError):
     @property
     def message(self) -> str:
         return f"Invalid {self.type} value: {self.value}. It must be between 0 and 255."
+
+
+class TableColumnNotFoundError(TpptException, KeyError):
+    """Table column not found."""
+
+    def __init__(self, column: str, columns: list[str]) -> None:
+        self.column = column
+        self.columns = columns
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Table column {self.column!r} not found. Available columns: {self.columns}"
+        )
+
+
+class TableStreamInRunningLoopError(TpptException, RuntimeError):
+    """Async table rows are read while an event loop is running."""
+
+    @property
+    def message(self) -> str:
+        return (
+            "Async table rows cannot be read while an event loop is running"
+            " in this thread. Build the presentation with `abuild` or `asave`,"
+            " and do not paginate tables of async rows."
+        )
+
+
+class MediaFileChangedError(TpptException, RuntimeError):
+    """A media file changed after it was added to the presentation."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    @property
+    def message(self) -> str:
+        return (
+            f"The media file {self.path!r} changed after it was added"
+            " to the presentation."
+        )
+
+
+class SlotValueMissingError(TpptException, KeyError):
+    """No value is given for a slot of a compiled slide recipe."""
+
+    def __init__(self, slot: str) -> None:
+        self.slot = slot
+
+    @property
+    def message(self) -> str:
+        return f"No value is given for the slot {self.slot!r} of the slide recipe."
+
+
+class SlotNotFoundError(TpptException, KeyError):
+    """A value is given for a slot that the compiled slide recipe does not use."""
+
+    def __init__(self, slot: str, slots: list[str]) -> None:
+        self.slot = slot
+        self.slots = slots
+
+    @property
+    def message(self) -> str:
+        return (
+            f"The slide recipe has no slot {self.slot!r}. Available slots: {self.slots}"
+        )
+
+
+class TemplateSnapshotVersionError(TpptException, ValueError):
+    """The template snapshot was written by another version of tppt or python-pptx."""
+
+    def __init__(
+        self, versions: tuple[int, str] | None, expected: tuple[int, str]
+    ) -> None:
+        self.versions = versions
+        self.expected = expected
+
+    @property
+    def message(self) -> str:
+        if self.versions is None:
+            return "The file is not a template snapshot."
+
+        return f"The template snapshot has the versions {self.versions}, expected {self.expected}."
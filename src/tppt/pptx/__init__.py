@@ -13,3 +13,4 @@ from .slide import Slide as Slide
 from .table import Table as Table
 from .table import TableBorderStyle as TableBorderStyle
 from .table import TableCellStyle as TableCellStyle
+from .table import TableStyleRule as TableStyleRule
@@ -0,0 +1,109 @@
+"""Saving of presentations from asyncio code.
+
+The package is serialized and compressed in an executor,
+and its bytes are handed over to the event loop in chunks,
+which writes them to the async stream.
+"""
+
+import asyncio
+import inspect
+import os
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from typing import IO, Any, Protocol, TypeGuard
+
+CHUNK_SIZE = 64 * 1024
+"""Size of the chunks written to async streams."""
+
+# Chunks waiting for the event loop, before the executor waits for it.
+_MAX_PENDING_CHUNKS = 16
+
+
+class AsyncWritable(Protocol):
+    """Async stream, e.g. `aiohttp.web.StreamResponse` or an aiofiles file."""
+
+    def write(self, data: bytes, /) -> Awaitable[Any]: ...
+
+
+def is_async_writable(file: object) -> TypeGuard[AsyncWritable]:
+    """Whether the file is an async stream rather than a path or a binary stream."""
+    if isinstance(file, str | os.PathLike):
+        return False
+
+    return isinstance(file, asyncio.StreamWriter) or inspect.iscoroutinefunction(
+        getattr(file, "write", None)
+    )
+
+
+async def write_async(
+    save: Callable[[IO[bytes]], None],
+    stream: AsyncWritable,
+    executor: Executor | None = None,
+) -> None:
+    """Run `save` in the executor, writing its output to the async stream.
+
+    The output cannot seek, so the zip is written with data descriptors.
+    When the stream fails, `save` is stopped at its next write.
+    """
+    loop = asyncio.get_running_loop()
+    pipe = _ChunkPipe(loop)
+
+    def run() -> None:
+        try:
+            save(pipe)  # type: ignore[arg-type]
+            pipe.flush()
+        finally:
+            pipe.close()
+
+    future = loop.run_in_executor(executor, run)
+    try:
+        while (chunk := await pipe.queue.get()) is not None:
+            await _write(stream, chunk)
+    except BaseException:
+        pipe.aborted = True
+        # Unblock the executor, which stops at its next write.
+        while await pipe.queue.get() is not None:
+            pass
+        await asyncio.gather(future, return_exceptions=True)
+        raise
+
+    await future
+
+
+async def _write(stream: AsyncWritable, chunk: bytes) -> None:
+    if isinstance(stream, asyncio.StreamWriter):
+        stream.write(chunk)
+        await stream.drain()
+    else:
+        await stream.write(chunk)
+
+
+class _ChunkPipe:
+    """Write-only binary stream that passes chunks to the event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.queue: asyncio.Queue[bytes | None] = asyncio.Queue(_MAX_PENDING_CHUNKS)
+        self.aborted = False
+        self._loop = loop
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        if self.aborted:
+            raise BrokenPipeError("The async stream was closed by an error.")
+
+        self._buffer += data
+        if len(self._buffer) >= CHUNK_SIZE:
+            self.flush()
+
+        return len(data)
+
+    def flush(self) -> None:
+        if self._buffer and not self.aborted:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+
+    def close(self) -> None:
+        self._put(None)
+
+    def _put(self, chunk: bytes | None) -> None:
+        asyncio.run_coroutine_threadsafe(self.queue.put(chunk), self._loop).result()
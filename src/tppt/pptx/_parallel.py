@@ -0,0 +1,64 @@
+"""Building of slides in a process pool.
+
+Each worker builds a chunk of slide recipes against its own copy of the template,
+and returns the slides as payloads to be imported into the deck in order.
+"""
+
+import math
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from tppt.template.slide_master import GenericTpptSlideMaster
+
+if TYPE_CHECKING:
+    from ._slide_copy import SlidePayload
+
+SlideRecipe = Callable[[type[GenericTpptSlideMaster]], Any]
+
+# Chunks per worker, to balance recipes of uneven cost.
+_CHUNKS_PER_WORKER = 4
+
+
+def build_slides(
+    slide_master: type[GenericTpptSlideMaster],
+    recipes: Sequence[SlideRecipe[GenericTpptSlideMaster]],
+    workers: int,
+) -> Iterator[list["SlidePayload"]]:
+    """Build the slides of the recipes in a process pool, chunk by chunk in order."""
+    chunk_size = max(1, math.ceil(len(recipes) / (workers * _CHUNKS_PER_WORKER)))
+    chunks = [
+        recipes[start : start + chunk_size]
+        for start in range(0, len(recipes), chunk_size)
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        initializer=_warm_template,
+        initargs=(slide_master,),
+    ) as executor:
+        yield from executor.map(_build_chunk, [slide_master] * len(chunks), chunks)
+
+
+def _warm_template(slide_master: type[GenericTpptSlideMaster]) -> None:
+    from tppt.template.cache import template_cache
+
+    template_cache.get(slide_master.__slide_master_source__ or "default")
+
+
+def _build_chunk(
+    slide_master: type[GenericTpptSlideMaster],
+    recipes: Sequence[SlideRecipe[GenericTpptSlideMaster]],
+) -> list["SlidePayload"]:
+    from ._slide_copy import export_slide
+    from .image_cache import image_cache
+    from .presentation import PresentationBuilder
+
+    # NOTE: Images repeated across the chunks of a worker are loaded once.
+    builder = PresentationBuilder(slide_master).image_cache(image_cache)
+    slides = builder._pptx.slides
+    start = len(slides)
+    for recipe in recipes:
+        builder.slide(recipe)
+
+    return [export_slide(slides[index].part) for index in range(start, len(slides))]
@@ -0,0 +1,49 @@
+"""Allocation of shape ids for slides with many shapes.
+
+python-pptx numbers a new shape by scanning every id of the slide,
+so adding many shapes to a slide takes quadratic time.
+The allocator scans the slide once and counts up from there,
+through the cached shape id of python-pptx's turbo-add mode.
+"""
+
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from pptx.shapes.shapetree import SlideShapes as PptxSlideShapes
+
+
+class ShapeIdAllocator:
+    """Shape ids of a slide, counted up from the largest id of the slide.
+
+    The ids are allocated to the shapes that python-pptx adds
+    to the slide while the allocator is entered.
+    """
+
+    def __init__(self, shapes: "PptxSlideShapes") -> None:
+        self._shapes = shapes
+        self._previous: int | None = None
+
+    def __enter__(self) -> Self:
+        self._previous = self._shapes._cached_max_shape_id
+        self._shapes._cached_max_shape_id = self._shapes._spTree.max_shape_id
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        # Keep counting when turbo-add mode was already enabled.
+        if self._previous is None:
+            self._shapes._cached_max_shape_id = None
+
+
+def reseed_shape_ids(shapes: "PptxSlideShapes") -> None:
+    """Count up from the largest id of the slide again, if an allocator is entered.
+
+    Needed after shapes are added without python-pptx, e.g. as raw XML.
+    """
+    if shapes._cached_max_shape_id is not None:
+        shapes._cached_max_shape_id = shapes._spTree.max_shape_id
@@ -0,0 +1,265 @@
+"""Copy of slides between packages.
+
+A slide is exported as a picklable payload of its own parts,
+e.g. the slide, its notes, charts and images,
+and imported into another package as new parts.
+Parts shared with the rest of the deck, i.e. the slide layout and the notes master,
+are not copied but resolved in the destination package.
+"""
+
+import hashlib
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
+
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import PartFactory, _Relationship
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import ImagePart as PptxImagePart
+from pptx.parts.media import MediaPart as PptxMediaPart
+
+if TYPE_CHECKING:
+    from pptx.opc.package import Part as PptxPart
+    from pptx.package import Package as PptxPackage
+    from pptx.parts.presentation import PresentationPart as PptxPresentationPart
+    from pptx.parts.slide import SlideLayoutPart as PptxSlideLayoutPart
+    from pptx.parts.slide import SlidePart as PptxSlidePart
+
+
+@dataclass(frozen=True)
+class LayoutRef:
+    """Slide layout of a copied slide, resolved by name and then by position."""
+
+    name: str
+
+    index: int
+
+
+@dataclass(frozen=True)
+class NotesMasterRef:
+    """Notes master of the destination package."""
+
+
+@dataclass(frozen=True)
+class SlideRef:
+    """Another slide of the source deck, e.g. the target of a hyperlink."""
+
+    partname: str
+
+
+RelTarget = int | str | LayoutRef | NotesMasterRef | SlideRef
+"""Index of a copied part, an external URL, or a part of the destination deck."""
+
+
+@dataclass(frozen=True)
+class RelPayload:
+    """Relationship of a copied part."""
+
+    r_id: str
+
+    reltype: str
+
+    target: RelTarget
+
+    is_external: bool = False
+
+
+@dataclass(frozen=True)
+class PartPayload:
+    """Copied part with its relationships."""
+
+    partname: str
+
+    content_type: str
+
+    blob: bytes
+
+    rels: tuple[RelPayload, ...]
+
+
+@dataclass(frozen=True)
+class SlidePayload:
+    """Parts of a slide. The first part is the slide itself."""
+
+    parts: tuple[PartPayload, ...]
+
+    @property
+    def partname(self) -> str:
+        """Partname of the slide in the source package."""
+        return self.parts[0].partname
+
+
+def export_slide(slide_part: "PptxSlidePart") -> SlidePayload:
+    """Export the slide and the parts it owns."""
+    parts: list[PartPayload | None] = []
+    indices: dict[PptxPart, int] = {}
+
+    def visit(part: "PptxPart") -> int:
+        index = indices[part] = len(parts)
+        parts.append(None)
+
+        rels: list[RelPayload] = []
+        for r_id, rel in part.rels.items():
+            target: RelTarget
+            if rel.is_external:
+                target = rel.target_ref
+            elif rel.target_part in indices:
+                target = indices[rel.target_part]
+            elif rel.reltype == RT.SLIDE_LAYOUT:
+                target = _layout_ref(cast("PptxSlideLayoutPart", rel.target_part))
+            elif rel.reltype == RT.NOTES_MASTER:
+                target = NotesMasterRef()
+            elif rel.reltype == RT.SLIDE:
+                target = SlideRef(str(rel.target_part.partname))
+            else:
+                target = visit(rel.target_part)
+
+            rels.append(RelPayload(r_id, rel.reltype, target, rel.is_external))
+
+        parts[index] = PartPayload(
+            str(part.partname), part.content_type, part.blob, tuple(rels)
+        )
+        return index
+
+    visit(slide_part)
+
+    return SlidePayload(tuple(cast(list[PartPayload], parts)))
+
+
+def import_slide(
+    presentation_part: "PptxPresentationPart",
+    payload: SlidePayload,
+    slides: Mapping[str, "PptxSlidePart"] | None = None,
+    binaries: dict[bytes, "PptxPart"] | None = None,
+) -> "PptxSlidePart":
+    """Append the exported slide to the presentation.
+
+    Images and media are shared with the parts of the same bytes in the package.
+    Links to other slides are resolved through `slides`,
+    which maps the partnames of the source deck to the slides of this deck,
+    and fall back to the imported slide itself.
+    `binaries` remembers the shared parts by their bytes,
+    so that the bytes repeated across slides are hashed once.
+    """
+    package = presentation_part.package
+    sld_id_lst = presentation_part._element.get_or_add_sldIdLst()
+    imported: dict[int, PptxPart] = {}
+    # Partnames of the package, read once for the parts of the slide.
+    used: set[str] = set()
+
+    def load(index: int) -> "PptxPart":
+        if (part := imported.get(index)) is not None:
+            return part
+
+        part_payload = payload.parts[index]
+        if index == 0:
+            # NOTE: The slides are numbered in order, as python-pptx does
+            #       when they are listed, so that the next slide number is free.
+            presentation_part.rename_slide_parts(
+                [sld_id.rId for sld_id in sld_id_lst.sldId_lst]
+            )
+            partname = presentation_part._next_slide_partname
+        else:
+            if (shared := (binaries or {}).get(part_payload.blob)) is None:
+                shared = _find_binary_part(package, part_payload)
+            if shared is not None:
+                imported[index] = shared
+                if binaries is not None:
+                    binaries[part_payload.blob] = shared
+                return shared
+
+            if not used:
+                used.update(str(part.partname) for part in package.iter_parts())
+            partname = _next_partname(used, part_payload.partname)
+            used.add(partname)
+
+        part = imported[index] = PartFactory(
+            PackURI(partname), part_payload.content_type, package, part_payload.blob
+        )
+        if binaries is not None and isinstance(part, PptxImagePart | PptxMediaPart):
+            binaries[part_payload.blob] = part
+        for rel in part_payload.rels:
+            if rel.is_external:
+                _add_rel(part, rel, cast(str, rel.target))
+            else:
+                _add_rel(part, rel, resolve(rel.target))
+
+        return part
+
+    def resolve(target: RelTarget) -> "PptxPart":
+        match target:
+            case int():
+                return load(target)
+            case LayoutRef():
+                return _find_layout(presentation_part, target)
+            case NotesMasterRef():
+                return presentation_part.notes_master_part
+            case SlideRef():
+                return (slides or {}).get(target.partname) or load(0)
+            case _:
+                raise TypeError(target)
+
+    slide_part = cast("PptxSlidePart", load(0))
+    r_id = presentation_part.relate_to(slide_part, RT.SLIDE)
+    sld_id_lst.add_sldId(r_id)
+
+    return slide_part
+
+
+def _layout_ref(layout_part: "PptxSlideLayoutPart") -> LayoutRef:
+    slide_layout = layout_part.slide_layout
+    slide_layouts = layout_part.slide_master.slide_layouts
+
+    return LayoutRef(slide_layout.name, slide_layouts.index(slide_layout))
+
+
+def _find_layout(
+    presentation_part: "PptxPresentationPart", ref: LayoutRef
+) -> "PptxSlideLayoutPart":
+    slide_layouts = presentation_part.presentation.slide_masters[0].slide_layouts
+    if (slide_layout := slide_layouts.get_by_name(ref.name)) is None:
+        slide_layout = slide_layouts[ref.index if ref.index < len(slide_layouts) else 0]
+
+    return slide_layout.part
+
+
+def _find_binary_part(
+    package: "PptxPackage", part_payload: PartPayload
+) -> "PptxPart | None":
+    part_cls = PartFactory._part_cls_for(part_payload.content_type)
+    if part_cls is PptxImagePart:
+        from .image_cache import find_image_part
+
+        return find_image_part(package, hashlib.sha1(part_payload.blob).hexdigest())
+    if part_cls is PptxMediaPart:
+        return package._media_parts._find_by_sha1(
+            hashlib.sha1(part_payload.blob).hexdigest()
+        )
+
+    return None
+
+
+def _next_partname(used: set[str], partname: str) -> str:
+    """Get a free partname numbered like the partname of the source package."""
+    template = re.sub(r"\d*(\.\w+)$", r"%d\1", partname.replace("%", "%%"))
+
+    return next(
+        candidate
+        for n in range(1, len(used) + 2)
+        if (candidate := template % n) not in used
+    )
+
+
+def _add_rel(part: "PptxPart", rel: RelPayload, target: "PptxPart | str") -> None:
+    # NOTE: The part is new, so the relationship ids of the source are all free
+    #       and the XML referring to them is kept as is.
+    rels = part.rels
+    rels._rels[rel.r_id] = _Relationship(
+        rels._base_uri,
+        rel.r_id,
+        rel.reltype,
+        RTM.EXTERNAL if rel.is_external else RTM.INTERNAL,
+        target,
+    )
@@ -0,0 +1,149 @@
+"""Source archives of loaded packages, to copy their untouched parts on save.
+
+A part is dirty once a tppt wrapper is created for one of its objects,
+since the wrapper may change its XML, and stays dirty after the package is saved,
+since the wrapper may still be held and change it again.
+Clean parts are copied from the source archive entry by entry.
+"""
+
+import os
+import weakref
+import zipfile
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from pptx.opc.package import Part as PptxPart
+    from pptx.package import Package as PptxPackage
+
+    from .package_writer import CompressionPolicy
+
+
+class SourceEntry(NamedTuple):
+    """Zip entry of a part in the source archive."""
+
+    info: zipfile.ZipInfo
+    """Zip entry of the part."""
+
+    blob: bytes | None
+    """Bytes of a binary part when it was loaded, to detect replaced bytes."""
+
+
+class PackageSource:
+    """Source archive of a package, with the entries of its clean parts."""
+
+    def __init__(
+        self,
+        package: "PptxPackage",
+        path: str,
+        compression: "CompressionPolicy | None" = None,
+    ) -> None:
+        from pptx.opc.package import XmlPart
+
+        self.path = os.path.abspath(path)
+        """Path of the source archive."""
+
+        self.compression = compression
+        """Policy all entries of the archive were compressed by, if known.
+
+        Zip entries do not record their deflate level.
+        """
+
+        stat = os.stat(self.path)
+        self._fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+        with zipfile.ZipFile(self.path) as zip_file:
+            infos = {info.filename: info for info in zip_file.infolist()}
+
+        self.entries: dict[PptxPart, SourceEntry] = {}
+        """Entries of the parts that are not dirty."""
+
+        for part in package.iter_parts():
+            if (info := infos.get(part.partname.membername)) is not None:
+                blob = None if isinstance(part, XmlPart) else part._blob
+                self.entries[part] = SourceEntry(info, blob)
+
+    def is_current(self) -> bool:
+        """Whether the source archive is unchanged since it was loaded."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+
+        return (stat.st_mtime_ns, stat.st_size) == self._fingerprint
+
+    def clean_entry(self, part: "PptxPart") -> zipfile.ZipInfo | None:
+        """Get the source entry of the part, if the part is unchanged."""
+        if (entry := self.entries.get(part)) is None:
+            return None
+        if entry.blob is not None and part._blob is not entry.blob:
+            return None
+
+        return entry.info
+
+    def is_compressed_as(
+        self, info: zipfile.ZipInfo, content_type: str, compression: "CompressionPolicy"
+    ) -> bool:
+        """Whether the entry is compressed as the policy compresses the content type."""
+        method, level = compression.compression_for(content_type)
+        if info.compress_type != method:
+            return False
+        if method == zipfile.ZIP_STORED:
+            return True
+
+        return (
+            self.compression is not None
+            and self.compression.compression_for(content_type)[1] == level
+        )
+
+
+_sources: "weakref.WeakKeyDictionary[PptxPackage, PackageSource]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def track_source(
+    package: "PptxPackage",
+    path: str,
+    compression: "CompressionPolicy | None" = None,
+    previous: PackageSource | None = None,
+) -> None:
+    """Remember the archive the package was loaded from or saved to.
+
+    A package saved from the `previous` source archive keeps its dirty parts.
+    """
+    source = PackageSource(package, path, compression)
+    if previous is not None:
+        source.entries = {
+            part: entry
+            for part, entry in source.entries.items()
+            if part in previous.entries
+        }
+
+    _sources[package] = source
+
+
+def get_source(package: "PptxPackage") -> PackageSource | None:
+    """Get the source archive of the package, if it is still unchanged."""
+    if (source := _sources.get(package)) is None:
+        return None
+    if not source.is_current():
+        del _sources[package]
+        return None
+
+    return source
+
+
+def mark_dirty(pptx_obj: Any) -> None:
+    """Mark the part of a python-pptx object, or the part itself, as changed."""
+    if not _sources:
+        return
+
+    part = getattr(pptx_obj, "part", pptx_obj)
+    package = getattr(part, "package", None)
+    if package is not None and (source := _sources.get(package)) is not None:
+        source.entries.pop(part, None)
+
+
+def mark_all_dirty(package: "PptxPackage") -> None:
+    """Mark all parts of the package as changed."""
+    _sources.pop(package, None)
@@ -0,0 +1,608 @@
+"""Node tree of a presentation read from the XML of its parts.
+
+Produces the same dictionaries as the python-pptx walker of `tppt.pptx.tree`,
+without building a proxy object per shape, run and table cell.
+The values inherited by placeholders are resolved once per layout and master.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from lxml import etree
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
+from pptx.enum.text import MSO_UNDERLINE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.oxml.simpletypes import ST_Angle, ST_Coordinate, ST_Percentage
+from pptx.util import Centipoints
+
+if TYPE_CHECKING:
+    from pptx.opc.package import Part as PptxPart
+    from pptx.presentation import Presentation as PptxPresentation
+
+_EMUS_PER_PT = 12700.0
+
+_SP = qn("p:sp")
+_GRP_SP = qn("p:grpSp")
+_GRAPHIC_FRAME = qn("p:graphicFrame")
+_CXN_SP = qn("p:cxnSp")
+_PIC = qn("p:pic")
+_SHAPE_TAGS = frozenset(
+    (_SP, _GRP_SP, _GRAPHIC_FRAME, _CXN_SP, _PIC, qn("p:contentPart"))
+)
+
+_C_NV_SP_PR = qn("p:cNvSpPr")
+_GRP_SP_PR = qn("p:grpSpPr")
+_NV_SP_PR = qn("p:nvSpPr")
+_SP_PR = qn("p:spPr")
+_TX_BODY = qn("p:txBody")
+_XFRM = qn("p:xfrm")
+
+_A_P = qn("a:p")
+_A_R = qn("a:r")
+_A_BR = qn("a:br")
+_A_FLD = qn("a:fld")
+_A_T = qn("a:t")
+_A_CUST_GEOM = qn("a:custGeom")
+_A_EXT = qn("a:ext")
+_A_GRID_COL = qn("a:gridCol")
+_A_LATIN = qn("a:latin")
+_A_LUM_MOD = qn("a:lumMod")
+_A_LUM_OFF = qn("a:lumOff")
+_A_OFF = qn("a:off")
+_A_PRST_GEOM = qn("a:prstGeom")
+_A_P_PR = qn("a:pPr")
+_A_R_PR = qn("a:rPr")
+_A_SCHEME_CLR = qn("a:schemeClr")
+_A_SRGB_CLR = qn("a:srgbClr")
+_A_TBL = qn("a:tbl")
+_A_TBL_GRID = qn("a:tblGrid")
+_A_TC = qn("a:tc")
+_A_TR = qn("a:tr")
+_A_TX_BODY = qn("a:txBody")
+_A_XFRM = qn("a:xfrm")
+
+_XPATH_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+}
+_PH = etree.XPath("./*[1]/p:nvPr/p:ph", namespaces=_XPATH_NS)
+_C_NV_PR = etree.XPath("./*[1]/p:cNvPr", namespaces=_XPATH_NS)
+_VIDEO_FILE = etree.XPath("./p:nvPicPr/p:nvPr/a:videoFile", namespaces=_XPATH_NS)
+_GRAPHIC_DATA = etree.XPath("./a:graphic/a:graphicData", namespaces=_XPATH_NS)
+_SP_TREE = etree.XPath("./p:cSld/p:spTree", namespaces=_XPATH_NS)
+
+_GRAPHIC_DATA_URI_CHART = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+_GRAPHIC_DATA_URI_OLEOBJ = "http://schemas.openxmlformats.org/presentationml/2006/ole"
+_GRAPHIC_DATA_URI_TABLE = "http://schemas.openxmlformats.org/drawingml/2006/table"
+
+_A_SOLID_FILL = qn("a:solidFill")
+_FILL_TAGS = frozenset(
+    qn(tag)
+    for tag in (
+        "a:noFill",
+        "a:solidFill",
+        "a:gradFill",
+        "a:blipFill",
+        "a:pattFill",
+        "a:grpFill",
+    )
+)
+_COLOR_TAGS = frozenset(
+    qn(tag)
+    for tag in (
+        "a:scrgbClr",
+        "a:srgbClr",
+        "a:hslClr",
+        "a:sysClr",
+        "a:schemeClr",
+        "a:prstClr",
+    )
+)
+
+# Master placeholder type that a layout placeholder inherits its position from.
+_LAYOUT_BASE_TYPES = {
+    PP_PLACEHOLDER.BODY: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.CHART: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.BITMAP: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.CENTER_TITLE: PP_PLACEHOLDER.TITLE,
+    PP_PLACEHOLDER.ORG_CHART: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.DATE: PP_PLACEHOLDER.DATE,
+    PP_PLACEHOLDER.FOOTER: PP_PLACEHOLDER.FOOTER,
+    PP_PLACEHOLDER.MEDIA_CLIP: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.OBJECT: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.PICTURE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.SLIDE_NUMBER: PP_PLACEHOLDER.SLIDE_NUMBER,
+    PP_PLACEHOLDER.SUBTITLE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.TABLE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.TITLE: PP_PLACEHOLDER.TITLE,
+}
+
+Box = tuple[float | None, float | None, float | None, float | None]
+"""Left, top, width and height in points."""
+
+_NO_BOX: Box = (None, None, None, None)
+
+
+def ppt2tree_xml(ppt: "PptxPresentation") -> dict[str, Any]:
+    """Convert presentation information to dictionary, reading the XML directly.
+
+    Like the python-pptx walker, a slide without notes gets an empty notes slide,
+    and the presentation gets a notes master if it has none.
+    """
+    return _TreeReader().presentation(ppt)
+
+
+class _TreeReader:
+    """Reader of one presentation, with the placeholders of its layouts and masters."""
+
+    def __init__(self) -> None:
+        self._layout_boxes: dict[PptxPart, dict[int, Box]] = {}
+        self._master_boxes: dict[PptxPart, dict[PP_PLACEHOLDER, Box]] = {}
+        self._partnames: set[str] | None = None
+
+    def presentation(self, ppt: "PptxPresentation") -> dict[str, Any]:
+        presentation_part = ppt.part
+        element = presentation_part._element
+
+        slide_width = slide_height = None
+        if (sld_sz := element.sldSz) is not None:
+            slide_width = _pt(sld_sz.get("cx")) or None
+            slide_height = _pt(sld_sz.get("cy")) or None
+
+        sld_ids = [] if element.sldIdLst is None else element.sldIdLst.sldId_lst
+        master_parts = [
+            presentation_part.related_part(sld_master_id.rId)
+            for sld_master_id in (
+                []
+                if element.sldMasterIdLst is None
+                else element.sldMasterIdLst.sldMasterId_lst
+            )
+        ]
+
+        prs_data = {
+            "slides_count": len(sld_ids),
+            "slide_masters_count": len(master_parts),
+            "slide_layouts_count": len(_layout_parts(master_parts[0])),
+            "slide_width": slide_width,
+            "slide_height": slide_height,
+            "slides": [
+                self.slide(presentation_part.related_part(sld_id.rId), sld_id.id)
+                for sld_id in sld_ids
+            ],
+            "slide_masters": [self.slide_master(part) for part in master_parts],
+        }
+
+        notes_master_part = presentation_part.notes_master_part
+        prs_data["notes_master"] = {
+            "shapes": self.shapes(notes_master_part, "master"),
+            "placeholders": self.placeholders(notes_master_part, "master"),
+        }
+
+        return prs_data
+
+    def slide(self, slide_part: "PptxPart", slide_id: int) -> dict[str, Any]:
+        layout_part = slide_part.part_related_by(RT.SLIDE_LAYOUT)
+        slide_data = {
+            "slide_id": slide_id,
+            "slide_layout_name": _name(layout_part),
+            "shapes": self.shapes(slide_part, "slide"),
+            "placeholders": self.placeholders(slide_part, "slide"),
+        }
+
+        try:
+            notes_part = slide_part.part_related_by(RT.NOTES_SLIDE)
+        except KeyError:
+            notes_part = self._add_notes_slide_part(slide_part)
+        slide_data["notes_slide"] = {
+            "shapes": self.shapes(notes_part, "notes"),
+            "placeholders": self.placeholders(notes_part, "notes"),
+        }
+
+        return slide_data
+
+    def _add_notes_slide_part(self, slide_part: "PptxPart") -> "PptxPart":
+        """Add an empty notes slide to the slide, as `SlidePart.notes_slide` does.
+
+        The partnames of the package are collected once, since python-pptx
+        walks the whole package to number each new notes slide.
+        """
+        from pptx.opc.constants import CONTENT_TYPE as CT
+        from pptx.opc.packuri import PackURI
+        from pptx.oxml.slide import CT_NotesSlide
+        from pptx.parts.slide import NotesSlidePart
+
+        from ._slide_copy import _next_partname
+
+        package = slide_part.package
+        if self._partnames is None:
+            self._partnames = {str(part.partname) for part in package.iter_parts()}
+        partname = _next_partname(self._partnames, "/ppt/notesSlides/notesSlide1.xml")
+        self._partnames.add(partname)
+
+        notes_master_part = package.presentation_part.notes_master_part
+        notes_part = NotesSlidePart(
+            PackURI(partname), CT.PML_NOTES_SLIDE, package, CT_NotesSlide.new()
+        )
+        notes_part.relate_to(notes_master_part, RT.NOTES_MASTER)
+        notes_part.relate_to(slide_part, RT.SLIDE)
+        notes_part.notes_slide.clone_master_placeholders(notes_master_part.notes_master)
+        slide_part.relate_to(notes_part, RT.NOTES_SLIDE)
+
+        return notes_part
+
+    def slide_master(self, master_part: "PptxPart") -> dict[str, Any]:
+        return {
+            "shapes": self.shapes(master_part, "master"),
+            "placeholders": self.placeholders(master_part, "master"),
+            "slide_layouts": [
+                {
+                    "name": _name(layout_part),
+                    "shapes": self.shapes(layout_part, "layout"),
+                    "placeholders": self.placeholders(layout_part, "layout"),
+                }
+                for layout_part in _layout_parts(master_part)
+            ],
+        }
+
+    def shapes(self, part: "PptxPart", kind: str) -> list[dict[str, Any]]:
+        return [self.shape(elm, part, kind) for elm in _iter_shape_elms(_sp_tree(part))]
+
+    def placeholders(self, part: "PptxPart", kind: str) -> list[dict[str, Any]]:
+        elms = [elm for elm in _iter_shape_elms(_sp_tree(part)) if _ph(elm) is not None]
+        if kind == "slide":
+            elms.sort(key=lambda elm: _ph_idx(_ph(elm)))
+
+        placeholders = []
+        for elm in elms:
+            placeholder_data = self.shape(elm, part, kind)
+            ph = _ph(elm)
+            placeholder_data["placeholder_type"] = _ph_type(ph)
+            placeholder_data["placeholder_idx"] = _ph_idx(ph)
+            placeholders.append(placeholder_data)
+
+        return placeholders
+
+    def shape(self, elm: Any, part: "PptxPart", kind: str) -> dict[str, Any]:
+        """Convert the shape element to dictionary.
+
+        `kind` is the collection of the shape, which decides the placeholders
+        that inherit their position: "slide", "layout", "notes", "master" or "group".
+        """
+        tag = elm.tag
+        ph = _ph(elm)
+        c_nv_pr = _C_NV_PR(elm)[0]
+
+        graphic_data_uri = None
+        if tag == _GRAPHIC_FRAME:
+            graphic_data_uri = _GRAPHIC_DATA(elm)[0].get("uri")
+
+        if ph is not None and tag == _PIC and kind == "slide":
+            shape_type = MSO_SHAPE_TYPE.PLACEHOLDER
+        else:
+            shape_type = _shape_type(elm, tag, ph, graphic_data_uri)
+
+        left, top, width, height = _box(elm, tag)
+        if ph is not None and None in (left, top, width, height):
+            base = self._base_box(elm, tag, ph, part, kind)
+            left = base[0] if left is None else left
+            top = base[1] if top is None else top
+            width = base[2] if width is None else width
+            height = base[3] if height is None else height
+
+        shape_data: dict[str, Any] = {
+            "name": c_nv_pr.get("name"),
+            "shape_id": int(c_nv_pr.get("id")),
+            "shape_type": str(shape_type),
+            "has_text_frame": tag == _SP,
+            "has_table": graphic_data_uri == _GRAPHIC_DATA_URI_TABLE,
+            "has_chart": graphic_data_uri == _GRAPHIC_DATA_URI_CHART,
+            "width": width,
+            "height": height,
+            "rotation": _rotation(elm, tag),
+            "left": left,
+            "top": top,
+        }
+
+        if shape_type == MSO_SHAPE_TYPE.PLACEHOLDER:
+            assert ph is not None
+            shape_data["placeholder_type"] = _ph_type(ph)
+            shape_data["placeholder_idx"] = _ph_idx(ph)
+
+        if tag == _SP:
+            shape_data["text_frame"] = _text_frame(elm.find(_TX_BODY))
+
+        if graphic_data_uri == _GRAPHIC_DATA_URI_TABLE:
+            shape_data["table"] = _table(_GRAPHIC_DATA(elm)[0].find(_A_TBL))
+
+        if tag == _GRP_SP:
+            shape_data["shapes"] = [
+                self.shape(child, part, "group") for child in _iter_shape_elms(elm)
+            ]
+
+        return shape_data
+
+    def _base_box(
+        self, elm: Any, tag: str, ph: Any, part: "PptxPart", kind: str
+    ) -> Box:
+        """Position of the placeholder that the placeholder inherits from."""
+        if kind == "slide" and tag in (_SP, _PIC):
+            layout_part = part.part_related_by(RT.SLIDE_LAYOUT)
+            return self._layout_box(layout_part, _ph_idx(ph))
+        if kind == "layout" and tag == _SP:
+            base_type = _LAYOUT_BASE_TYPES.get(_ph_type(ph))
+            if base_type is None:
+                return _NO_BOX
+            return self._master_box(part.part_related_by(RT.SLIDE_MASTER), base_type)
+        if kind == "notes" and tag == _SP:
+            notes_master_part = part.part_related_by(RT.NOTES_MASTER)
+            return self._master_box(notes_master_part, _ph_type(ph))
+
+        return _NO_BOX
+
+    def _layout_box(self, layout_part: "PptxPart", idx: int) -> Box:
+        if (boxes := self._layout_boxes.get(layout_part)) is None:
+            boxes = self._layout_boxes[layout_part] = {}
+            for elm in _iter_shape_elms(_sp_tree(layout_part)):
+                if (ph := _ph(elm)) is None or _ph_idx(ph) in boxes:
+                    continue
+
+                box = _box(elm, elm.tag)
+                if elm.tag == _SP and None in box:
+                    base = self._base_box(elm, elm.tag, ph, layout_part, "layout")
+                    box = _merge_box(box, base)
+                boxes[_ph_idx(ph)] = box
+
+        return boxes.get(idx, _NO_BOX)
+
+    def _master_box(self, master_part: "PptxPart", ph_type: PP_PLACEHOLDER) -> Box:
+        if (boxes := self._master_boxes.get(master_part)) is None:
+            boxes = self._master_boxes[master_part] = {}
+            for elm in _iter_shape_elms(_sp_tree(master_part)):
+                if (ph := _ph(elm)) is not None:
+                    boxes.setdefault(_ph_type(ph), _box(elm, elm.tag))
+
+        return boxes.get(ph_type, _NO_BOX)
+
+
+def _layout_parts(master_part: "PptxPart") -> "list[PptxPart]":
+    sld_layout_id_lst = master_part._element.sldLayoutIdLst
+    if sld_layout_id_lst is None:
+        return []
+
+    return [
+        master_part.related_part(sld_layout_id.rId)
+        for sld_layout_id in sld_layout_id_lst.sldLayoutId_lst
+    ]
+
+
+def _name(part: "PptxPart") -> str:
+    return part._element.cSld.get("name", "")
+
+
+def _sp_tree(part: "PptxPart") -> Any:
+    return _SP_TREE(part._element)[0]
+
+
+def _iter_shape_elms(sp_tree: Any) -> Any:
+    return (elm for elm in sp_tree.iterchildren() if elm.tag in _SHAPE_TAGS)
+
+
+def _ph(elm: Any) -> Any:
+    ph = _PH(elm)
+    return ph[0] if ph else None
+
+
+def _ph_type(ph: Any) -> PP_PLACEHOLDER:
+    if (value := ph.get("type")) is None:
+        return PP_PLACEHOLDER.OBJECT
+
+    return PP_PLACEHOLDER.from_xml(value)
+
+
+def _ph_idx(ph: Any) -> int:
+    return int(ph.get("idx", 0))
+
+
+def _shape_type(
+    elm: Any, tag: str, ph: Any, graphic_data_uri: str | None
+) -> MSO_SHAPE_TYPE | None:
+    if tag == _SP:
+        if ph is not None:
+            return MSO_SHAPE_TYPE.PLACEHOLDER
+
+        sp_pr = elm.find(_SP_PR)
+        if sp_pr is not None and sp_pr.find(_A_CUST_GEOM) is not None:
+            return MSO_SHAPE_TYPE.FREEFORM
+        c_nv_sp_pr = elm.find(_NV_SP_PR).find(_C_NV_SP_PR)
+        is_textbox = c_nv_sp_pr is not None and c_nv_sp_pr.get("txBox") in ("1", "true")
+        if is_textbox:
+            return MSO_SHAPE_TYPE.TEXT_BOX
+        if sp_pr is not None and sp_pr.find(_A_PRST_GEOM) is not None:
+            return MSO_SHAPE_TYPE.AUTO_SHAPE
+        return None
+    if tag == _PIC:
+        return MSO_SHAPE_TYPE.MEDIA if _VIDEO_FILE(elm) else MSO_SHAPE_TYPE.PICTURE
+    if tag == _GRP_SP:
+        return MSO_SHAPE_TYPE.GROUP
+    if tag == _CXN_SP:
+        return MSO_SHAPE_TYPE.LINE
+    if tag == _GRAPHIC_FRAME:
+        if graphic_data_uri == _GRAPHIC_DATA_URI_CHART:
+            return MSO_SHAPE_TYPE.CHART
+        if graphic_data_uri == _GRAPHIC_DATA_URI_TABLE:
+            return MSO_SHAPE_TYPE.TABLE
+        if graphic_data_uri == _GRAPHIC_DATA_URI_OLEOBJ:
+            return (
+                MSO_SHAPE_TYPE.EMBEDDED_OLE_OBJECT
+                if elm.is_embedded_ole_obj
+                else MSO_SHAPE_TYPE.LINKED_OLE_OBJECT
+            )
+
+    return None
+
+
+def _xfrm(elm: Any, tag: str) -> Any:
+    if tag == _GRAPHIC_FRAME:
+        return elm.find(_XFRM)
+
+    shape_properties = elm.find(_GRP_SP_PR if tag == _GRP_SP else _SP_PR)
+    if shape_properties is None:
+        return None
+
+    return shape_properties.find(_A_XFRM)
+
+
+def _box(elm: Any, tag: str) -> Box:
+    if (xfrm := _xfrm(elm, tag)) is None:
+        return _NO_BOX
+
+    left = top = width = height = None
+    if (off := xfrm.find(_A_OFF)) is not None:
+        left, top = _pt(off.get("x")), _pt(off.get("y"))
+    if (ext := xfrm.find(_A_EXT)) is not None:
+        width, height = _pt(ext.get("cx")), _pt(ext.get("cy"))
+
+    return (left, top, width, height)
+
+
+def _merge_box(box: Box, base: Box) -> Box:
+    return (
+        base[0] if box[0] is None else box[0],
+        base[1] if box[1] is None else box[1],
+        base[2] if box[2] is None else box[2],
+        base[3] if box[3] is None else box[3],
+    )
+
+
+def _pt(value: str | None) -> float | None:
+    if value is None:
+        return None
+
+    return ST_Coordinate.convert_from_xml(value) / _EMUS_PER_PT
+
+
+def _rotation(elm: Any, tag: str) -> float:
+    xfrm = _xfrm(elm, tag)
+    if xfrm is None or (rot := xfrm.get("rot")) is None:
+        return 0.0
+
+    return ST_Angle.convert_from_xml(rot)
+
+
+def _text_frame(tx_body: Any) -> dict[str, Any]:
+    if tx_body is None:
+        # NOTE: python-pptx adds a text body of one empty paragraph.
+        return {"text": "", "paragraphs": [{"text": "", "level": 0, "runs": []}]}
+
+    paragraphs = [_paragraph(p) for p in tx_body.iterchildren(_A_P)]
+    return {
+        "text": "\n".join(paragraph["text"] for paragraph in paragraphs),
+        "paragraphs": paragraphs,
+    }
+
+
+def _paragraph(p: Any) -> dict[str, Any]:
+    texts = []
+    runs = []
+    for child in p.iterchildren(_A_R, _A_BR, _A_FLD):
+        if child.tag == _A_BR:
+            texts.append("\v")
+            continue
+
+        t = child.find(_A_T)
+        text = "" if t is None else t.text or ""
+        texts.append(text)
+        if child.tag == _A_R:
+            runs.append({"text": text, "font": _font(child.find(_A_R_PR))})
+
+    p_pr = p.find(_A_P_PR)
+    level = 0 if p_pr is None else int(p_pr.get("lvl", 0))
+
+    return {"text": "".join(texts), "level": level, "runs": runs}
+
+
+def _font(r_pr: Any) -> dict[str, Any]:
+    if r_pr is None:
+        return {"color": {}}
+
+    font_data: dict[str, Any] = {}
+    if (latin := r_pr.find(_A_LATIN)) is not None and (name := latin.get("typeface")):
+        font_data["name"] = name
+    if (size := r_pr.get("sz")) and (size := Centipoints(int(size))):
+        font_data["size"] = size.pt
+    if r_pr.get("b") in ("1", "true"):
+        font_data["bold"] = True
+    if r_pr.get("i") in ("1", "true"):
+        font_data["italic"] = True
+    if (u := r_pr.get("u")) is not None and (underline := _underline(u)):
+        font_data["underline"] = underline
+
+    font_data["color"] = _color(r_pr)
+
+    return font_data
+
+
+def _underline(value: str) -> Any:
+    u = MSO_UNDERLINE.from_xml(value)
+    if u is MSO_UNDERLINE.NONE:
+        return False
+    if u is MSO_UNDERLINE.SINGLE_LINE:
+        return True
+
+    return u
+
+
+def _color(r_pr: Any) -> dict[str, Any]:
+    # NOTE: python-pptx replaces a fill of the run other than a solid fill
+    #       by an empty solid fill before reading its color.
+    fill = next(
+        (child for child in r_pr.iterchildren() if child.tag in _FILL_TAGS), None
+    )
+    if fill is None or fill.tag != _A_SOLID_FILL:
+        return {}
+
+    color = next(
+        (child for child in fill.iterchildren() if child.tag in _COLOR_TAGS), None
+    )
+    if color is None:
+        return {}
+
+    data: dict[str, Any] = {}
+    if color.tag == _A_SRGB_CLR:
+        data["rgb"] = color.get("val").upper()
+    elif color.tag == _A_SCHEME_CLR and (
+        theme_color := MSO_THEME_COLOR.from_xml(color.get("val"))
+    ):
+        data["theme_color"] = str(theme_color)
+
+    if (lum_off := color.find(_A_LUM_OFF)) is not None:
+        brightness = ST_Percentage.convert_from_xml(lum_off.get("val"))
+    elif (lum_mod := color.find(_A_LUM_MOD)) is not None:
+        brightness = ST_Percentage.convert_from_xml(lum_mod.get("val")) - 1.0
+    else:
+        brightness = 0
+    if brightness:
+        data["brightness"] = brightness
+
+    return data
+
+
+def _table(tbl: Any) -> dict[str, Any]:
+    rows = list(tbl.iterchildren(_A_TR))
+    tbl_grid = tbl.find(_A_TBL_GRID)
+    columns = 0 if tbl_grid is None else len(tbl_grid.findall(_A_GRID_COL))
+
+    cells = []
+    for row_idx, tr in enumerate(rows):
+        tcs = tr.findall(_A_TC)
+        for col_idx in range(columns):
+            cells.append(
+                {
+                    "row": row_idx,
+                    "column": col_idx,
+                    "text_frame": _text_frame(tcs[col_idx].find(_A_TX_BODY)),
+                }
+            )
+
+    return {"rows": len(rows), "columns": columns, "cells": cells}
@@ -0,0 +1,240 @@
+"""Lazy sequence views of slides and shapes.
+
+The elements of a view are indexed once, and indexed again only
+when the children of the parent XML element change,
+e.g. when one is added, replaced or moved.
+Each access checks in constant time that the first and last children
+and the neighbours of the accessed element are still the indexed ones,
+and iteration compares all the children.
+So the length only follows children inserted or removed in the middle
+through the XML once an element next to them is accessed or the view is iterated,
+since python-pptx itself only appends slides and shapes.
+Wrappers are created on access and cached, so they keep their identity.
+"""
+
+from collections.abc import Callable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, overload
+
+from .converter import PptxConvertible
+
+if TYPE_CHECKING:
+    from lxml.etree import _Element
+    from pptx.parts.presentation import PresentationPart as PptxPresentationPart
+    from pptx.shapes.shapetree import SlidePlaceholders as PptxSlidePlaceholders
+    from pptx.shapes.shapetree import _BaseShapes as PptxBaseShapes
+
+    from tppt.pptx.slide import Slide
+
+W = TypeVar("W", bound=PptxConvertible)
+
+
+class _LazyView(Sequence[W], Generic[W]):
+    """Sequence of wrappers of the children of an XML element."""
+
+    def __init__(self) -> None:
+        self._elements: list[_Element] = []
+        self._parent_element: _Element | None = None
+        self._children: list[_Element] | None = None
+        self._child_positions: dict[_Element, int] = {}
+        self._wrappers: dict[_Element, W] = {}
+
+    @overload
+    def __getitem__(self, index: int) -> W: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[W]: ...
+
+    def __getitem__(self, index: int | slice) -> W | list[W]:
+        elements = self._index()
+        if isinstance(index, slice):
+            selected = elements[index]
+            if not all(map(self._is_in_place, selected)):
+                selected = self._index(compare_all=True)[index]
+
+            return [self._get(element) for element in selected]
+
+        if not -len(elements) <= index < len(elements) or not self._is_in_place(
+            elements[index]
+        ):
+            elements = self._index(compare_all=True)
+
+        return self._get(elements[index])
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __iter__(self) -> Iterator[W]:
+        for element in self._index(compare_all=True):
+            yield self._get(element)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {len(self)} items>"
+
+    def _index(self, compare_all: bool = False) -> list["_Element"]:
+        parent = self._parent()
+        # NOTE: lxml gives the same proxy for an element while one is referenced,
+        #       so comparing the children compares the identities of the elements.
+        if compare_all:
+            children = list(parent)
+            if children == self._children:
+                return self._elements
+        elif self._is_current(parent):
+            return self._elements
+        else:
+            children = list(parent)
+
+        self._elements = self._collect(parent)
+        self._parent_element = parent
+        self._children = children
+        self._child_positions = {
+            child: position for position, child in enumerate(children)
+        }
+        self._wrappers = {
+            element: self._wrappers[element]
+            for element in self._elements
+            if element in self._wrappers
+        }
+        self._reindex()
+
+        return self._elements
+
+    def _is_current(self, parent: "_Element") -> bool:
+        """Whether the first and last children of the parent are the indexed ones."""
+        if (children := self._children) is None or parent is not self._parent_element:
+            return False
+
+        first = next(parent.iterchildren(), None)
+        last = next(parent.iterchildren(reversed=True), None)
+        if not children:
+            return first is None
+
+        return first is children[0] and last is children[-1]
+
+    def _is_in_place(self, element: "_Element") -> bool:
+        """Whether the element is still between its indexed neighbours."""
+        children = cast("list[_Element]", self._children)
+        position = self._child_positions[element]
+        previous = children[position - 1] if position > 0 else None
+        following = children[position + 1] if position + 1 < len(children) else None
+
+        return (
+            element.getparent() is self._parent_element
+            and element.getprevious() is previous
+            and element.getnext() is following
+        )
+
+    def _get(self, element: "_Element") -> W:
+        if (wrapper := self._wrappers.get(element)) is None:
+            wrapper = self._wrappers[element] = self._wrap(element)
+
+        return wrapper
+
+    def _parent(self) -> "_Element":
+        raise NotImplementedError
+
+    def _collect(self, parent: "_Element") -> list["_Element"]:
+        raise NotImplementedError
+
+    def _wrap(self, element: "_Element") -> W:
+        raise NotImplementedError
+
+    def _reindex(self) -> None:
+        pass
+
+
+class SlideCollection(_LazyView["Slide"]):
+    """Slides of a presentation, wrapped on access."""
+
+    def __init__(self, presentation_part: "PptxPresentationPart") -> None:
+        super().__init__()
+        self._presentation_part = presentation_part
+        self._positions: dict[int, int] = {}
+        self._names: dict[str, int] = {}
+
+    def get(self, slide_id: int, default: "Slide | None" = None) -> "Slide | None":
+        """Get the slide of the slide id, or `default` if there is none."""
+        elements = self._index()
+        position = self._positions.get(slide_id)
+        if position is None or not self._is_in_place(elements[position]):
+            elements = self._index(compare_all=True)
+            if (position := self._positions.get(slide_id)) is None:
+                return default
+
+        return self._get(elements[position])
+
+    def get_by_name(self, name: str, default: "Slide | None" = None) -> "Slide | None":
+        """Get the first slide of the name, or `default` if there is none."""
+        self._index()
+        if (slide := self._find_by_name(name)) is None:
+            # NOTE: Slides may have been renamed since the names were indexed.
+            self._names = self._index_names()
+            slide = self._find_by_name(name)
+
+        return default if slide is None else slide
+
+    def _find_by_name(self, name: str) -> "Slide | None":
+        if (position := self._names.get(name)) is None:
+            return None
+
+        slide = self[position]
+        return slide if slide.name == name else None
+
+    def _parent(self) -> "_Element":
+        return self._presentation_part._element.get_or_add_sldIdLst()
+
+    def _collect(self, parent: "_Element") -> list["_Element"]:
+        return list(parent.iterchildren())
+
+    def _wrap(self, element: Any) -> "Slide":
+        from tppt.pptx.slide import Slide
+
+        return Slide(self._presentation_part.related_slide(element.rId))
+
+    def _reindex(self) -> None:
+        self._positions = {
+            cast(Any, element).id: position
+            for position, element in enumerate(self._elements)
+        }
+        # Names need the XML of every slide, so they are indexed on demand.
+        self._names = {}
+
+    def _index_names(self) -> dict[str, int]:
+        names: dict[str, int] = {}
+        for position, element in enumerate(self._elements):
+            slide_part = self._presentation_part.related_part(cast(Any, element).rId)
+            names.setdefault(cast(Any, slide_part)._element.cSld.name, position)
+
+        return names
+
+
+class ShapeCollection(_LazyView[W]):
+    """Shapes of a slide, wrapped on access, in the order of python-pptx."""
+
+    def __init__(
+        self,
+        shapes: "PptxBaseShapes | PptxSlidePlaceholders",
+        wrap: Callable[[Any], W],
+    ) -> None:
+        super().__init__()
+        self._shapes = shapes
+        self._wrap_shape = wrap
+
+    def _parent(self) -> "_Element":
+        return self._shapes._element
+
+    def _collect(self, parent: Any) -> list["_Element"]:
+        from pptx.shapes.shapetree import SlidePlaceholders
+
+        if isinstance(self._shapes, SlidePlaceholders):
+            # NOTE: python-pptx lists the placeholders of a slide in idx order.
+            return sorted(parent.iter_ph_elms(), key=lambda elm: elm.ph_idx)
+
+        return list(self._shapes._iter_member_elms())
+
+    def _wrap(self, element: Any) -> W:
+        from pptx.shapes.shapetree import SlidePlaceholders, SlideShapeFactory
+
+        if isinstance(self._shapes, SlidePlaceholders):
+            return self._wrap_shape(SlideShapeFactory(element, self._shapes))
+
+        return self._wrap_shape(self._shapes._shape_factory(element))
@@ -30,6 +30,8 @@ from tppt.types._length import (
     to_length,
 )
 
+from ._source import mark_dirty
+
 PT = TypeVar("PT")
 
 
@@ -38,6 +40,7 @@ class PptxConvertible(Generic[PT]):
 
     def __init__(self, pptx_obj: PT, /) -> None:
         self._pptx: PT = pptx_obj
+        mark_dirty(pptx_obj)
 
     def to_pptx(self) -> PT:
         """Convert to pptx object."""
@@ -0,0 +1,275 @@
+"""Cache of the images embedded as pictures."""
+
+import hashlib
+import os
+import weakref
+from typing import IO, TYPE_CHECKING, NamedTuple, cast
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.parts.image import Image as PptxImage
+from pptx.parts.image import ImagePart as PptxImagePart
+from pptx.util import Emu
+
+from tppt._cache import CacheInfo, LRUCache
+from tppt.types import FilePath
+
+if TYPE_CHECKING:
+    from pptx.package import Package as PptxPackage
+    from pptx.parts.slide import SlidePart as PptxSlidePart
+    from pptx.shapes.picture import Picture as PptxPicture
+    from pptx.shapes.shapetree import SlideShapes as PptxSlideShapes
+    from pptx.util import Length as PptxLength
+
+    from tppt.pptx.image_optimizer import ImageOptimizer
+
+
+ImageCacheKey = tuple[str, int, int] | tuple[str, str]
+
+_EMU_PER_INCH = 914400
+
+
+class CachedImage(NamedTuple):
+    """Image loaded once, with the properties that need Pillow to be read."""
+
+    image: PptxImage
+    """Image bytes with their file name and format."""
+
+    sha1: str
+    """SHA1 hash digest of the image bytes."""
+
+    px_size: tuple[int, int]
+    """Size of the image in pixels."""
+
+    dpi: tuple[int, int]
+    """Resolution of the image in dots per inch."""
+
+    @property
+    def native_size(self) -> tuple[int, int]:
+        """Size of the image in EMU at its own resolution."""
+        (width_px, height_px), (horz_dpi, vert_dpi) = self.px_size, self.dpi
+        return (
+            int(_EMU_PER_INCH * width_px / horz_dpi),
+            int(_EMU_PER_INCH * height_px / vert_dpi),
+        )
+
+
+class ImageCache:
+    """LRU cache of loaded images.
+
+    Paths are keyed by their absolute path, modification time and size,
+    so a hit does not read the file at all.
+    Binary streams are keyed by the hash of their content,
+    so a hit skips parsing the image.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._cache: LRUCache[ImageCacheKey, CachedImage] = LRUCache(maxsize)
+
+    def load(self, image_file: FilePath | IO[bytes]) -> CachedImage:
+        """Get the image of the path or the binary stream."""
+        blob: bytes | None = None
+        if isinstance(image_file, str | os.PathLike):
+            path = os.path.abspath(os.fspath(image_file))
+            stat = os.stat(path)
+            key: ImageCacheKey = (path, stat.st_mtime_ns, stat.st_size)
+        else:
+            image_file.seek(0)
+            blob = image_file.read()
+            key = ("sha1", hashlib.sha1(blob).hexdigest())
+
+        def load() -> CachedImage:
+            if blob is None:
+                image = PptxImage.from_file(os.fspath(cast(FilePath, image_file)))
+            else:
+                image = PptxImage.from_blob(blob)
+
+            return CachedImage(image, image.sha1, image.size, image.dpi)
+
+        return self._cache.get(key, load)
+
+    def cache_info(self) -> CacheInfo:
+        """Get the cache statistics."""
+        return self._cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        self._cache.cache_clear()
+
+
+class _PackageImages:
+    """Image parts of one package, indexed by the hash of their bytes."""
+
+    def __init__(self, package: "PptxPackage", cache: ImageCache) -> None:
+        self.cache = cache
+        self.parts: dict[str, PptxImagePart] = {}
+        self.indexed: set[PptxImagePart] = set()
+        """Image parts of the package that are in `parts`, to hash each part once."""
+        self.index(package)
+        self.optimizer: ImageOptimizer | None = None
+        self.targets: dict[PptxImagePart, tuple[int, int]] = {}
+        """Largest pixel size each image part is shown at, for the optimizer."""
+
+    def index(self, package: "PptxPackage") -> None:
+        """Add the image parts of the package that are not indexed yet."""
+        for part in package.iter_parts():
+            if isinstance(part, PptxImagePart) and part not in self.indexed:
+                self.indexed.add(part)
+                self.parts.setdefault(part.sha1, part)
+
+
+_package_images: "weakref.WeakKeyDictionary[PptxPackage, _PackageImages]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def use_image_cache(package: "PptxPackage", cache: ImageCache) -> None:
+    """Load the pictures added to the package through the cache."""
+    _get_package_images(package).cache = cache
+
+
+def use_image_optimizer(package: "PptxPackage", optimizer: "ImageOptimizer") -> None:
+    """Optimize the pictures added to the package when it is built."""
+    _get_package_images(package).optimizer = optimizer
+
+
+def optimize_pictures(package: "PptxPackage") -> None:
+    """Optimize the images of the pictures added since the last call."""
+    images = _package_images.get(package)
+    if images is None or images.optimizer is None or not images.targets:
+        return
+
+    images.optimizer.optimize_parts(images.targets)
+    images.targets.clear()
+
+
+def add_picture(
+    shapes: "PptxSlideShapes",
+    image_file: FilePath | IO[bytes],
+    left: "PptxLength",
+    top: "PptxLength",
+    width: "PptxLength | None" = None,
+    height: "PptxLength | None" = None,
+) -> "PptxPicture":
+    """Add a picture like `SlideShapes.add_picture`, reusing loaded images and parts.
+
+    The image part of an image is shared by all slides of the package,
+    and the picture size is computed without parsing the image again.
+    """
+    package = shapes.part.package
+    images = _get_package_images(package)
+
+    cached = images.cache.load(image_file)
+    if images.optimizer is not None and not _is_embeddable(cached.image):
+        cached = _to_embeddable(cached, images.optimizer)
+    if (image_part := find_image_part(package, cached.sha1)) is None:
+        image_part = images.parts[cached.sha1] = PptxImagePart.new(
+            package, cached.image
+        )
+        images.indexed.add(image_part)
+
+    r_id = shapes.part.relate_to(image_part, RT.IMAGE)
+
+    cx, cy = _scale(cached.native_size, width, height)
+    shape_id = shapes._next_shape_id
+    pic = shapes._grpSp.add_pic(
+        shape_id,
+        f"Picture {shape_id - 1}",
+        image_part.desc,
+        r_id,
+        left,
+        top,
+        Emu(cx),
+        Emu(cy),
+    )
+    shapes._recalculate_extents()
+
+    _add_target(images, image_part, cx, cy)
+
+    return cast("PptxPicture", shapes._shape_factory(pic))
+
+
+def find_image_part(package: "PptxPackage", sha1: str) -> PptxImagePart | None:
+    """Get the image part of the bytes with the hash, if the package has one."""
+    images = _get_package_images(package)
+    if (image_part := images.parts.get(sha1)) is None:
+        # NOTE: The part may have been added without this cache,
+        #       e.g. by `SlidePlaceholder.insert_picture`.
+        images.index(package)
+        image_part = images.parts.get(sha1)
+
+    return image_part
+
+
+def track_pictures(slide_part: "PptxSlidePart") -> None:
+    """Record the sizes of the pictures of a slide added without `add_picture`.
+
+    The images are optimized with the other pictures when the package is built.
+    """
+    images = _get_package_images(slide_part.package)
+    if images.optimizer is None:
+        return
+
+    for pic in slide_part._element.iter(qn("p:pic")):
+        if pic.blip_rId is None or not (pic.cx and pic.cy):
+            continue
+
+        image_part = slide_part.related_part(pic.blip_rId)
+        if isinstance(image_part, PptxImagePart):
+            _add_target(images, image_part, pic.cx, pic.cy)
+
+
+def _add_target(
+    images: _PackageImages, image_part: PptxImagePart, cx: int, cy: int
+) -> None:
+    if images.optimizer is None:
+        return
+
+    target = images.optimizer.target_size(cx, cy)
+    if (current := images.targets.get(image_part)) is not None:
+        target = (max(target[0], current[0]), max(target[1], current[1]))
+    images.targets[image_part] = target
+
+
+def _get_package_images(package: "PptxPackage") -> _PackageImages:
+    if (images := _package_images.get(package)) is None:
+        images = _package_images[package] = _PackageImages(package, ImageCache())
+
+    return images
+
+
+def _is_embeddable(image: PptxImage) -> bool:
+    try:
+        return bool(image.ext)
+    except ValueError:
+        return False
+
+
+def _to_embeddable(cached: CachedImage, optimizer: "ImageOptimizer") -> CachedImage:
+    """Re-encode an image in a format that PowerPoint cannot show, e.g. WebP."""
+    optimized = optimizer.optimize(cached.image.blob, cached.px_size)
+    filename = cached.image.filename
+    if filename is not None:
+        filename = f"{os.path.splitext(filename)[0]}.{optimized.ext}"
+
+    image = PptxImage.from_blob(optimized.blob, filename)
+    return CachedImage(image, image.sha1, cached.px_size, cached.dpi)
+
+
+def _scale(
+    native_size: tuple[int, int], width: int | None, height: int | None
+) -> tuple[int, int]:
+    """Same as `ImagePart.scale`, keeping the aspect ratio of a missing side."""
+    native_width, native_height = native_size
+    if width and height:
+        return width, height
+    if width:
+        return width, round(native_height * float(width) / float(native_width))
+    if height:
+        return round(native_width * float(height) / float(native_height)), height
+
+    return native_width, native_height
+
+
+image_cache = ImageCache()
+"""Process-wide image cache, shared by the builders that opt in to it."""
@@ -0,0 +1,165 @@
+"""Downscaling and recompression of the images embedded as pictures."""
+
+import hashlib
+import io
+import math
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
+
+from tppt._cache import CacheInfo, LRUCache
+
+if TYPE_CHECKING:
+    from pptx.parts.image import ImagePart as PptxImagePart
+
+OptimizedImageKey = tuple[str, tuple[int, int]]
+
+_EMU_PER_INCH = 914400
+
+# Formats that are re-encoded as PNG, e.g. formats PowerPoint cannot show.
+_PNG_FORMATS = frozenset(("BMP", "TIFF", "WEBP"))
+
+
+class OptimizedImage(NamedTuple):
+    """Image bytes after optimization."""
+
+    blob: bytes
+    """Image bytes."""
+
+    ext: str
+    """File extension of the image format."""
+
+    content_type: str
+    """MIME type of the image format."""
+
+
+class ImageOptimizer:
+    """Resample and re-encode images to the size they are shown at.
+
+    The target pixel size is the picture size at the target DPI.
+    Images are only ever downscaled, and the original bytes are kept
+    when the optimized ones are not smaller.
+    Results are cached by the hash of the original bytes and the target size.
+    """
+
+    def __init__(
+        self,
+        *,
+        dpi: int = 150,
+        jpeg_quality: int = 85,
+        workers: int | None = None,
+        maxsize: int = 128,
+    ) -> None:
+        self.dpi = dpi
+        """Resolution of the images at their picture size."""
+
+        self.jpeg_quality = jpeg_quality
+        """Quality of the re-encoded JPEG images."""
+
+        self.workers = workers
+        """Number of threads optimizing the images of a deck."""
+
+        self._cache: LRUCache[OptimizedImageKey, OptimizedImage] = LRUCache(maxsize)
+
+    def target_size(self, cx: int, cy: int) -> tuple[int, int]:
+        """Get the pixel size of a picture of the size in EMU."""
+        return (
+            max(1, math.ceil(cx * self.dpi / _EMU_PER_INCH)),
+            max(1, math.ceil(cy * self.dpi / _EMU_PER_INCH)),
+        )
+
+    def optimize(self, blob: bytes, target_size: tuple[int, int]) -> OptimizedImage:
+        """Optimize the image bytes for the target pixel size."""
+        return self._cache.get(
+            (hashlib.sha1(blob).hexdigest(), target_size),
+            lambda: self._optimize(blob, target_size),
+        )
+
+    def optimize_parts(
+        self, targets: Mapping["PptxImagePart", tuple[int, int]]
+    ) -> None:
+        """Optimize the image parts in a thread pool, replacing their bytes."""
+        parts = list(targets)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(
+                executor.map(
+                    lambda part: self.optimize(part.blob, targets[part]), parts
+                )
+            )
+
+        for part, optimized in zip(parts, results):
+            if optimized.blob == part.blob:
+                continue
+
+            if optimized.ext != part.partname.ext:
+                part.partname = part.package.next_image_partname(optimized.ext)
+                part._content_type = optimized.content_type
+
+            part.blob = optimized.blob
+            if "sha1" in part.__dict__:
+                # NOTE: Drop the hash of the old bytes cached by `lazyproperty`.
+                del part.__dict__["sha1"]
+
+    def cache_info(self) -> CacheInfo:
+        """Get the cache statistics."""
+        return self._cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        self._cache.cache_clear()
+
+    def _optimize(self, blob: bytes, target_size: tuple[int, int]) -> OptimizedImage:
+        from PIL import Image, UnidentifiedImageError
+
+        try:
+            image = Image.open(io.BytesIO(blob))
+        except UnidentifiedImageError:
+            return OptimizedImage(blob, "", "")
+
+        with image:
+            image_format = image.format or ""
+            if image_format == "JPEG":
+                ext, content_type = "jpg", "image/jpeg"
+            elif image_format == "PNG" or image_format in _PNG_FORMATS:
+                ext, content_type = "png", "image/png"
+            else:
+                # NOTE: GIF may be animated, and vector formats have no pixels.
+                return OptimizedImage(blob, "", "")
+
+            width, height = image.size
+            scale = max(target_size[0] / width, target_size[1] / height)
+            resized = image
+            if scale < 1:
+                resized = image.resize(
+                    (max(1, round(width * scale)), max(1, round(height * scale))),
+                    Image.Resampling.LANCZOS,
+                )
+
+            # NOTE: Keep the orientation and the color profile of the original.
+            metadata = {"exif": image.getexif()}
+            if (icc_profile := image.info.get("icc_profile")) is not None:
+                metadata["icc_profile"] = icc_profile
+
+            output = io.BytesIO()
+            if ext == "jpg":
+                resized.save(
+                    output,
+                    "JPEG",
+                    quality=self.jpeg_quality,
+                    optimize=True,
+                    **metadata,
+                )
+            else:
+                if resized.mode not in ("1", "L", "LA", "P", "RGB", "RGBA", "I"):
+                    resized = resized.convert("RGBA")
+                resized.save(output, "PNG", optimize=True, **metadata)
+
+        optimized_blob = output.getvalue()
+        if image_format not in _PNG_FORMATS and len(optimized_blob) >= len(blob):
+            return OptimizedImage(blob, ext, content_type)
+
+        return OptimizedImage(optimized_blob, ext, content_type)
+
+
+image_optimizer = ImageOptimizer()
+"""Default image optimizer used by `PresentationBuilder.optimize_images`."""
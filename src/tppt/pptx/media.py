@@ -0,0 +1,195 @@
+"""Media parts backed by files, so that their bytes are not kept in memory.
+
+The files must not change until the package is saved,
+which is checked by their size and modification time before they are read.
+"""
+
+import os
+import shutil
+import weakref
+import zipfile
+from typing import IO, TYPE_CHECKING
+
+from pptx.oxml.ns import qn
+from pptx.parts.media import MediaPart as PptxMediaPart
+
+from tppt.exception import MediaFileChangedError
+
+if TYPE_CHECKING:
+    from pptx.opc.packuri import PackURI
+    from pptx.package import Package as PptxPackage
+    from pptx.shapes.graphfrm import GraphicFrame as PptxGraphicFrame
+
+COPY_CHUNK_SIZE = 1024 * 1024
+"""Size of the chunks media files are copied in."""
+
+_R_NAMESPACE = qn("r:id")[: qn("r:id").index("}") + 1]
+
+
+def file_fingerprint(path: "str | os.PathLike[str]") -> tuple[int, int]:
+    """Get the modification time and size of a file, to detect changes."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileMediaPart(PptxMediaPart):
+    """Media part that reads its bytes from a file only when they are needed."""
+
+    def __init__(
+        self,
+        partname: "PackURI",
+        content_type: str,
+        package: "PptxPackage",
+        path: str,
+        sha1: str,
+        fingerprint: tuple[int, int] | None = None,
+    ) -> None:
+        super().__init__(partname, content_type, package)
+        self.path = path
+        """Path of the media file."""
+
+        self._sha1 = sha1
+        self._fingerprint = fingerprint or file_fingerprint(path)
+
+    @property
+    def blob(self) -> bytes:
+        with self.open() as file:
+            return file.read()
+
+    @property
+    def sha1(self) -> str:  # type: ignore[override]
+        return self._sha1
+
+    @property
+    def size(self) -> int:
+        """Size of the media file in bytes."""
+        self.check_file()
+        return os.path.getsize(self.path)
+
+    def check_file(self) -> None:
+        """Check that the file is unchanged since the part was created."""
+        try:
+            fingerprint = file_fingerprint(self.path)
+        except OSError:
+            fingerprint = None
+        if fingerprint != self._fingerprint:
+            raise MediaFileChangedError(self.path)
+
+    def open(self) -> IO[bytes]:
+        """Open the media file for reading."""
+        self.check_file()
+        return open(self.path, "rb")
+
+    def copy_to(self, output: IO[bytes]) -> None:
+        """Copy the media file into the output in chunks."""
+        with self.open() as file:
+            shutil.copyfileobj(file, output, COPY_CHUNK_SIZE)
+
+
+class ZipMediaPart(FileMediaPart):
+    """Media part that reads its bytes from an entry of another package file."""
+
+    def __init__(
+        self,
+        partname: "PackURI",
+        content_type: str,
+        package: "PptxPackage",
+        path: str,
+        membername: str,
+        sha1: str,
+    ) -> None:
+        super().__init__(partname, content_type, package, path, sha1)
+        self.membername = membername
+        """Name of the entry in the package file."""
+
+    @property
+    def blob(self) -> bytes:
+        with self.open() as file:
+            return file.read()
+
+    @property
+    def size(self) -> int:
+        """Size of the media in bytes."""
+        self.check_file()
+        with zipfile.ZipFile(self.path) as zip_file:
+            return zip_file.getinfo(self.membername).file_size
+
+    def open(self) -> IO[bytes]:
+        """Open the entry for reading."""
+        self.check_file()
+        # NOTE: The archive stays open until the entry is closed.
+        with zipfile.ZipFile(self.path) as zip_file:
+            return zip_file.open(self.membername)
+
+
+_linked_packages: "weakref.WeakSet[PptxPackage]" = weakref.WeakSet()
+
+
+def use_media_files(package: "PptxPackage") -> None:
+    """Read the media of the movies added to the package from their files."""
+    _linked_packages.add(package)
+
+
+def uses_media_files(package: "PptxPackage") -> bool:
+    """Whether the media of the movies added to the package are read from files."""
+    return package in _linked_packages
+
+
+def link_media_file(
+    movie: "PptxGraphicFrame",
+    path: "str | os.PathLike[str]",
+    fingerprint: tuple[int, int] | None = None,
+) -> None:
+    """Make the media parts of a movie read from the file instead of memory.
+
+    python-pptx loads the media file into a part once when the movie is added.
+    The part is replaced by one that refers to the file,
+    so that the bytes are released and saving copies the file in chunks.
+    `fingerprint` is the one of the file when it was loaded.
+    """
+    slide_part = movie.part
+    r_ids = {
+        value
+        for element in movie._element.iter()
+        for key, value in element.attrib.items()
+        if key.startswith(_R_NAMESPACE) and value in slide_part.rels
+    }
+
+    media_rels = [
+        rel
+        for r_id in r_ids
+        if not (rel := slide_part.rels[r_id]).is_external
+        and type(rel.target_part) is PptxMediaPart
+    ]
+    if not media_rels:
+        return
+
+    # NOTE: A part with the same bytes that was added before is shared
+    #       with other shapes, and is left as it is.
+    owned = {id(rel) for rel in media_rels}
+    shared = {
+        rel.target_part
+        for part in slide_part.package.iter_parts()
+        for rel in part.rels.values()
+        if not rel.is_external and id(rel) not in owned
+    }
+
+    file_parts: dict[PptxMediaPart, FileMediaPart] = {}
+    for rel in media_rels:
+        media_part = rel.target_part
+        if media_part in shared:
+            continue
+
+        if (file_part := file_parts.get(media_part)) is None:
+            file_part = file_parts[media_part] = FileMediaPart(
+                media_part.partname,
+                media_part.content_type,
+                media_part.package,
+                os.path.abspath(path),
+                media_part.sha1,
+                fingerprint,
+            )
+
+        rel._target = file_part
+        # NOTE: Drop the target cached by `lazyproperty`.
+        rel.__dict__.pop("target_part", None)
@@ -0,0 +1,130 @@
+"""Merge of several decks into one.
+
+The slides of the decks are appended to a master deck one source deck at a time,
+so that only one source package is loaded besides the merged one.
+Media are not copied into memory: the merged deck reads them
+from the source files when it is saved.
+"""
+
+import os
+from collections.abc import Iterable
+from typing import IO, TYPE_CHECKING, Literal
+
+from pptx.opc.packuri import PackURI
+from pptx.parts.media import MediaPart as PptxMediaPart
+
+from tppt.types import FilePath
+
+from ._slide_copy import _next_partname
+from ._source import mark_dirty
+from .media import ZipMediaPart
+from .presentation import Presentation
+
+if TYPE_CHECKING:
+    from pptx.opc.package import Part as PptxPart
+    from pptx.package import Package as PptxPackage
+
+    from .package_writer import CompressionPolicy
+
+
+def merge(
+    paths: Iterable[FilePath],
+    out: FilePath | IO[bytes],
+    *,
+    master: Literal["first"] | FilePath = "first",
+    compression: "CompressionPolicy | None" = None,
+) -> None:
+    """Concatenate the slides of the decks into one deck.
+
+    The slide masters, layouts and theme of the merged deck come from `master`:
+    the first of the decks by default, or another deck whose own slides are left out.
+    Each slide uses the slide layout of the master deck with the same name.
+    Images and media with the same bytes are shared by all slides.
+
+    >>> import tppt
+    >>> tppt.merge(["intro.pptx", "results.pptx"], "report.pptx")
+    """
+    paths = [os.fspath(path) for path in paths]
+    own_master = master != "first"
+    if master == "first":
+        if not paths:
+            raise ValueError("No decks to merge.")
+
+        master, sources = paths[0], paths[1:]
+    else:
+        sources = paths
+
+    if isinstance(out, os.PathLike | str):
+        out = os.fspath(out)
+        # NOTE: The media of the source decks are read while the file is written.
+        #       Only the master deck is loaded, and saving over it is safe.
+        if any(os.path.abspath(out) == os.path.abspath(path) for path in sources):
+            raise ValueError(f"Cannot overwrite a merged deck: {out}")
+
+    presentation = Presentation(master)
+    if own_master:
+        _drop_slides(presentation)
+
+    package = presentation._pptx.part.package
+    media = _MergedMedia(package)
+    for path in sources:
+        _append_deck(presentation, path, media)
+
+    presentation.save(out, streaming=True, compression=compression)
+
+
+class _MergedMedia:
+    """Media parts of the merged package, indexed by the hash of their bytes."""
+
+    def __init__(self, package: "PptxPackage") -> None:
+        self.package = package
+        self.parts: dict[str, PptxPart] = {}
+        self.used: set[str] = set()
+        """Partnames of the package and of the media parts linked to it."""
+
+        for part in package.iter_parts():
+            self.used.add(str(part.partname))
+            if isinstance(part, PptxMediaPart):
+                self.parts.setdefault(part.sha1, part)
+
+    def link(self, path: str, source: "PptxPackage") -> dict[bytes, "PptxPart"]:
+        """Get the parts sharing the media of the source package, by their bytes."""
+        binaries: dict[bytes, PptxPart] = {}
+        for part in source.iter_parts():
+            # NOTE: Parts of subclasses, e.g. video posters, are images.
+            if type(part) is not PptxMediaPart:
+                continue
+
+            if (shared := self.parts.get(part.sha1)) is None:
+                partname = _next_partname(self.used, str(part.partname))
+                self.used.add(partname)
+                shared = self.parts[part.sha1] = ZipMediaPart(
+                    PackURI(partname),
+                    part.content_type,
+                    self.package,
+                    path,
+                    part.partname.membername,
+                    part.sha1,
+                )
+            binaries[part.blob] = shared
+
+        return binaries
+
+
+def _drop_slides(presentation: Presentation) -> None:
+    presentation_part = presentation._pptx.part
+    mark_dirty(presentation_part)
+    sld_id_lst = presentation_part._element.get_or_add_sldIdLst()
+    for sld_id in list(sld_id_lst.sldId_lst):
+        presentation_part.drop_rel(sld_id.rId)
+        sld_id_lst.remove(sld_id)
+
+
+def _append_deck(presentation: Presentation, path: str, media: _MergedMedia) -> None:
+    from pptx import Presentation as PptxPresentation
+
+    source = PptxPresentation(path)
+    presentation._copy_slides(
+        [slide.part for slide in source.slides],
+        binaries=media.link(os.path.abspath(path), source.part.package),
+    )
@@ -1,7 +1,9 @@
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from pptx.slide import NotesSlide as PptxNotesSlide
 
+from tppt.pptx.collection import ShapeCollection
 from tppt.pptx.converter import PptxConvertible
 
 if TYPE_CHECKING:
@@ -13,6 +15,17 @@ if TYPE_CHECKING:
 class NotesSlide(PptxConvertible[PptxNotesSlide]):
     """Notes slide."""
 
+    def __init__(self, pptx_obj: PptxNotesSlide, /) -> None:
+        from tppt.pptx.shape import BaseShape
+        from tppt.pptx.shape.placeholder import SlidePlaceholder
+
+        super().__init__(pptx_obj)
+        self._shapes = ShapeCollection(pptx_obj.shapes, BaseShape)
+        self._placeholders = ShapeCollection(
+            pptx_obj.placeholders,
+            SlidePlaceholder,  # type: ignore
+        )
+
     @property
     def notes_text_frame(self) -> "TextFrame":
         """Text frame of the notes body placeholder."""
@@ -32,18 +45,11 @@ class NotesSlide(PptxConvertible[PptxNotesSlide]):
         return NotesSlidePlaceholder(placeholder)
 
     @property
-    def placeholders(self) -> "list[SlidePlaceholder]":
+    def placeholders(self) -> "Sequence[SlidePlaceholder]":
         """All placeholders in the notes slide."""
-        from tppt.pptx.shape.placeholder import SlidePlaceholder
-
-        return [
-            SlidePlaceholder(placeholder)  # type: ignore
-            for placeholder in self._pptx.placeholders
-        ]
+        return self._placeholders
 
     @property
-    def shapes(self) -> "list[BaseShape]":
+    def shapes(self) -> "Sequence[BaseShape]":
         """All shapes in the notes slide."""
-        from tppt.pptx.shape import BaseShape
-
-        return [BaseShape(shape) for shape in self._pptx.shapes]
+        return self._shapes
@@ -0,0 +1,239 @@
+"""Streaming writer of presentation packages.
+
+Each part is serialized straight into its zip entry,
+instead of being serialized into bytes first as python-pptx does.
+Parts of a loaded presentation that were not touched are copied from its file.
+"""
+
+import os
+import shutil
+import struct
+import tempfile
+import time
+import zipfile
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING
+
+from lxml import etree
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.package import XmlPart
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+from ._source import PackageSource, get_source, track_source
+from .media import COPY_CHUNK_SIZE, FileMediaPart
+
+if TYPE_CHECKING:
+    from pptx.package import Package as PptxPackage
+
+# Entries larger than this need the ZIP64 extension, decided before writing.
+_ZIP64_LIMIT = (1 << 31) - 1
+
+_DATA_DESCRIPTOR_FLAG = 0x08
+
+COMPRESSED_CONTENT_TYPES = frozenset(
+    (
+        CT.JPEG,
+        CT.PNG,
+        CT.GIF,
+        CT.MP4,
+        CT.MOV,
+        CT.MPG,
+        CT.WMV,
+        CT.ASF,
+        "audio/mpeg",
+        "audio/mp4",
+        CT.SML_SHEET,
+    )
+)
+"""Content types of formats that are already compressed."""
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """Compression of the zip entries of a package, chosen by content type."""
+
+    xml_level: int | None = None
+    """Deflate level of XML parts, from 0 to 9. `None` is the zlib default."""
+
+    binary_level: int | None = None
+    """Deflate level of the other parts, e.g. images and media."""
+
+    stored_content_types: frozenset[str] = frozenset()
+    """Content types stored without compression."""
+
+    def compression_for(self, content_type: str) -> tuple[int, int | None]:
+        """Get the compression method and level of a part of the content type."""
+        if content_type in self.stored_content_types:
+            return zipfile.ZIP_STORED, None
+        if content_type.endswith("xml"):
+            return zipfile.ZIP_DEFLATED, self.xml_level
+
+        return zipfile.ZIP_DEFLATED, self.binary_level
+
+
+DEFAULT_COMPRESSION = CompressionPolicy()
+"""Deflate all entries at the zlib default level, like python-pptx."""
+
+FAST_COMPRESSION = CompressionPolicy(
+    xml_level=1, stored_content_types=COMPRESSED_CONTENT_TYPES
+)
+"""Deflate XML at the fastest level, and store already compressed media."""
+
+SMALL_COMPRESSION = CompressionPolicy(xml_level=9, binary_level=9)
+"""Deflate all entries at the best level, for the smallest file."""
+
+
+def save_package(
+    package: "PptxPackage",
+    file: str | IO[bytes],
+    compression: CompressionPolicy | None = None,
+) -> None:
+    """Write the package, copying the untouched parts from its source archive.
+
+    Saving over the source archive writes a temporary file next to it first,
+    and the saved file becomes the source archive of the next save,
+    for the parts that are still clean.
+    """
+    source = get_source(package)
+    if source is None or not isinstance(file, str):
+        write_package(package, file, compression, source)
+        return
+
+    path = os.path.abspath(file)
+    if path != source.path:
+        write_package(package, path, compression, source)
+    else:
+        fd, temp_path = tempfile.mkstemp(suffix=".pptx", dir=os.path.dirname(path))
+        os.close(fd)
+        try:
+            write_package(package, temp_path, compression, source)
+            shutil.copymode(path, temp_path)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    track_source(package, path, compression, source)
+
+
+def write_package(
+    package: "PptxPackage",
+    file: str | IO[bytes],
+    compression: CompressionPolicy | None = None,
+    source: PackageSource | None = None,
+) -> None:
+    """Write the package as a zip, part by part.
+
+    XML parts are serialized by lxml into the compressed entry,
+    and media backed by files are copied in chunks.
+    The clean parts of the source archive are copied entry by entry,
+    without being serialized or compressed again.
+    Without a `compression` policy, copied entries keep their compression
+    and the other entries are compressed by `DEFAULT_COMPRESSION`.
+    With a policy, only the entries already compressed as the policy says are copied.
+    Outputs that cannot seek, e.g. pipes, are written with data descriptors.
+    """
+    policy = compression or DEFAULT_COMPRESSION
+    parts = tuple(package.iter_parts())
+    with (
+        zipfile.ZipFile(
+            file, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False
+        ) as zip_file,
+        open(source.path if source else os.devnull, "rb") as source_file,
+    ):
+        date_time = time.localtime(time.time())[:6]
+
+        def open_entry(membername: str, content_type: str, size: int = 0) -> IO[bytes]:
+            zinfo = zipfile.ZipInfo(membername, date_time)
+            zinfo.compress_type, level = policy.compression_for(content_type)
+            # NOTE: Renamed to `compress_level` in Python 3.13, with this alias.
+            zinfo._compresslevel = level  # type: ignore[attr-defined]
+            zinfo.external_attr = 0o600 << 16
+            return zip_file.open(zinfo, "w", force_zip64=size > _ZIP64_LIMIT)
+
+        with open_entry(CONTENT_TYPES_URI.membername, CT.XML) as entry:
+            _write_xml(entry, _ContentTypesItem.xml_for(parts))
+        with open_entry(PACKAGE_URI.rels_uri.membername, CT.OPC_RELATIONSHIPS) as entry:
+            entry.write(package._rels.xml)
+
+        for part in parts:
+            membername, content_type = part.partname.membername, part.content_type
+            if (
+                source
+                and (info := source.clean_entry(part)) is not None
+                and (
+                    compression is None
+                    or source.is_compressed_as(info, content_type, compression)
+                )
+            ):
+                _copy_entry(zip_file, source_file, info, membername)
+            elif isinstance(part, XmlPart):
+                with open_entry(membername, content_type) as entry:
+                    _write_xml(entry, part._element)
+            elif isinstance(part, FileMediaPart):
+                with open_entry(membername, content_type, part.size) as entry:
+                    part.copy_to(entry)
+            else:
+                blob = part.blob
+                with open_entry(membername, content_type, len(blob)) as entry:
+                    _write_blob(entry, blob)
+
+            if part._rels:
+                with open_entry(
+                    part.partname.rels_uri.membername, CT.OPC_RELATIONSHIPS
+                ) as entry:
+                    entry.write(part.rels.xml)
+
+
+def _copy_entry(
+    zip_file: zipfile.ZipFile,
+    source_file: IO[bytes],
+    info: zipfile.ZipInfo,
+    membername: str,
+) -> None:
+    """Copy the compressed bytes of a source entry as they are."""
+    # The local header has the lengths of the name and the extra field at 26.
+    source_file.seek(info.header_offset)
+    name_length, extra_length = struct.unpack("<HH", source_file.read(30)[26:])
+    source_file.seek(info.header_offset + 30 + name_length + extra_length)
+
+    zinfo = zipfile.ZipInfo(membername, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.flag_bits = info.flag_bits & ~_DATA_DESCRIPTOR_FLAG
+    zinfo.external_attr = 0o600 << 16
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    zip64 = max(info.compress_size, info.file_size) > _ZIP64_LIMIT
+
+    # NOTE: `zipfile` has no API to write compressed bytes,
+    #       so this follows the steps of `ZipFile.mkdir` on its internals.
+    with zip_file._lock:
+        if zip_file._seekable:
+            zip_file.fp.seek(zip_file.start_dir)
+        zinfo.header_offset = zip_file.fp.tell()
+        zip_file._writecheck(zinfo)
+        zip_file._didModify = True
+        zip_file.fp.write(zinfo.FileHeader(zip64))
+
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = source_file.read(min(COPY_CHUNK_SIZE, remaining))
+            zip_file.fp.write(chunk)
+            remaining -= len(chunk)
+
+        zip_file.filelist.append(zinfo)
+        zip_file.NameToInfo[zinfo.filename] = zinfo
+        zip_file.start_dir = zip_file.fp.tell()
+
+
+def _write_blob(entry: IO[bytes], blob: bytes) -> None:
+    view = memoryview(blob)
+    for start in range(0, len(view), COPY_CHUNK_SIZE):
+        entry.write(view[start : start + COPY_CHUNK_SIZE])
+
+
+def _write_xml(entry: IO[bytes], element: etree._Element) -> None:
+    # NOTE: Same declaration as `serialize_part_xml` of python-pptx.
+    etree.ElementTree(element).write(entry, encoding="UTF-8", standalone=True)
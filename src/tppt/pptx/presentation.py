@@ -1,11 +1,13 @@
 """Presentation wrapper implementation."""
 
+import functools
 import os
 from typing import IO, TYPE_CHECKING, Any, Callable, Generic, Self, cast, overload
 
 from pptx.parts.coreprops import CorePropertiesPart as _PptxCorePropertiesPart
 from pptx.presentation import Presentation as _PptxPresentation
 from pptx.slide import NotesMaster as _PptxNotesMaster
+from pptx.slide import Slide as _PptxSlide
 from pptx.slide import _BaseMaster as _PptxBaseMaster
 
 from tppt.pptx.tree import ppt2tree
@@ -18,14 +20,27 @@ from tppt.template.slide_master import (
 from tppt.types import FilePath
 from tppt.types._length import Length, LiteralLength
 
+from ._source import mark_dirty
+from .collection import SlideCollection
 from .converter import PptxConvertible, to_pptx_length, to_tppt_length
+from .recipe import FilledSlide
 from .slide import SlideBuilder, _BaseSlide
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Executor
+
+    from pptx.parts.slide import SlidePart as _PptxSlidePart
+
+    from tppt.pptx._async_io import AsyncWritable
+    from tppt.pptx.image_cache import ImageCache
+    from tppt.pptx.image_optimizer import ImageOptimizer
+    from tppt.pptx.package_writer import CompressionPolicy
     from tppt.pptx.shape import BaseShape
     from tppt.pptx.shape.placeholder import MasterPlaceholder
     from tppt.pptx.slide import Slide
     from tppt.pptx.slide_master import SlideMaster
+    from tppt.pptx.table._stream import PendingTableRows
 
 
 class Presentation(PptxConvertible[_PptxPresentation]):
@@ -36,16 +51,38 @@ class Presentation(PptxConvertible[_PptxPresentation]):
         pptx: _PptxPresentation | FilePath,
     ) -> None:
         """Initialize presentation."""
+        path = None
         if isinstance(pptx, (os.PathLike, str)):
             from pptx import Presentation
 
-            pptx = Presentation(os.fspath(pptx))
+            path = os.fspath(pptx)
+            pptx = Presentation(path)
         super().__init__(pptx)
+        self._slides = SlideCollection(pptx.part)
+
+        if path is not None:
+            from ._source import track_source
+
+            # Parts that are not touched are copied from the file on save.
+            track_source(pptx.part.package, path)
+
+    def to_pptx(self) -> _PptxPresentation:
+        """Convert to pptx object.
+
+        Any part may be changed through the pptx object,
+        so all parts are saved again instead of being copied from the source file.
+        """
+        from ._source import mark_all_dirty
+
+        mark_all_dirty(self._pptx.part.package)
+        return self._pptx
 
     @property
     def core_properties(self) -> _PptxCorePropertiesPart:
         """Get the core properties."""
-        return self._pptx.core_properties
+        core_properties = self._pptx.core_properties
+        mark_dirty(core_properties)
+        return core_properties
 
     @property
     def notes_master(self) -> "NotesMaster":
@@ -53,11 +90,12 @@ class Presentation(PptxConvertible[_PptxPresentation]):
         return NotesMaster.from_pptx(self._pptx.notes_master)
 
     @property
-    def slides(self) -> "list[Slide]":
-        """Get the slides."""
-        from tppt.pptx.slide import Slide
+    def slides(self) -> SlideCollection:
+        """Get the slides.
 
-        return [Slide.from_pptx(slide) for slide in self._pptx.slides]
+        Slides are wrapped when they are accessed.
+        """
+        return self._slides
 
     @property
     def slide_master(self) -> "SlideMaster":
@@ -76,6 +114,7 @@ class Presentation(PptxConvertible[_PptxPresentation]):
 
     @slide_width.setter
     def slide_width(self, value: Length | LiteralLength) -> None:
+        mark_dirty(self._pptx)
         self._pptx.slide_width = to_pptx_length(value)
 
     def set_slide_width(self, value: Length | LiteralLength) -> Self:
@@ -88,12 +127,66 @@ class Presentation(PptxConvertible[_PptxPresentation]):
 
     @slide_height.setter
     def slide_height(self, value: Length | LiteralLength) -> None:
+        mark_dirty(self._pptx)
         self._pptx.slide_height = to_pptx_length(value)
 
     def set_slide_height(self, value: Length | LiteralLength) -> Self:
         self.slide_height = value
         return self
 
+    def clone_slide(self, slide: "Slide") -> "Slide":
+        """Append a copy of the slide to the presentation.
+
+        Images and media are shared with the original slide,
+        and links to other slides still point to the same slides.
+        """
+        slide_parts = {str(part.partname): part for part in self._iter_slide_parts()}
+
+        return self._copy_slides([slide.to_pptx().part], slide_parts)[0]
+
+    def import_slides(
+        self,
+        other: "Presentation",
+        slides: "Iterable[Slide] | None" = None,
+    ) -> "list[Slide]":
+        """Append copies of slides of another presentation, all of them by default.
+
+        Each slide uses the slide layout of this presentation with the same name.
+        Images and media with the same bytes are shared,
+        and links between the copied slides are kept.
+        """
+        if slides is None:
+            slides = other.slides
+
+        return self._copy_slides([slide.to_pptx().part for slide in slides])
+
+    def _iter_slide_parts(self) -> "Iterator[_PptxSlidePart]":
+        presentation_part = self._pptx.part
+        for sld_id in presentation_part._element.get_or_add_sldIdLst().sldId_lst:
+            yield cast("_PptxSlidePart", presentation_part.related_part(sld_id.rId))
+
+    def _copy_slides(
+        self,
+        slide_parts: "list[_PptxSlidePart]",
+        slides: "dict[str, _PptxSlidePart] | None" = None,
+        binaries: dict[bytes, Any] | None = None,
+    ) -> "list[Slide]":
+        from ._slide_copy import export_slide, import_slide
+        from .image_cache import track_pictures
+
+        presentation_part = self._pptx.part
+        mark_dirty(presentation_part)
+
+        slides = dict(slides or {})
+        binaries = {} if binaries is None else binaries
+        for slide_part in slide_parts:
+            payload = export_slide(slide_part)
+            new_slide_part = import_slide(presentation_part, payload, slides, binaries)
+            slides[payload.partname] = new_slide_part
+            track_pictures(new_slide_part)
+
+        return self.slides[len(self.slides) - len(slide_parts) :]
+
     @property
     def tree(self) -> dict[str, Any]:
         """Get the node tree of the presentation."""
@@ -123,11 +216,70 @@ class Presentation(PptxConvertible[_PptxPresentation]):
             slide_master = DefaultSlideMaster
         return PresentationBuilder(slide_master)
 
-    def save(self, file: FilePath | IO[bytes]) -> None:
-        """Save presentation to file."""
+    def save(
+        self,
+        file: FilePath | IO[bytes],
+        *,
+        streaming: bool = False,
+        compression: "CompressionPolicy | None" = None,
+    ) -> None:
+        """Save presentation to file.
+
+        With `streaming`, each part is written straight into the zip
+        as it is serialized, and media linked to their files,
+        see `PresentationBuilder.link_media`, are copied in chunks.
+        The file can then also be a stream that cannot seek, e.g. a pipe.
+
+        `compression` chooses the compression of each part by its content type,
+        e.g. `tppt.pptx.package_writer.FAST_COMPRESSION`,
+        and implies the streaming writer.
+
+        A presentation loaded from a file is always saved by the streaming writer,
+        which copies the parts not touched through tppt from the file as they are,
+        unless `compression` asks for another compression of them.
+        """
+        from ._source import get_source
+
         if isinstance(file, os.PathLike):
             file = os.fspath(file)
-        self._pptx.save(file)
+        package = self._pptx.part.package
+        if streaming or compression is not None or get_source(package) is not None:
+            from .package_writer import save_package
+
+            save_package(package, file, compression)
+        else:
+            self._pptx.save(file)
+
+    async def asave(
+        self,
+        file: "FilePath | IO[bytes] | AsyncWritable",
+        *,
+        streaming: bool = False,
+        compression: "CompressionPolicy | None" = None,
+        executor: "Executor | None" = None,
+    ) -> None:
+        """Save presentation to file without blocking the event loop.
+
+        The package is serialized and compressed in the executor,
+        by default the default executor of the loop.
+        It must be a thread pool, since the presentation is not picklable.
+        An async stream, e.g. `aiohttp.web.StreamResponse`,
+        is written in chunks by the event loop.
+        Do not change the presentation until it is saved.
+        """
+        import asyncio
+
+        from ._async_io import is_async_writable, write_async
+
+        save = functools.partial(
+            self.save, streaming=streaming, compression=compression
+        )
+        if is_async_writable(file):
+            await write_async(save, file, executor)
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                executor, save, cast("FilePath | IO[bytes]", file)
+            )
 
 
 class PresentationBuilder(Generic[GenericTpptSlideMaster]):
@@ -138,16 +290,21 @@ class PresentationBuilder(Generic[GenericTpptSlideMaster]):
         slide_master: "type[GenericTpptSlideMaster]",
     ) -> None:
         """Initialize the builder."""
-        import pptx
-
-        if (
-            slide_master_source := slide_master.__slide_master_source__
-        ) and slide_master_source != "default":
-            self._pptx = pptx.Presentation(os.fspath(slide_master_source))
-        else:
-            self._pptx = pptx.Presentation()
+        from tppt.template.cache import template_cache
 
+        self._pptx = template_cache.get(
+            slide_master.__slide_master_source__ or "default"
+        )
         self._slide_master = slide_master
+        self._slide_master_proxy = SlideMasterProxy(
+            slide_master, self._pptx.slide_masters[0].slide_layouts
+        )
+        self._workers: int | None = None
+        self._parallel_slides: list[
+            Callable[[type[GenericTpptSlideMaster]], SlideLayout | SlideBuilder]
+            | FilledSlide[GenericTpptSlideMaster]
+        ] = []
+        self._pending_rows: list[PendingTableRows] = []
 
     def slide_width(self, value: Length | LiteralLength) -> Self:
         """Set the slide width."""
@@ -159,40 +316,179 @@ class PresentationBuilder(Generic[GenericTpptSlideMaster]):
         self._pptx.slide_height = to_pptx_length(value)
         return self
 
+    def image_cache(self, cache: "ImageCache") -> Self:
+        """Load the pictures through the cache.
+
+        By default each presentation has its own cache.
+        Pass `tppt.pptx.image_cache.image_cache` to share images across presentations.
+        """
+        from .image_cache import use_image_cache
+
+        use_image_cache(self._pptx.part.package, cache)
+        return self
+
+    def optimize_images(self, optimizer: "ImageOptimizer | None" = None) -> Self:
+        """Downscale and recompress the pictures to the size they are shown at.
+
+        The images are optimized in a thread pool when the presentation is built.
+        By default `tppt.pptx.image_optimizer.image_optimizer` is used.
+        """
+        from .image_cache import use_image_optimizer
+        from .image_optimizer import image_optimizer
+
+        use_image_optimizer(self._pptx.part.package, optimizer or image_optimizer)
+        return self
+
+    def link_media(self) -> Self:
+        """Read the media of movies added from paths from their files when saving.
+
+        The bytes of the movies are not kept in memory,
+        and the streaming writer copies the files in chunks.
+        The files must not change until the presentation is saved.
+        """
+        from .media import use_media_files
+
+        use_media_files(self._pptx.part.package)
+        return self
+
+    def parallel(self, workers: int | None = None) -> Self:
+        """Build the following slides in a process pool when the presentation is built.
+
+        Each worker builds its slides against its own copy of the template,
+        and the slides are added to the presentation in order.
+        The slide recipes must be picklable, e.g. module-level functions.
+        By default the number of workers is the number of CPUs.
+        """
+        self._workers = workers or os.cpu_count() or 1
+        return self
+
     def slide(
         self,
-        slide: Callable[[type[GenericTpptSlideMaster]], SlideLayout | SlideBuilder],
+        slide: Callable[[type[GenericTpptSlideMaster]], SlideLayout | SlideBuilder]
+        | FilledSlide[GenericTpptSlideMaster],
         /,
     ) -> Self:
-        """Add a slide to the presentation."""
-        slide_master = SlideMasterProxy(self._slide_master, Presentation(self._pptx))
+        """Add a slide to the presentation.
+
+        A slide with paginated tables is followed by its continuation slides.
+        A slide of a compiled recipe is copied from the first slide of the recipe,
+        see `tppt.compile_slide`.
+        """
+        if self._workers is not None and self._workers > 1:
+            self._parallel_slides.append(slide)
+            return self
+
+        if isinstance(slide, FilledSlide):
+            slide.recipe._add_to(self, slide.values)
+        else:
+            self._add_slides(self._slide_builder(slide))
+
+        return self
+
+    def _slide_builder(
+        self,
+        slide: Callable[[type[GenericTpptSlideMaster]], SlideLayout | SlideBuilder],
+    ) -> SlideBuilder:
         template_slide_layout = cast(
             SlideLayoutProxy,
-            slide(cast(type[GenericTpptSlideMaster], slide_master)),
+            slide(cast(type[GenericTpptSlideMaster], self._slide_master_proxy)),
         )
 
-        slide_builder = cast(
+        return cast(
             SlideBuilder,
             template_slide_layout.builder()
             if isinstance(template_slide_layout, SlideLayoutProxy)
             else template_slide_layout,
         )
 
+    def _add_slides(self, slide_builder: SlideBuilder) -> list[_PptxSlide]:
         slide_layout = slide_builder._slide_layout.to_pptx()
-        new_slide = self._pptx.slides.add_slide(slide_layout)
+        slides = [self._pptx.slides.add_slide(slide_layout)]
+        slide_builder._build(slides[0])
 
-        slide_builder._build(new_slide)
+        # Continue paginated tables on new slides of the same layout.
+        while slide_builder._has_next_page():
+            slides.append(self._pptx.slides.add_slide(slide_layout))
+            slide_builder._build(slides[-1])
 
-        return self
+        self._pending_rows.extend(slide_builder._pending_rows)
+        slide_builder._pending_rows.clear()
+
+        return slides
 
     def build(self) -> Presentation:
-        """Build the presentation."""
+        """Build the presentation.
+
+        Async rows of streamed tables are read on a private event loop,
+        so use `abuild` while an event loop is running.
+        """
+        from .image_cache import optimize_pictures
+
+        for pending_rows in self._pending_rows:
+            pending_rows.write()
+        self._pending_rows.clear()
+
+        if self._parallel_slides:
+            self._build_parallel_slides()
+
+        optimize_pictures(self._pptx.part.package)
 
         return Presentation(self._pptx)
 
-    def save(self, file: FilePath | IO[bytes]) -> None:
+    def save(
+        self,
+        file: FilePath | IO[bytes],
+        *,
+        streaming: bool = False,
+        compression: "CompressionPolicy | None" = None,
+    ) -> None:
         """Save the presentation to a file."""
-        self.build().save(file)
+        self.build().save(file, streaming=streaming, compression=compression)
+
+    async def abuild(self, executor: "Executor | None" = None) -> Presentation:
+        """Build the presentation in the executor, without blocking the event loop.
+
+        Async rows of streamed tables are read on the running event loop first.
+        """
+        import asyncio
+
+        for pending_rows in self._pending_rows:
+            await pending_rows.awrite()
+        self._pending_rows.clear()
+
+        return await asyncio.get_running_loop().run_in_executor(executor, self.build)
+
+    async def asave(
+        self,
+        file: "FilePath | IO[bytes] | AsyncWritable",
+        *,
+        streaming: bool = False,
+        compression: "CompressionPolicy | None" = None,
+        executor: "Executor | None" = None,
+    ) -> None:
+        """Save the presentation to a file, without blocking the event loop."""
+        presentation = await self.abuild(executor)
+        await presentation.asave(
+            file, streaming=streaming, compression=compression, executor=executor
+        )
+
+    def _build_parallel_slides(self) -> None:
+        from ._parallel import build_slides
+        from ._slide_copy import import_slide
+        from .image_cache import track_pictures
+
+        presentation_part = self._pptx.part
+        for payloads in build_slides(
+            self._slide_master, self._parallel_slides, cast(int, self._workers)
+        ):
+            # Links between the slides of a chunk are kept.
+            slides: dict[str, _PptxSlidePart] = {}
+            for payload in payloads:
+                slide_part = import_slide(presentation_part, payload, slides)
+                slides[payload.partname] = slide_part
+                track_pictures(slide_part)
+
+        self._parallel_slides.clear()
 
 
 class _BaseMaster(_BaseSlide[_PptxBaseMaster]):
@@ -0,0 +1,352 @@
+"""Compiled slide recipes.
+
+A recipe whose slides differ only in data uses `Slot` markers in place of the data.
+Its first slide is built as usual and kept as a template,
+and the later slides are copied from the template with the slots filled,
+without running the shape registrations of the recipe again.
+
+Recipes that cannot be replayed from a single slide, e.g. with `tap()` callbacks,
+fall back to being built every time, as reported by `CompiledSlide.report`.
+"""
+
+import copy
+import dataclasses
+import re
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, Self
+
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import XmlPart
+from pptx.oxml.ns import qn
+from pptx.oxml.text import CT_RegularTextRun
+
+from tppt.exception import SlotNotFoundError, SlotValueMissingError
+from tppt.template.slide_master import GenericTpptSlideMaster
+
+from ._slide_copy import SlidePayload, export_slide, import_slide
+
+if TYPE_CHECKING:
+    from pptx.opc.package import Part as PptxPart
+    from pptx.slide import Slide as PptxSlide
+
+    from .presentation import PresentationBuilder
+
+# NOTE: Slots are marked with characters of the private use area,
+#       which are valid in XML and kept as they are by python-pptx.
+_SLOT_START = "\ue000"
+_SLOT_END = "\ue001"
+_SLOT_PATTERN = re.compile(f"{_SLOT_START}(.+?){_SLOT_END}", re.DOTALL)
+_SLOT_BYTES_PATTERN = re.compile(_SLOT_PATTERN.pattern.encode(), re.DOTALL)
+
+_A_T = qn("a:t")
+_A_P_PR = qn("a:pPr")
+
+# Parts of the deck that a slide relates to, and that are not filled.
+_SHARED_RELTYPES = frozenset((RT.SLIDE_LAYOUT, RT.NOTES_MASTER, RT.SLIDE))
+
+
+class Slot(str):
+    """Named data slot of a compiled slide recipe, used in place of a text.
+
+    >>> Slot("title")
+    Slot('title')
+    """
+
+    name: str
+    """Name of the slot, given as a keyword of `CompiledSlide.fill`."""
+
+    def __new__(cls, name: str) -> Self:
+        if not name.isidentifier():
+            raise ValueError(f"Slot name must be an identifier: {name!r}")
+
+        slot = super().__new__(cls, f"{_SLOT_START}{name}{_SLOT_END}")
+        slot.name = name
+        return slot
+
+    def __repr__(self) -> str:
+        return f"Slot({self.name!r})"
+
+
+class CompileReport(NamedTuple):
+    """Result of compiling a slide recipe."""
+
+    compiled: bool
+    """Whether the slides are copied from a template."""
+
+    reason: str | None
+    """Why the slides are built every time instead."""
+
+    slots: frozenset[str]
+    """Names of the slots used by the recipe."""
+
+
+@dataclasses.dataclass(frozen=True)
+class _Template:
+    report: CompileReport
+
+    payload: SlidePayload | None = None
+    """Parts of the first slide, with the slots still in their XML."""
+
+    slot_parts: frozenset[int] = frozenset()
+    """Indices of the parts with slots."""
+
+
+class CompiledSlide(Generic[GenericTpptSlideMaster]):
+    """Slide recipe that is built once and replayed with other slot values.
+
+    >>> import tppt
+    >>> title_slide = tppt.compile_slide(
+    ...     lambda slide: slide.TitleLayout(title=tppt.Slot("title")).builder()
+    ... )
+    >>> (
+    ...     tppt.Presentation.builder()
+    ...     .slide(title_slide.fill(title="First"))
+    ...     .slide(title_slide.fill(title="Second"))
+    ...     .build()
+    ...     .save("titles.pptx")
+    ... )
+    """
+
+    def __init__(
+        self,
+        recipe: "Callable[[type[GenericTpptSlideMaster]], Any]",
+    ) -> None:
+        self._recipe = recipe
+        self._templates: dict[type[GenericTpptSlideMaster], _Template] = {}
+
+    @property
+    def name(self) -> str:
+        """Name of the recipe function."""
+        return getattr(self._recipe, "__qualname__", repr(self._recipe))
+
+    @property
+    def report(self) -> CompileReport | None:
+        """Report of the latest compilation, or `None` before the first slide."""
+        if not self._templates:
+            return None
+
+        return next(reversed(self._templates.values())).report
+
+    def fill(self, **values: Any) -> "FilledSlide[GenericTpptSlideMaster]":
+        """Slide of the recipe with the values of its slots.
+
+        The values are converted with `str`. As in placeholder text,
+        a line feed starts a new paragraph and control characters are escaped.
+        """
+        return FilledSlide(self, values)
+
+    def __repr__(self) -> str:
+        return f"<CompiledSlide {self.name} report={self.report}>"
+
+    def _add_to(
+        self,
+        builder: "PresentationBuilder[GenericTpptSlideMaster]",
+        values: Mapping[str, Any],
+    ) -> None:
+        template = self._templates.get(builder._slide_master)
+        if template is not None and template.payload is not None:
+            self._check_values(template.report.slots, values)
+            _stamp(builder, template, values)
+            return
+
+        slide_builder = builder._slide_builder(self._recipe)
+        slides = builder._add_slides(slide_builder)
+        if template is None:
+            template = self._templates[builder._slide_master] = _compile(
+                slide_builder._compile_blocker, slides
+            )
+
+        slots: set[str] = set()
+        for slide in slides:
+            for part in _owned_xml_parts(slide.part):
+                slots |= _fill_part(part, values)
+        self._check_values(frozenset(slots), values)
+
+    @staticmethod
+    def _check_values(slots: frozenset[str], values: Mapping[str, Any]) -> None:
+        for name in slots:
+            if name not in values:
+                raise SlotValueMissingError(name)
+        for name in values:
+            if name not in slots:
+                raise SlotNotFoundError(name, sorted(slots))
+
+
+@dataclasses.dataclass(frozen=True)
+class FilledSlide(Generic[GenericTpptSlideMaster]):
+    """Slide of a compiled recipe with the values of its slots."""
+
+    recipe: CompiledSlide[GenericTpptSlideMaster]
+
+    values: Mapping[str, Any]
+
+
+def compile_slide(
+    recipe: "Callable[[type[GenericTpptSlideMaster]], Any]",
+) -> CompiledSlide[GenericTpptSlideMaster]:
+    """Compile a slide recipe, to replay it with the values of its `Slot` markers."""
+    return CompiledSlide(recipe)
+
+
+def _compile(blocker: str | None, slides: "list[PptxSlide]") -> _Template:
+    if blocker is None and len(slides) != 1:
+        blocker = "the recipe adds several slides"
+    if blocker is not None:
+        names = {
+            name
+            for slide in slides
+            for part in _owned_xml_parts(slide.part)
+            for name in _SLOT_BYTES_PATTERN.findall(part.blob)
+        }
+        return _Template(CompileReport(False, blocker, _decode(names)))
+
+    payload = export_slide(slides[0].part)
+    slots: set[bytes] = set()
+    slot_parts: set[int] = set()
+    for index, part in enumerate(payload.parts):
+        if part.content_type.endswith("+xml") and (
+            names := _SLOT_BYTES_PATTERN.findall(part.blob)
+        ):
+            slots.update(names)
+            slot_parts.add(index)
+
+    return _Template(
+        CompileReport(True, None, _decode(slots)), payload, frozenset(slot_parts)
+    )
+
+
+def _stamp(
+    builder: "PresentationBuilder[Any]",
+    template: _Template,
+    values: Mapping[str, Any],
+) -> None:
+    from .image_cache import track_pictures
+
+    assert template.payload is not None
+
+    strings = {name: _escape_ctrl_chars(str(value)) for name, value in values.items()}
+    if any("\n" in string for string in strings.values()):
+        # Line feeds start new paragraphs, which needs the XML elements.
+        fill = _fill_blob
+    else:
+        encoded = {name.encode(): _escape(string) for name, string in strings.items()}
+
+        def fill(blob: bytes, strings: Mapping[str, str]) -> bytes:
+            return _SLOT_BYTES_PATTERN.sub(lambda match: encoded[match[1]], blob)
+
+    parts = tuple(
+        dataclasses.replace(part, blob=fill(part.blob, strings))
+        if index in template.slot_parts
+        else part
+        for index, part in enumerate(template.payload.parts)
+    )
+    slide_part = import_slide(builder._pptx.part, SlidePayload(parts))
+    track_pictures(slide_part)
+
+
+def _owned_xml_parts(slide_part: "PptxPart") -> list[XmlPart]:
+    """XML parts of the slide that are not shared with other slides."""
+    parts: list[PptxPart] = [slide_part]
+    for part in parts:
+        for rel in part.rels.values():
+            if (
+                not rel.is_external
+                and rel.reltype not in _SHARED_RELTYPES
+                and rel.target_part not in parts
+            ):
+                parts.append(rel.target_part)
+
+    return [part for part in parts if isinstance(part, XmlPart)]
+
+
+def _fill_part(part: XmlPart, values: Mapping[str, Any]) -> set[str]:
+    """Fill the slots in the XML of the part, returning the names of the slots."""
+    return _fill_element(
+        part._element,
+        {name: _escape_ctrl_chars(str(value)) for name, value in values.items()},
+    )
+
+
+def _fill_blob(blob: bytes, strings: Mapping[str, str]) -> bytes:
+    from pptx.opc.oxml import serialize_part_xml
+    from pptx.oxml import parse_xml
+
+    element = parse_xml(blob)
+    _fill_element(element, strings)
+
+    return serialize_part_xml(element)
+
+
+def _fill_element(element: "etree._Element", strings: Mapping[str, str]) -> set[str]:
+    """Fill the slots of the element with the strings, like python-pptx sets text.
+
+    A line feed in a run starts a new paragraph, with the properties of the run.
+    """
+    slots: set[str] = set()
+
+    def replace(match: re.Match[str]) -> str:
+        slots.add(match[1])
+        if match[1] not in strings:
+            raise SlotValueMissingError(match[1])
+
+        return strings[match[1]]
+
+    # NOTE: python-pptx elements may override `text`, e.g. of `a:p`,
+    #       so the text nodes are set through the lxml properties.
+    for node in element.xpath(f"//text()[contains(., '{_SLOT_START}')]"):
+        parent = node.getparent()
+        text = _SLOT_PATTERN.sub(replace, str(node))
+        if node.is_tail:
+            etree.ElementBase.tail.__set__(parent, text)
+        elif parent.tag == _A_T and "\n" in text:
+            _split_paragraph(parent, text.split("\n"))
+        else:
+            etree.ElementBase.text.__set__(parent, text)
+    for node in element.xpath(f"//@*[contains(., '{_SLOT_START}')]"):
+        node.getparent().set(node.attrname, _SLOT_PATTERN.sub(replace, str(node)))
+
+    return slots
+
+
+def _split_paragraph(t: "etree._Element", lines: list[str]) -> None:
+    """Put each line of the text of a run into a paragraph of its own."""
+    run = t.getparent()
+    paragraph = run.getparent()
+    following = list(run.itersiblings())
+    p_pr = paragraph.find(_A_P_PR)
+
+    etree.ElementBase.text.__set__(t, lines[0])
+    last = paragraph
+    for line in lines[1:]:
+        new_paragraph = paragraph.makeelement(paragraph.tag, paragraph.attrib)
+        if p_pr is not None:
+            new_paragraph.append(copy.deepcopy(p_pr))
+        new_run = copy.deepcopy(run)
+        etree.ElementBase.text.__set__(new_run.find(_A_T), line)
+        new_paragraph.append(new_run)
+
+        last.addnext(new_paragraph)
+        last = new_paragraph
+
+    # The rest of the paragraph follows the last line.
+    last.extend(following)
+
+
+# NOTE: Control characters are not valid in XML, so python-pptx writes them
+#       as plain-text escapes such as "_x0007_", keeping tabs and line feeds.
+_escape_ctrl_chars = CT_RegularTextRun._escape_ctrl_chars
+
+
+def _escape(value: str) -> bytes:
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .encode()
+    )
+
+
+def _decode(names: "set[bytes] | frozenset[bytes]") -> frozenset[str]:
+    return frozenset(name.decode() for name in names)
@@ -1,6 +1,7 @@
 """Slide wrapper implementation."""
 
 import os
+from collections.abc import AsyncIterable, Sequence
 from typing import (
     IO,
     TYPE_CHECKING,
@@ -16,6 +17,7 @@ from typing import (
 from pptx.chart.data import ChartData as PptxChartData
 from pptx.slide import Slide as PptxSlide
 from pptx.slide import _BaseSlide as _PptxBaseSlide
+from pptx.util import Emu as PptxEmu
 
 from tppt.pptx.chart.chart import Chart, ChartData, ChartProps, to_pptx_chart_type
 from tppt.pptx.shape.picture import (
@@ -27,12 +29,24 @@ from tppt.pptx.shape.picture import (
 )
 from tppt.types import Color, FilePath, Length, LiteralColor, LiteralLength
 
+from ._shape_id import ShapeIdAllocator, reseed_shape_ids
+from .collection import ShapeCollection
 from .converter import PptxConvertible, to_pptx_length, to_pptx_rgb_color
+from .image_cache import add_picture
+from .media import file_fingerprint, link_media_file, uses_media_files
 from .shape import BaseShape, RangeProps, Shape
 from .shape.picture import Picture, PictureData, PictureProps
 from .shape.placeholder import SlidePlaceholder
 from .shape.text import Text, TextData, TextProps
 from .slide_layout import SlideLayout
+from .table._pagination import TablePager, get_rows_per_page
+from .table._stream import (
+    PendingTableRows,
+    RowSource,
+    TableRowWriter,
+    distribute_row_heights,
+    write_table_rows,
+)
 from .table.table import DataFrame, Table, TableData, TableProps, dataframe2list
 
 if TYPE_CHECKING:
@@ -69,6 +83,14 @@ class _BaseSlide(PptxConvertible[_GenericPptxBaseSlide]):
 class Slide(_BaseSlide[PptxSlide]):
     """Slide wrapper with type safety."""
 
+    def __init__(self, pptx_obj: PptxSlide, /) -> None:
+        super().__init__(pptx_obj)
+        self._shapes = ShapeCollection(pptx_obj.shapes, BaseShape)
+        self._placeholders = ShapeCollection(
+            pptx_obj.placeholders,
+            SlidePlaceholder,  # type: ignore
+        )
+
     @property
     def follow_master_background(self) -> bool:
         return self._pptx.follow_master_background
@@ -84,19 +106,14 @@ class Slide(_BaseSlide[PptxSlide]):
         return NotesSlide(self._pptx.notes_slide)
 
     @property
-    def placeholders(self) -> list[SlidePlaceholder]:
+    def placeholders(self) -> Sequence[SlidePlaceholder]:
         """Get all placeholders in the slide."""
-        return [
-            SlidePlaceholder(
-                placeholder,  # type: ignore
-            )
-            for placeholder in self._pptx.placeholders
-        ]
+        return self._placeholders
 
     @property
-    def shapes(self) -> list[BaseShape]:
+    def shapes(self) -> Sequence[BaseShape]:
         """Get all shapes in the slide."""
-        return [BaseShape(shape) for shape in self._pptx.shapes]
+        return self._shapes
 
     @property
     def slide_id(self) -> int:
@@ -129,6 +146,11 @@ class SlideBuilder:
         self._slide_layout = slide_layout
         self._shape_registry: list[Callable[[Slide], Any]] = []
         self._placeholder_registry = placeholder_registry
+        self._table_pagers: list[TablePager] = []
+        self._pending_rows: list[PendingTableRows] = []
+        """Async rows of streamed tables, written when the presentation is built."""
+        self._compile_blocker: str | None = None
+        """Why the slide cannot be replayed as a compiled recipe."""
 
     @overload
     def text(self, text: str, /, **kwargs: Unpack[TextProps]) -> Self: ...
@@ -199,7 +221,8 @@ class SlideBuilder:
         def _register(slide: Slide) -> Picture:
             data = PictureData(type="picture", image_file=image_file, **kwargs)
             picture_obj = Picture(
-                slide.to_pptx().shapes.add_picture(
+                add_picture(
+                    slide.to_pptx().shapes,
                     image_file,
                     to_pptx_length(data["left"]),
                     to_pptx_length(data["top"]),
@@ -253,20 +276,33 @@ class SlideBuilder:
 
         def _register(slide: Slide) -> Movie:
             data = MovieData(type="movie", movie_file=movie_file, **kwargs)
+            fingerprint = (
+                file_fingerprint(movie_file)
+                if isinstance(movie_file, str | os.PathLike)
+                and uses_media_files(slide.to_pptx().part.package)
+                else None
+            )
+            pptx_movie = slide.to_pptx().shapes.add_movie(
+                movie_file,
+                to_pptx_length(data["left"]),
+                to_pptx_length(data["top"]),
+                to_pptx_length(data.get("width")),
+                to_pptx_length(data.get("height")),
+                poster_frame_image=poster_frame_image,
+                mime_type=mime_type,
+            )
+            if fingerprint is not None:
+                # Release the bytes of the movie, and read them again when saving.
+                link_media_file(
+                    pptx_movie, cast("str | os.PathLike[str]", movie_file), fingerprint
+                )
+
             movie_obj = Movie(
                 cast(
                     # NOTE: Type hint of python-pptx is incorrect. Expected Movie, but GraphicFrame is returned.
                     # Ref: https://github.com/scanny/python-pptx/pull/1057/commits/56338fa314d2c5bceb8b1756a50ed64ea8984abe
                     PptxMovie,
-                    slide.to_pptx().shapes.add_movie(
-                        movie_file,
-                        to_pptx_length(data["left"]),
-                        to_pptx_length(data["top"]),
-                        to_pptx_length(data.get("width")),
-                        to_pptx_length(data.get("height")),
-                        poster_frame_image=poster_frame_image,
-                        mime_type=mime_type,
-                    ),
+                    pptx_movie,
                 ),
                 data,
             )
@@ -292,20 +328,42 @@ class SlideBuilder:
         **kwargs: Unpack[TableProps],
     ) -> Self: ...
 
+    @overload
     def table(
         self,
-        data: DataFrame | Callable[[Table], Table],
+        data: RowSource,
+        /,
+        *,
+        columns: Sequence[str],
+        **kwargs: Unpack[TableProps],
+    ) -> Self: ...
+
+    def table(
+        self,
+        data: DataFrame | RowSource | Callable[[Table], Table],
         /,
         rows: int | None = None,
         cols: int | None = None,
+        columns: Sequence[str] | None = None,
         **kwargs: Unpack[TableProps],
     ) -> Self:
+        """Add a table to the slide.
+
+        With `columns`, the data is a stream of rows, such as a database cursor
+        or an async iterable, and the rows are written as they are read.
+        """
         if isinstance(data, Callable):
             assert rows is not None
             assert cols is not None
             table_data: TableData = {"type": "table", "data": [], **kwargs}
+        elif (rows_per_page := get_rows_per_page(kwargs)) is not None:
+            self._paginated_table(data, rows_per_page, kwargs, columns)
+            return self
+        elif columns is not None:
+            self._streamed_table(cast(RowSource, data), columns, kwargs)
+            return self
         else:
-            data = dataframe2list(data)
+            data = dataframe2list(data, kwargs.get("column_formats"))
             rows, cols = len(data), len(data[0])
 
             table_data: TableData = {
@@ -338,6 +396,80 @@ class SlideBuilder:
 
         return self
 
+    def _streamed_table(
+        self, data: RowSource, columns: Sequence[str], props: TableProps
+    ) -> None:
+        self._compile_blocker = "a streamed table reads its rows once"
+
+        def _register(slide: Slide) -> Table:
+            pptx_table = (
+                slide.to_pptx()
+                .shapes.add_table(
+                    1,
+                    len(columns),
+                    to_pptx_length(props["left"]),
+                    to_pptx_length(props["top"]),
+                    to_pptx_length(props["width"]),
+                    to_pptx_length(props["height"]),
+                )
+                .table
+            )
+            height = int(to_pptx_length(props["height"]))
+            if isinstance(data, AsyncIterable):
+                writer = TableRowWriter(
+                    pptx_table._tbl, columns, props.get("column_formats")
+                )
+                self._pending_rows.append(
+                    PendingTableRows(pptx_table._tbl, data, writer, height)
+                )
+            else:
+                write_table_rows(
+                    pptx_table._tbl, columns, data, props.get("column_formats")
+                )
+                distribute_row_heights(pptx_table._tbl, height)
+
+            return Table(pptx_table, {"type": "table", **props, "data": []})
+
+        self._shape_registry.append(_register)
+
+    def _paginated_table(
+        self,
+        data: DataFrame | RowSource,
+        rows_per_page: int,
+        props: TableProps,
+        columns: Sequence[str] | None,
+    ) -> None:
+        pager = TablePager(data, rows_per_page, props.get("column_formats"), columns)
+        self._table_pagers.append(pager)
+        self._compile_blocker = "a paginated table adds several slides"
+
+        if (row_height := props.get("row_height")) is not None:
+            row_emu = int(to_pptx_length(row_height))
+        else:
+            row_emu = int(to_pptx_length(props["height"])) // (rows_per_page + 1)
+
+        def _register(slide: Slide) -> Table | None:
+            if (page := pager.next_page()) is None:
+                return None
+
+            table_data: TableData = {"type": "table", **props, "data": page}
+
+            return Table(
+                slide.to_pptx()
+                .shapes.add_table(
+                    len(page),
+                    len(page[0]),
+                    to_pptx_length(props["left"]),
+                    to_pptx_length(props["top"]),
+                    to_pptx_length(props["width"]),
+                    PptxEmu(row_emu * len(page)),
+                )
+                .table,
+                table_data,
+            )
+
+        self._shape_registry.append(_register)
+
     def chart(
         self,
         data: Callable[[Chart], Chart] | None = None,
@@ -474,14 +606,27 @@ class SlideBuilder:
 
     def tap(self, callback: Callable[[Slide], None]) -> Self:
         """Register a callback for direct slide access."""
-        self._shape_registry.append(callback)
+        self._compile_blocker = "a tap() callback may change the slide at will"
+
+        def _register(slide: Slide) -> None:
+            callback(slide)
+            # The callback may add shapes that the allocator does not number.
+            reseed_shape_ids(slide.to_pptx().shapes)
+
+        self._shape_registry.append(_register)
         return self
 
+    def _has_next_page(self) -> bool:
+        """Whether a paginated table has rows left for a continuation slide."""
+        return any(pager.has_next_page() for pager in self._table_pagers)
+
     def _build(self, slide: PptxSlide) -> Slide:
         tppt_slide = Slide(slide)
 
-        self._placeholder_registry(tppt_slide)
-        for register in self._shape_registry:
-            register(tppt_slide)
+        # Number the shapes without scanning the slide for each of them.
+        with ShapeIdAllocator(slide.shapes):
+            self._placeholder_registry(tppt_slide)
+            for register in self._shape_registry:
+                register(tppt_slide)
 
         return tppt_slide
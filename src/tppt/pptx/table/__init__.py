@@ -5,3 +5,4 @@ from .table import RowCollection as RowCollection
 from .table import Table as Table
 from .table import TableBorderStyle as TableBorderStyle
 from .table import TableCellStyle as TableCellStyle
+from .table import TableStyleRule as TableStyleRule
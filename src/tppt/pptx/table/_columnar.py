@@ -0,0 +1,184 @@
+"""Columnar conversion of DataFrames into rows of strings.
+
+Each column is cast to strings by its own library, one column at a time,
+so no intermediate object matrix of the whole frame is built.
+The strings are the ones of `str` on the values, e.g. floats are cast by NumPy
+and datetimes have fractional seconds only when they are not zero.
+Missing values, i.e. nulls and NaN, become empty strings.
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from ._format import ColumnFormats, compile_column_formats
+
+if TYPE_CHECKING:
+    from tppt._features import (
+        ArrowRecordBatch,
+        ArrowRecordBatchReader,
+        ArrowTable,
+        PandasDataFrame,
+        PolarsDataFrame,
+    )
+
+
+def polars2list(
+    df: "PolarsDataFrame", column_formats: ColumnFormats | None = None
+) -> list[list[str]]:
+    """Convert a polars DataFrame, casting each Series to strings."""
+    formatters = compile_column_formats(column_formats or {}, df.columns)
+    return _to_rows(
+        df.columns,
+        (
+            formatters[index].format_polars(series)
+            if index in formatters
+            else _polars_strings(series)
+            for index, series in enumerate(df)
+        ),
+    )
+
+
+def pandas2list(
+    df: "PandasDataFrame", column_formats: ColumnFormats | None = None
+) -> list[list[str]]:
+    """Convert a pandas DataFrame, casting each column to strings."""
+    header = [str(name) for name in df.columns]
+    formatters = compile_column_formats(column_formats or {}, header)
+    return _to_rows(
+        header,
+        (
+            formatters[index].format_pandas(series)
+            if index in formatters
+            else _pandas_strings(series)
+            for index, (_, series) in enumerate(df.items())
+        ),
+    )
+
+
+def arrow2list(
+    table: "ArrowTable | ArrowRecordBatch",
+    column_formats: ColumnFormats | None = None,
+) -> list[list[str]]:
+    """Convert a pyarrow Table or RecordBatch, casting each column to strings."""
+    formatters = compile_column_formats(column_formats or {}, table.column_names)
+    return _to_rows(
+        table.column_names,
+        (
+            formatters[index].format_arrow(column)
+            if index in formatters
+            else _arrow_strings(column)
+            for index, column in enumerate(table.columns)
+        ),
+    )
+
+
+def arrow_reader2list(
+    reader: "ArrowRecordBatchReader", column_formats: ColumnFormats | None = None
+) -> list[list[str]]:
+    """Convert a pyarrow RecordBatchReader, one record batch at a time."""
+    rows = [list(reader.schema.names)]
+    for batch in reader:
+        rows.extend(arrow2list(batch, column_formats)[1:])
+
+    return rows
+
+
+def records2list(
+    header: Sequence[Any],
+    records: Iterable[Sequence[Any]],
+    column_formats: ColumnFormats | None = None,
+) -> list[list[str]]:
+    """Convert rows of Python values, formatting them column by column."""
+    formatters = compile_column_formats(column_formats or {}, header)
+    to_strings: list[Callable[[Any], str]] = [
+        formatters.get(index, str) for index in range(len(header))
+    ]
+
+    return [
+        list(header),
+        *(
+            [to_string(value) for to_string, value in zip(to_strings, record)]
+            for record in records
+        ),
+    ]
+
+
+def _to_rows(header: Iterable[str], columns: Iterable[list[str]]) -> list[list[str]]:
+    return [list(header), *map(list, zip(*columns))]
+
+
+def _polars_strings(series: Any) -> list[str]:
+    import polars as pl  # type: ignore[import]
+
+    dtype = series.dtype
+    if dtype == pl.Boolean:
+        # NOTE: Keep the `str(bool)` representation of the row-wise conversion.
+        strings = series.replace_strict(
+            {True: "True", False: "False"}, return_dtype=pl.String
+        )
+    elif dtype.is_float():
+        return _float_strings(series.to_numpy())
+    elif dtype == pl.Datetime or dtype == pl.Time:
+        seconds_format = "%Y-%m-%d %H:%M:%S" if dtype == pl.Datetime else "%H:%M:%S"
+        fraction = series.dt.to_string("%.6f").replace(".000000", "")
+        strings = series.dt.to_string(seconds_format) + fraction
+        if getattr(dtype, "time_zone", None) is not None:
+            strings = strings + series.dt.to_string("%:z")
+    elif dtype.is_nested() or dtype in (pl.Object, pl.Duration):
+        return _python_strings(series.to_list())
+    else:
+        strings = series.cast(pl.String)
+
+    return strings.fill_null("").to_list()
+
+
+def _pandas_strings(series: Any) -> list[str]:
+    import pandas as pd  # type: ignore[import]
+
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        fraction = series.dt.strftime(".%f").replace(".000000", "")
+        strings = series.dt.strftime("%Y-%m-%d %H:%M:%S") + fraction
+        if series.dt.tz is not None:
+            strings += series.dt.strftime("%z").str.replace(
+                r"(\d\d)$", r":\1", regex=True
+            )
+    else:
+        strings = series.astype(str)
+
+    return strings.where(series.notna(), "").tolist()
+
+
+def _arrow_strings(column: Any) -> list[str]:
+    import pyarrow as pa  # type: ignore[import]
+    import pyarrow.compute as pc  # type: ignore[import]
+
+    dtype = column.type
+    if pa.types.is_boolean(dtype):
+        # NOTE: Keep the `str(bool)` representation of the row-wise conversion.
+        strings = pc.if_else(column, "True", "False")
+    elif pa.types.is_floating(dtype):
+        return _float_strings(column.to_numpy(zero_copy_only=False))
+    elif (pa.types.is_timestamp(dtype) and dtype.tz is None) or pa.types.is_time(dtype):
+        strings = pc.replace_substring_regex(pc.cast(column, pa.string()), r"\.0+$", "")
+    elif (
+        pa.types.is_nested(dtype)
+        or pa.types.is_timestamp(dtype)
+        or pa.types.is_duration(dtype)
+    ):
+        return _python_strings(column.to_pylist())
+    else:
+        strings = pc.cast(column, pa.string())
+
+    return pc.fill_null(strings, "").to_pylist()
+
+
+def _float_strings(values: Any) -> list[str]:
+    import numpy as np
+
+    strings = values.astype(str)
+    strings[np.isnan(values)] = ""
+    return strings.tolist()
+
+
+def _python_strings(values: list[Any]) -> list[str]:
+    return ["" if value is None else str(value) for value in values]
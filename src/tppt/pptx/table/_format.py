@@ -0,0 +1,217 @@
+"""Per-column formatting of table values.
+
+A format is either a Python format spec such as `",.2f"`, `".1%"` or `",d"`,
+or a `strftime` format such as `"%Y-%m-%d"` for dates.
+DataFrame columns are formatted at once with the vectorized string operations
+of their own library or NumPy, and other values with a precompiled formatter.
+All of them give an empty string for missing values, i.e. None, NaN and NaT,
+and round floats to the nearest integer, half to even, for integer formats.
+"""
+
+import math
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any, Literal
+
+from tppt.exception import TableColumnNotFoundError
+
+ColumnFormats = Mapping[str | int, str]
+
+# Number specs that NumPy can render with a printf template.
+_NUMBER_SPEC = re.compile(
+    r"(?P<sign>[-+ ]?)(?P<grouping>[,_]?)(?:\.(?P<precision>\d+))?(?P<type>[deEf%])"
+)
+
+# `strftime` directives, e.g. `%Y` or `%-d`.
+_DATE_DIRECTIVE = re.compile(r"%[-#]?[A-Za-z]")
+
+
+class ColumnFormatter:
+    """Format spec of a column, compiled once for all of its values."""
+
+    def __init__(self, spec: str) -> None:
+        self.spec = spec
+        """Original format."""
+
+        self.kind: Literal["date", "number", "python"]
+        """How the values are formatted."""
+
+        self.printf: str | None = None
+        """printf template of number formats."""
+
+        self.scale: int = 1
+        """Factor applied to the numbers before formatting."""
+
+        self.suffix: str = ""
+        """Text appended to the formatted numbers."""
+
+        self.grouping: str | None = None
+        """Thousands separator of number formats."""
+
+        if _DATE_DIRECTIVE.search(spec):
+            self.kind = "date"
+            return
+
+        if (match := _NUMBER_SPEC.fullmatch(spec)) is None:
+            self.kind = "python"
+            return
+
+        type_ = match["type"]
+        precision = match["precision"]
+        if type_ == "d" and precision is not None:
+            raise ValueError(f"Precision not allowed in integer format: {spec!r}")
+
+        self.kind = "number"
+        self.grouping = match["grouping"] or None
+        if type_ == "%":
+            self.scale = 100
+            self.suffix = "%"
+            type_ = "f"
+
+        sign = "" if match["sign"] == "-" else match["sign"]
+        if type_ == "d":
+            self.printf = f"%{sign}d"
+        else:
+            self.printf = f"%{sign}.{6 if precision is None else precision}{type_}"
+
+    def __call__(self, value: Any) -> str:
+        """Format one value.
+
+        Strings are kept as they are, and missing values become an empty string.
+        """
+        if _is_missing(value):
+            return ""
+        if isinstance(value, str):
+            return value
+        if self.kind == "date":
+            return value.strftime(self.spec)
+        if isinstance(value, float) and self.printf and self.printf.endswith("d"):
+            value = round(value)
+
+        return format(value, self.spec)
+
+    def format_values(self, values: Sequence[Any]) -> list[str]:
+        """Format Python values one by one."""
+        return [self(value) for value in values]
+
+    def format_polars(self, series: Any) -> list[str]:
+        """Format a polars Series."""
+        dtype = series.dtype
+        if self.kind == "date" and dtype.is_temporal():
+            return series.dt.to_string(self.spec).fill_null("").to_list()
+        if self.kind == "number" and dtype.is_numeric():
+            null_mask = series.is_null().to_numpy()
+            return self._format_numbers(series.fill_null(0).to_numpy(), null_mask)
+
+        return self.format_values(series.to_list())
+
+    def format_pandas(self, series: Any) -> list[str]:
+        """Format a pandas Series."""
+        from pandas.api import types  # type: ignore[import]
+
+        if self.kind == "date" and types.is_datetime64_any_dtype(series.dtype):
+            return series.dt.strftime(self.spec).fillna("").tolist()
+        if (
+            self.kind == "number"
+            and types.is_numeric_dtype(series.dtype)
+            and not types.is_bool_dtype(series.dtype)
+        ):
+            null_mask = series.isna().to_numpy()
+            return self._format_numbers(series.fillna(0).to_numpy(), null_mask)
+
+        return self.format_values(series.tolist())
+
+    def format_arrow(self, column: Any) -> list[str]:
+        """Format a pyarrow Array or ChunkedArray."""
+        import pyarrow as pa  # type: ignore[import]
+        import pyarrow.compute as pc  # type: ignore[import]
+
+        type_ = column.type
+        if self.kind == "date" and pa.types.is_temporal(type_):
+            return pc.fill_null(pc.strftime(column, format=self.spec), "").to_pylist()
+        if self.kind == "number" and (
+            pa.types.is_integer(type_) or pa.types.is_floating(type_)
+        ):
+            null_mask = pc.is_null(column).to_numpy(zero_copy_only=False)
+            values = pc.fill_null(column, 0).to_numpy(zero_copy_only=False)
+            return self._format_numbers(values, null_mask)
+
+        return self.format_values(column.to_pylist())
+
+    def _format_numbers(self, values: Any, null_mask: Any) -> list[str]:
+        import numpy as np
+
+        assert self.printf is not None
+
+        values = np.asarray(values)
+        if values.dtype.kind == "f":
+            null_mask = null_mask | np.isnan(values)
+            values = np.where(null_mask, 0, values)
+
+        if self.printf.endswith("d"):
+            if values.dtype.kind == "f":
+                values = np.rint(values)
+            values = values.astype(np.int64)
+        else:
+            values = values.astype(np.float64) * self.scale
+
+        strings = np.char.mod(self.printf, values)
+        if self.grouping is not None:
+            strings = _group_thousands(strings, self.grouping)
+        if self.suffix:
+            strings = np.char.add(strings, self.suffix)
+
+        strings[null_mask] = ""
+
+        return strings.tolist()
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+
+    # NOTE: Missing values of pandas, compared by name to not import pandas.
+    return type(value).__name__ in ("NaTType", "NAType")
+
+
+def compile_column_formats(
+    column_formats: ColumnFormats, header: Sequence[Any]
+) -> dict[int, ColumnFormatter]:
+    """Compile the formats, resolving column names to column indices."""
+    names = {str(name): index for index, name in enumerate(header)}
+    formatters: dict[int, ColumnFormatter] = {}
+    for column, spec in column_formats.items():
+        if isinstance(column, int):
+            index = column + len(header) if column < 0 else column
+        elif (index := names.get(column)) is None:
+            raise TableColumnNotFoundError(column, list(names))
+
+        formatters[index] = ColumnFormatter(spec)
+
+    return formatters
+
+
+def _group_thousands(strings: Any, separator: str) -> Any:
+    """Insert thousands separators into the integer part of formatted numbers."""
+    import numpy as np
+
+    head, point, tail = np.char.partition(strings, ".").T
+    first = head.astype("<U1")
+    signs = np.where(np.isin(first, ["+", "-", " "]), first, "")
+    digits = np.char.lstrip(head, "+- ")
+
+    # Right-align the digits to a multiple of three characters,
+    # then join the three-character groups with the separator.
+    width = max(3, -(-int(np.char.str_len(digits).max(initial=0)) // 3) * 3)
+    groups = np.char.rjust(digits, width).astype(f"<U{width}").view("<U3")
+    groups = groups.reshape(len(digits), width // 3)
+
+    grouped = groups[:, 0]
+    for index in range(1, width // 3):
+        grouped = np.char.add(np.char.add(grouped, separator), groups[:, index])
+
+    grouped = np.char.lstrip(grouped, " " + separator)
+
+    return np.char.add(np.char.add(signs, grouped), np.char.add(point, tail))
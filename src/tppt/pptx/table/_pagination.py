@@ -0,0 +1,149 @@
+"""Pagination of table data across slides.
+
+The data is split into pages lazily, and each page is converted into strings
+only when its slide is built, so a large DataFrame is never stringified at once.
+"""
+
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, cast
+
+from tppt._features import is_instance_of
+
+from ..converter import to_pptx_length
+from ._stream import RowSource, iter_row_chunks, iter_rows
+
+if TYPE_CHECKING:
+    from tppt._features import (
+        ArrowRecordBatchReader,
+        ArrowTable,
+        PandasDataFrame,
+        PolarsDataFrame,
+        PolarsLazyFrame,
+    )
+
+    from ._format import ColumnFormats
+    from .table import DataFrame, TableProps
+
+_UNREAD = object()
+
+
+class TablePager:
+    """Pages of table data, each of them starting with the header row."""
+
+    def __init__(
+        self,
+        data: "DataFrame | RowSource",
+        rows_per_page: int,
+        column_formats: "ColumnFormats | None" = None,
+        columns: Sequence[str] | None = None,
+    ) -> None:
+        rows_per_page = max(1, rows_per_page)
+        if columns is None:
+            self._chunks = iter_chunks(cast("DataFrame", data), rows_per_page)
+        else:
+            rows = iter_rows(cast("RowSource", data))
+            self._chunks = iter_row_chunks(columns, rows, rows_per_page)
+
+        self._column_formats = column_formats
+        self._next_chunk: Any = _UNREAD
+
+    def has_next_page(self) -> bool:
+        """Whether a page is left."""
+        return self._peek() is not None
+
+    def next_page(self) -> list[list[str]] | None:
+        """Get the rows of the next page, or `None` when all pages are used."""
+        from .table import dataframe2list
+
+        if (chunk := self._peek()) is None:
+            return None
+
+        self._next_chunk = _UNREAD
+
+        return dataframe2list(chunk, self._column_formats)
+
+    def _peek(self) -> Any:
+        # NOTE: The source is read only when the pages are built.
+        if self._next_chunk is _UNREAD:
+            self._next_chunk = next(self._chunks, None)
+
+        return self._next_chunk
+
+
+def get_rows_per_page(props: "TableProps") -> int | None:
+    """Get the number of rows below the header row on one page.
+
+    Returns `None` when the table is not paginated.
+    """
+    limits: list[int] = []
+    if (max_rows := props.get("max_rows_per_slide")) is not None:
+        limits.append(max_rows)
+
+    if (row_height := props.get("row_height")) is not None:
+        fitting_rows = to_pptx_length(props["height"]) // to_pptx_length(row_height)
+        limits.append(int(fitting_rows) - 1)
+
+    return max(1, min(limits)) if limits else None
+
+
+def iter_chunks(data: "DataFrame", size: int) -> Iterator[Any]:
+    """Split the data into chunks of `size` rows without converting them.
+
+    Each chunk has the type of the data, so it keeps its header.
+    At least one chunk is yielded, even for data without rows.
+    """
+    if is_instance_of(data, "polars", "LazyFrame"):
+        data = cast("PolarsLazyFrame", data).collect()
+
+    if is_instance_of(data, "polars", "DataFrame"):
+        polars_df = cast("PolarsDataFrame", data)
+        for offset in range(0, max(polars_df.height, 1), size):
+            yield polars_df.slice(offset, size)
+
+    elif is_instance_of(data, "pandas", "DataFrame"):
+        pandas_df = cast("PandasDataFrame", data)
+        for offset in range(0, max(len(pandas_df), 1), size):
+            yield pandas_df.iloc[offset : offset + size]
+
+    elif is_instance_of(data, "pyarrow", "Table", "RecordBatch"):
+        arrow_table = cast("ArrowTable", data)
+        for offset in range(0, max(arrow_table.num_rows, 1), size):
+            yield arrow_table.slice(offset, size)
+
+    elif is_instance_of(data, "pyarrow", "RecordBatchReader"):
+        yield from _iter_reader_chunks(cast("ArrowRecordBatchReader", data), size)
+
+    elif isinstance(data, list) and data and isinstance(data[0], list | tuple):
+        # A list of lists keeps its header in the first row.
+        header, rows = data[0], data[1:]
+        for offset in range(0, max(len(rows), 1), size):
+            yield [header, *rows[offset : offset + size]]
+
+    elif isinstance(data, list) and data:
+        for offset in range(0, len(data), size):
+            yield data[offset : offset + size]
+
+    else:
+        yield data
+
+
+def _iter_reader_chunks(reader: "ArrowRecordBatchReader", size: int) -> Iterator[Any]:
+    import pyarrow as pa  # type: ignore[import]
+
+    batches: list[Any] = []
+    buffered = 0
+    yielded = False
+    for batch in reader:
+        batches.append(batch)
+        buffered += batch.num_rows
+        while buffered >= size:
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+            yield table.slice(0, size)
+            yielded = True
+
+            rest = table.slice(size)
+            batches = rest.to_batches()
+            buffered = rest.num_rows
+
+    if buffered or not yielded:
+        yield pa.Table.from_batches(batches, schema=reader.schema)
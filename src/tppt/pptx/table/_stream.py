@@ -0,0 +1,162 @@
+"""Streaming of table rows into the table XML.
+
+Rows are read from any iterable, or async iterable, of sequences
+and appended to the table one by one, so the source is never materialized.
+Async rows are read when the presentation is built, by the event loop
+of `abuild` or `asave`, or by a private event loop in `build`.
+"""
+
+import asyncio
+import copy
+from collections.abc import AsyncIterable, Callable, Iterable, Iterator, Sequence
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from tppt.exception import TableStreamInRunningLoopError
+
+from ._format import ColumnFormats, compile_column_formats
+from ._xml import _A_TC, _A_TR, set_cell_text
+
+if TYPE_CHECKING:
+    from pptx.oxml.table import CT_Table, CT_TableCell
+
+T = TypeVar("T")
+
+RowSource = Iterable[Sequence[Any]] | AsyncIterable[Sequence[Any]]
+
+
+def iter_rows(rows: Iterable[T] | AsyncIterable[T]) -> Iterator[T]:
+    """Iterate over the rows, driving an async iterable on a private event loop."""
+    if not isinstance(rows, AsyncIterable):
+        yield from rows
+        return
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise TableStreamInRunningLoopError()
+
+    loop = asyncio.new_event_loop()
+    iterator = aiter(rows)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(anext(iterator))
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def iter_row_chunks(
+    columns: Sequence[str], rows: Iterator[Sequence[Any]], size: int
+) -> Iterator[list[Sequence[Any]]]:
+    """Split the rows into lists of `size` rows, each starting with the header row.
+
+    At least one chunk is yielded, even for a stream without rows.
+    """
+    header = list(columns)
+    yield [header, *islice(rows, size)]
+
+    while chunk := list(islice(rows, size)):
+        yield [header, *chunk]
+
+
+class TableRowWriter:
+    """Writer of the rows of a table, appended after its header row.
+
+    Each new row is a copy of the header row with its text replaced,
+    so it keeps the cell properties of the table.
+    """
+
+    def __init__(
+        self,
+        tbl: "CT_Table",
+        columns: Sequence[str],
+        column_formats: ColumnFormats | None = None,
+    ) -> None:
+        formatters = compile_column_formats(column_formats or {}, columns)
+        self._to_strings: list[Callable[[Any], str]] = [
+            formatters.get(index, _to_string) for index in range(len(columns))
+        ]
+
+        self._last_tr = next(tbl.iterchildren(_A_TR))
+        for tc, column in zip(self._last_tr.iterchildren(_A_TC), columns):
+            set_cell_text(cast("CT_TableCell", tc), str(column))
+
+        self._template_tr = copy.deepcopy(self._last_tr)
+        for tc in self._template_tr.iterchildren(_A_TC):
+            set_cell_text(cast("CT_TableCell", tc), "")
+
+        self.count = 1
+        """Number of rows of the table, including the header row."""
+
+    def write(self, row: Sequence[Any]) -> None:
+        """Append a row to the table."""
+        tr = copy.deepcopy(self._template_tr)
+        for tc, to_string, value in zip(tr.iterchildren(_A_TC), self._to_strings, row):
+            set_cell_text(cast("CT_TableCell", tc), to_string(value))
+
+        self._last_tr.addnext(tr)
+        self._last_tr = tr
+        self.count += 1
+
+
+def write_table_rows(
+    tbl: "CT_Table",
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    column_formats: ColumnFormats | None = None,
+) -> int:
+    """Write the header into the first row, then append a row per item.
+
+    Returns the number of rows of the table, including the header row.
+    """
+    writer = TableRowWriter(tbl, columns, column_formats)
+    for row in rows:
+        writer.write(row)
+
+    return writer.count
+
+
+class PendingTableRows:
+    """Async rows of a table, written when the presentation is built."""
+
+    def __init__(
+        self,
+        tbl: "CT_Table",
+        rows: AsyncIterable[Sequence[Any]],
+        writer: TableRowWriter,
+        height: int,
+    ) -> None:
+        self._tbl = tbl
+        self._rows = rows
+        self._writer = writer
+        self._height = height
+
+    def write(self) -> None:
+        """Write the rows, reading them on a private event loop."""
+        for row in iter_rows(self._rows):
+            self._writer.write(row)
+        distribute_row_heights(self._tbl, self._height)
+
+    async def awrite(self) -> None:
+        """Write the rows, reading them on the running event loop."""
+        async for row in self._rows:
+            self._writer.write(row)
+        distribute_row_heights(self._tbl, self._height)
+
+
+def distribute_row_heights(tbl: "CT_Table", height: int) -> None:
+    """Give all rows the same height, so that they fill the table height."""
+    trs = list(tbl.iterchildren(_A_TR))
+    row_height = str(height // len(trs))
+    for tr in trs:
+        tr.set("h", row_height)
+
+
+def _to_string(value: Any) -> str:
+    return "" if value is None else str(value)
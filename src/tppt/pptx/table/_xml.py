@@ -0,0 +1,319 @@
+"""Direct XML writers for table contents and styles.
+
+These functions bypass the python-pptx `_Cell`/`TextFrame` proxies
+and produce the same XML as setting `cell.text` one cell at a time.
+"""
+
+import copy
+import re
+from collections.abc import Hashable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, assert_never, cast
+
+from lxml import etree
+from pptx.oxml.ns import qn
+
+from ..converter import to_pptx_length, to_pptx_rgb_color
+
+if TYPE_CHECKING:
+    from pptx.oxml.table import CT_Table, CT_TableCell
+    from pptx.oxml.text import CT_RegularTextRun, CT_TextParagraph
+
+    from tppt.types._color import Color, LiteralColor
+
+    from .table import TableCellStyle, TableStyleRule
+
+_A_P = qn("a:p")
+_A_R = qn("a:r")
+_A_T = qn("a:t")
+_A_TC = qn("a:tc")
+_A_TR = qn("a:tr")
+_A_TX_BODY = qn("a:txBody")
+
+# Text that python-pptx splits into line breaks or escapes.
+_SPECIAL_CHARS = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+
+def write_table_data(tbl: "CT_Table", data: Iterable[Sequence[Any]]) -> None:
+    """Write the data into the cells of the table in one pass.
+
+    Rows and columns that do not fit in the table are ignored.
+    """
+    for tr, row in zip(tbl.iterchildren(_A_TR), data):
+        for tc, value in zip(tr.iterchildren(_A_TC), row):
+            set_cell_text(cast("CT_TableCell", tc), str(value))
+
+
+def set_cell_text(tc: "CT_TableCell", text: str) -> None:
+    """Replace the paragraphs of the cell by the text."""
+    tx_body = tc.find(_A_TX_BODY)
+    if tx_body is None:
+        tx_body = tc.get_or_add_txBody()
+
+    for p in tx_body.findall(_A_P):
+        tx_body.remove(p)
+
+    for line in text.split("\n"):
+        p = etree.SubElement(tx_body, _A_P)
+        if not line:
+            continue
+
+        if _SPECIAL_CHARS.search(line):
+            cast("CT_TextParagraph", p).append_text(line)
+        else:
+            etree.SubElement(etree.SubElement(p, _A_R), _A_T).text = line
+
+
+_TC_PR_ORDER = tuple(
+    qn(f"a:{tag}")
+    for tag in (
+        "lnL",
+        "lnR",
+        "lnT",
+        "lnB",
+        "lnTlToBr",
+        "lnBlToTr",
+        "cell3D",
+        "noFill",
+        "solidFill",
+        "gradFill",
+        "blipFill",
+        "pattFill",
+        "grpFill",
+        "headers",
+        "extLst",
+    )
+)
+
+_R_PR_ORDER = tuple(
+    qn(f"a:{tag}")
+    for tag in (
+        "ln",
+        "noFill",
+        "solidFill",
+        "gradFill",
+        "blipFill",
+        "pattFill",
+        "grpFill",
+        "effectLst",
+        "effectDag",
+        "highlight",
+        "uLnTx",
+        "uLn",
+        "uFillTx",
+        "uFill",
+        "latin",
+        "ea",
+        "cs",
+        "sym",
+        "hlinkClick",
+        "hlinkMouseOver",
+        "rtl",
+        "extLst",
+    )
+)
+
+_FILL_TAGS = frozenset(
+    qn(f"a:{tag}")
+    for tag in ("noFill", "solidFill", "gradFill", "blipFill", "pattFill", "grpFill")
+)
+
+_TEXT_ALIGN = {
+    "left": "l",
+    "center": "ctr",
+    "right": "r",
+    "justify": "just",
+}
+
+_VERTICAL_ALIGN = {
+    "top": "t",
+    "middle": "ctr",
+    "bottom": "b",
+}
+
+
+class CompiledCellStyle:
+    """Cell style compiled once into XML fragments, then stamped onto cells."""
+
+    def __init__(self, style: "TableCellStyle") -> None:
+        self.tc_pr_children: list[etree._Element] = []
+        """Children of `a:tcPr` in schema order."""
+
+        self.r_pr_children: list[etree._Element] = []
+        """Children of `a:rPr` in schema order."""
+
+        self.r_pr_attrib: dict[str, str] = {}
+        """Attributes of `a:rPr`."""
+
+        self.anchor = _VERTICAL_ALIGN.get(style.get("vertical_align", ""))
+        """Attribute `anchor` of `a:bodyPr`."""
+
+        self.algn = _TEXT_ALIGN.get(style.get("text_align", ""))
+        """Attribute `algn` of the first `a:pPr`."""
+
+        self.has_font = any(
+            key in style
+            for key in ("bold", "italic", "font_size", "font_color", "font_name")
+        )
+        """Whether the first run of the cell has to be styled."""
+
+        if (border := style.get("border")) is not None:
+            color = border.get("color")
+            width = border.get("width")
+            for side in ("lnL", "lnR", "lnT", "lnB"):
+                ln = etree.Element(qn(f"a:{side}"))
+                if width is not None:
+                    ln.set("w", str(int(to_pptx_length(width))))
+                if color is not None:
+                    ln.append(_solid_fill(color))
+                self.tc_pr_children.append(ln)
+
+        if (fill_color := style.get("fill_color")) is not None:
+            self.tc_pr_children.append(_solid_fill(fill_color))
+
+        if "bold" in style:
+            self.r_pr_attrib["b"] = "1" if style["bold"] else "0"
+
+        if "italic" in style:
+            self.r_pr_attrib["i"] = "1" if style["italic"] else "0"
+
+        if "font_size" in style:
+            self.r_pr_attrib["sz"] = str(
+                int(to_pptx_length(style["font_size"]).centipoints)
+            )
+
+        if (font_color := style.get("font_color")) is not None:
+            self.r_pr_children.append(_solid_fill(font_color))
+
+        if "font_name" in style:
+            latin = etree.Element(qn("a:latin"))
+            latin.set("typeface", style["font_name"])
+            self.r_pr_children.append(latin)
+
+    def stamp(self, tc: "CT_TableCell") -> None:
+        """Apply the style to the cell."""
+        if self.tc_pr_children:
+            tc_pr = tc.get_or_add_tcPr()
+            for child in self.tc_pr_children:
+                _replace_child(tc_pr, child, _TC_PR_ORDER)
+
+        if self.anchor is None and self.algn is None and not self.has_font:
+            return
+
+        tx_body = tc.get_or_add_txBody()
+        if self.anchor is not None:
+            tx_body.bodyPr.set("anchor", self.anchor)
+
+        p = cast("CT_TextParagraph | None", tx_body.find(_A_P))
+        if p is None:
+            p = cast("CT_TextParagraph", etree.SubElement(tx_body, _A_P))
+
+        if self.algn is not None:
+            p.get_or_add_pPr().set("algn", self.algn)
+
+        if self.has_font:
+            r = cast("CT_RegularTextRun | None", p.find(_A_R))
+            if r is None:
+                r = p.add_r()
+
+            r_pr = r.get_or_add_rPr()
+            for key, value in self.r_pr_attrib.items():
+                r_pr.set(key, value)
+            for child in self.r_pr_children:
+                _replace_child(r_pr, child, _R_PR_ORDER)
+
+
+def style_key(style: "TableCellStyle") -> Hashable:
+    """Get a hashable key identifying the content of the style."""
+    return _freeze(style)
+
+
+def apply_cell_styles(
+    tbl: "CT_Table", cell_styles: "Sequence[Sequence[TableCellStyle]]"
+) -> None:
+    """Apply a dense grid of cell styles, compiling each distinct style once."""
+    compiled: dict[Hashable, CompiledCellStyle] = {}
+    for tr, row_styles in zip(tbl.iterchildren(_A_TR), cell_styles):
+        for tc, style in zip(tr.iterchildren(_A_TC), row_styles):
+            key = style_key(style)
+            if (compiled_style := compiled.get(key)) is None:
+                compiled_style = compiled[key] = CompiledCellStyle(style)
+            compiled_style.stamp(cast("CT_TableCell", tc))
+
+
+def apply_style_rules(tbl: "CT_Table", style_rules: "Sequence[TableStyleRule]") -> None:
+    """Apply style rules in order, so later rules override earlier ones."""
+    grid = [list(tr.iterchildren(_A_TC)) for tr in tbl.iterchildren(_A_TR)]
+    row_count = len(grid)
+    col_count = len(grid[0]) if grid else 0
+
+    for rule in style_rules:
+        compiled_style = CompiledCellStyle(rule["style"])
+        rows = _select(rule.get("rows"), row_count)
+        cols = _select(rule.get("cols"), col_count)
+
+        match rule.get("band"):
+            case "even_rows":
+                rows = [i for i in rows if i % 2 == 0]
+            case "odd_rows":
+                rows = [i for i in rows if i % 2 == 1]
+            case "even_cols":
+                cols = [j for j in cols if j % 2 == 0]
+            case "odd_cols":
+                cols = [j for j in cols if j % 2 == 1]
+            case None:
+                pass
+            case _:
+                assert_never(rule["band"])
+
+        for i in rows:
+            row = grid[i]
+            for j in cols:
+                compiled_style.stamp(cast("CT_TableCell", row[j]))
+
+
+def _select(selector: int | slice | None, count: int) -> Sequence[int]:
+    match selector:
+        case None:
+            return range(count)
+        case int():
+            index = selector + count if selector < 0 else selector
+            return [index] if 0 <= index < count else []
+        case slice():
+            return range(*selector.indices(count))
+        case _:
+            assert_never(selector)
+
+
+def _solid_fill(color: "Color | LiteralColor") -> etree._Element:
+    rgb, _ = to_pptx_rgb_color(color)
+    solid_fill = etree.Element(qn("a:solidFill"))
+    etree.SubElement(solid_fill, qn("a:srgbClr")).set("val", str(rgb))
+    return solid_fill
+
+
+def _replace_child(
+    parent: etree._Element, child: etree._Element, order: tuple[str, ...]
+) -> None:
+    """Insert a copy of the child in schema order, replacing the same kind of element."""
+    tag = child.tag
+    kinds = _FILL_TAGS if tag in _FILL_TAGS else frozenset((tag,))
+    for existing in parent:
+        if existing.tag in kinds:
+            parent.remove(existing)
+            break
+
+    position = order.index(tag)
+    for index, existing in enumerate(parent):
+        if existing.tag in order and order.index(existing.tag) > position:
+            parent.insert(index, copy.deepcopy(child))
+            return
+
+    parent.append(copy.deepcopy(child))
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
@@ -4,6 +4,7 @@ import logging
 from collections.abc import Iterator
 from dataclasses import fields, is_dataclass
 from typing import (
+    TYPE_CHECKING,
     Any,
     Literal,
     NotRequired,
@@ -13,48 +14,63 @@ from typing import (
     cast,
 )
 
-from pptx.enum.text import MSO_VERTICAL_ANCHOR, PP_ALIGN
 from pptx.table import Table as PptxTable
-from pptx.table import _Cell as PptxCell
 from pptx.table import _Column as PptxColumn
 from pptx.table import _ColumnCollection as PptxColumnCollection
 from pptx.table import _Row as PptxRow
 from pptx.table import _RowCollection as PptxRowCollection
 
-from tppt._features import (
-    USE_PANDAS,
-    USE_POLARS,
-    USE_PYDANTIC,
-    Dataclass,
-    PandasDataFrame,
-    PolarsDataFrame,
-    PolarsLazyFrame,
-    PydanticModel,
-)
+from tppt._features import is_instance_of
 from tppt.types._color import Color, LiteralColor
 from tppt.types._length import Length, LiteralLength, LiteralPoints, Points
 
 from ..converter import (
     PptxConvertible,
     to_pptx_length,
-    to_pptx_rgb_color,
     to_tppt_length,
 )
 from ..shape import RangeProps
+from ._columnar import (
+    arrow2list,
+    arrow_reader2list,
+    pandas2list,
+    polars2list,
+    records2list,
+)
+from ._format import ColumnFormats
+from ._xml import apply_cell_styles, apply_style_rules, write_table_data
 from .cell import Cell
 
 logger = logging.getLogger(__name__)
 
 
 # Define DataFrame type alias
-DataFrame: TypeAlias = (
-    list[list[str]]
-    | list[Dataclass]
-    | list[PydanticModel]
-    | PandasDataFrame
-    | PolarsDataFrame
-    | PolarsLazyFrame
-)
+if TYPE_CHECKING:
+    from tppt._features import (
+        ArrowRecordBatch,
+        ArrowRecordBatchReader,
+        ArrowTable,
+        Dataclass,
+        PandasDataFrame,
+        PolarsDataFrame,
+        PolarsLazyFrame,
+        PydanticModel,
+    )
+
+    DataFrame: TypeAlias = (
+        list[list[str]]
+        | list[Dataclass]
+        | list[PydanticModel]
+        | PandasDataFrame
+        | PolarsDataFrame
+        | PolarsLazyFrame
+        | ArrowTable
+        | ArrowRecordBatch
+        | ArrowRecordBatchReader
+    )
+else:
+    # NOTE: The optional libraries are not imported at runtime.
+    DataFrame: TypeAlias = list[list[str]] | list[Any] | Any
 
 
 class TableBorderStyle(TypedDict):
@@ -78,11 +94,43 @@ class TableCellStyle(TypedDict):
     font_name: NotRequired[str]
 
 
+class TableStyleRule(TypedDict):
+    """Style rule applied to a range of table cells.
+
+    Without `rows` and `cols`, the rule applies to all cells.
+    Giving both of them selects a rectangular range.
+    """
+
+    style: TableCellStyle
+    rows: NotRequired[int | slice]
+    cols: NotRequired[int | slice]
+    band: NotRequired[Literal["even_rows", "odd_rows", "even_cols", "odd_cols"]]
+
+
 class TableProps(RangeProps):
     """Table properties."""
 
     cell_styles: NotRequired[list[list[TableCellStyle]]]
+    style_rules: NotRequired[list[TableStyleRule]]
     first_row_header: NotRequired[bool]
+    column_formats: NotRequired[ColumnFormats]
+    """Format of the values of each column, keyed by column name or index.
+
+    A format is a Python format spec like `",.2f"` or `".1%"`,
+    or a `strftime` format like `"%Y-%m-%d"`.
+    """
+    max_rows_per_slide: NotRequired[int]
+    """Maximum number of rows below the header row on one slide.
+
+    The rest of the rows continue on new slides of the same layout,
+    with the header row repeated.
+    """
+    row_height: NotRequired[Length | LiteralLength]
+    """Height of each row.
+
+    The rows that do not fit in the table height continue on new slides,
+    like `max_rows_per_slide`.
+    """
 
 
 class TableData(TableProps):
@@ -176,90 +224,15 @@ class Table(PptxConvertible[PptxTable]):
 
         # Apply table data if provided
         if data := props.get("data"):
-            # Now apply the data to the table
-            for i, row in enumerate(data):
-                if i < len(table.rows):
-                    for j, cell_text in enumerate(row):
-                        if j < len(table.columns):
-                            table.cell(i, j).text = str(cell_text)
+            write_table_data(table._tbl, data)
 
         # Apply cell styles if provided
         if (cell_styles := props.get("cell_styles")) is not None:
-            for i, row_styles in enumerate(cell_styles):
-                if i < len(table.rows):
-                    for j, cell_style in enumerate(row_styles):
-                        if j < len(table.columns):
-                            cell = table.cell(i, j)
-
-                            # Apply fill color
-                            if (fill_color := cell_style.get("fill_color")) is not None:
-                                rgb, _ = to_pptx_rgb_color(fill_color)
-                                cell.fill.solid()
-                                cell.fill.fore_color.rgb = rgb
-
-                            # Apply border
-                            if (border := cell_style.get("border")) is not None:
-                                _apply_cell_border(cell, border)
-
-                            if (text_align := cell_style.get("text_align")) is not None:
-                                align_map = {
-                                    "left": PP_ALIGN.LEFT,
-                                    "center": PP_ALIGN.CENTER,
-                                    "right": PP_ALIGN.RIGHT,
-                                    "justify": PP_ALIGN.JUSTIFY,
-                                }
-                                paragraph = cell.text_frame.paragraphs[0]
-                                paragraph.alignment = align_map[text_align]
-
-                            if (
-                                vertical_align := cell_style.get("vertical_align")
-                            ) is not None:
-                                valign_map = {
-                                    "top": MSO_VERTICAL_ANCHOR.TOP,
-                                    "middle": MSO_VERTICAL_ANCHOR.MIDDLE,
-                                    "bottom": MSO_VERTICAL_ANCHOR.BOTTOM,
-                                }
-                                cell.text_frame.vertical_anchor = valign_map[
-                                    vertical_align
-                                ]
-
-                            # Apply text formatting
-                            if any(
-                                key in cell_style
-                                for key in [
-                                    "bold",
-                                    "italic",
-                                    "font_size",
-                                    "font_color",
-                                    "font_name",
-                                ]
-                            ):
-                                paragraph = cell.text_frame.paragraphs[0]
-                                run = (
-                                    paragraph.runs[0]
-                                    if paragraph.runs
-                                    else paragraph.add_run()
-                                )
-
-                                if "bold" in cell_style:
-                                    run.font.bold = cell_style["bold"]
-
-                                if "italic" in cell_style:
-                                    run.font.italic = cell_style["italic"]
-
-                                if "font_size" in cell_style:
-                                    run.font.size = to_pptx_length(
-                                        cell_style["font_size"]
-                                    )
-
-                                if (
-                                    font_color := cell_style.get("font_color")
-                                ) is not None:
-                                    rgb, _ = to_pptx_rgb_color(font_color)
-                                    run.font.color.rgb = rgb
-
-                                if "font_name" in cell_style:
-                                    run.font.name = cell_style["font_name"]
+            apply_cell_styles(table._tbl, cell_styles)
+
+        # Apply style rules if provided
+        if (style_rules := props.get("style_rules")) is not None:
+            apply_style_rules(table._tbl, style_rules)
 
     def cell(self, row_idx: int, col_idx: int) -> Cell:
         """Get cell at row_idx and col_idx."""
@@ -364,69 +337,28 @@ class Table(PptxConvertible[PptxTable]):
         return (Cell(cell) for cell in self._pptx.iter_cells())
 
 
-def _apply_cell_border(cell: PptxCell, border: TableBorderStyle) -> None:
-    """Apply border style to a table cell using OOXML XML manipulation."""
-    from lxml.etree import _Element
-
-    from pptx.oxml.ns import _nsmap as namespace
-    from pptx.oxml.xmlchemy import OxmlElement
-
-    tc = cast(_Element, cell._tc)
-    tcPr = tc.find("a:tcPr", namespace)
-    if tcPr is None:
-        tcPr = OxmlElement("a:tcPr")
-        tc.insert(0, tcPr)
-
-    border_color = border.get("color")
-    border_width = border.get("width")
-
-    rgb = None
-    if border_color is not None:
-        rgb, _ = to_pptx_rgb_color(border_color)
-
-    width_emu = None
-    if border_width is not None:
-        width_emu = to_pptx_length(border_width)
-
-    for side in ("lnL", "lnR", "lnT", "lnB"):
-        ln = OxmlElement(f"a:{side}")
-        if width_emu is not None:
-            ln.attrib["w"] = str(int(width_emu))
-        if rgb is not None:
-            solid_fill = OxmlElement("a:solidFill")
-            srgb_clr = OxmlElement("a:srgbClr")
-            srgb_clr.attrib["val"] = str(rgb)
-            solid_fill.append(srgb_clr)
-            ln.append(solid_fill)
-
-        # Remove existing border element for this side
-        existing = tcPr.find(f"a:{side}", namespace)
-        if existing is not None:
-            tcPr.remove(existing)
-        tcPr.append(ln)
-
-
-def dataframe2list(data: DataFrame) -> list[list[str]]:
-    """Convert different DataFrame types to list of lists."""
-    if USE_POLARS:
-        if isinstance(data, PolarsLazyFrame):
-            # For LazyFrame, collect it first
-            polars_df = cast(PolarsLazyFrame, data).collect()
-            columns = list(polars_df.columns)
-            rows = polars_df.to_numpy().tolist()
-            return [columns] + rows
-        elif isinstance(data, PolarsDataFrame):
-            polars_df = cast(PolarsDataFrame, data)
-            columns = list(polars_df.columns)
-            rows = polars_df.to_numpy().tolist()
-            return [columns] + rows
-
-    if USE_PANDAS and isinstance(data, PandasDataFrame):  # type: ignore
-        # Convert pandas DataFrame to list of lists
-        pandas_df = cast(PandasDataFrame, data)
-        columns = pandas_df.columns.tolist()
-        rows = pandas_df.values.tolist()
-        return [columns] + rows
+def dataframe2list(
+    data: DataFrame, column_formats: ColumnFormats | None = None
+) -> list[list[str]]:
+    """Convert different DataFrame types to list of lists.
+
+    DataFrames are converted column by column into strings,
+    and missing values become empty strings.
+    The column formats apply to all rows except the header row.
+    """
+    if is_instance_of(data, "polars", "LazyFrame"):
+        # For LazyFrame, collect it first
+        return polars2list(cast("PolarsLazyFrame", data).collect(), column_formats)
+    elif is_instance_of(data, "polars", "DataFrame"):
+        return polars2list(cast("PolarsDataFrame", data), column_formats)
+
+    if is_instance_of(data, "pandas", "DataFrame"):
+        return pandas2list(cast("PandasDataFrame", data), column_formats)
+
+    if is_instance_of(data, "pyarrow", "Table", "RecordBatch"):
+        return arrow2list(cast("ArrowTable | ArrowRecordBatch", data), column_formats)
+    elif is_instance_of(data, "pyarrow", "RecordBatchReader"):
+        return arrow_reader2list(cast("ArrowRecordBatchReader", data), column_formats)
 
     if isinstance(data, list):
         if len(data) != 0:
@@ -434,23 +366,28 @@ def dataframe2list(data: DataFrame) -> list[list[str]]:
             first_instance = data[0]
             if is_dataclass(first_instance):
                 columns = [field.name for field in fields(first_instance)]
-                rows = []
-                for instance in data:
-                    instance = cast(Any, instance)
-                    row = [
-                        str(getattr(instance, field.name)) for field in fields(instance)
-                    ]
-                    rows.append(row)
-                return [columns] + rows
+                return records2list(
+                    columns,
+                    (
+                        [getattr(instance, column) for column in columns]
+                        for instance in data
+                    ),
+                    column_formats,
+                )
             # Convert list of Pydantic model instances to list of lists
-            elif USE_PYDANTIC and isinstance(first_instance, PydanticModel):
+            elif is_instance_of(first_instance, "pydantic", "BaseModel"):
                 columns = list(first_instance.__class__.model_fields.keys())  # type: ignore
-                rows = []
-                for instance in data:
-                    instance = cast(Any, instance)
-                    row = [str(getattr(instance, field)) for field in columns]
-                    rows.append(row)
-                return [columns] + rows
+                return records2list(
+                    columns,
+                    (
+                        [getattr(instance, column) for column in columns]
+                        for instance in data
+                    ),
+                    column_formats,
+                )
+            # Format the rows after the header row of a list of lists
+            elif column_formats:
+                return records2list(data[0], data[1:], column_formats)
         else:
             logger.warning("Empty data of table")
             return []
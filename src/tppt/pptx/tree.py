@@ -1,4 +1,4 @@
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.presentation import Presentation as PptxPresentation
@@ -216,8 +216,19 @@ def slide_to_dict(slide: Slide) -> dict[str, Any]:
     return slide_data
 
 
-def ppt2tree(ppt: PptxPresentation) -> dict[str, Any]:
-    """Convert presentation information to dictionary"""
+def ppt2tree(
+    ppt: PptxPresentation, engine: Literal["xml", "python-pptx"] = "xml"
+) -> dict[str, Any]:
+    """Convert presentation information to dictionary
+
+    The "xml" engine reads the XML of the parts directly,
+    and the "python-pptx" engine walks the python-pptx objects.
+    Both give the same dictionary, but the "xml" engine is much faster on large decks.
+    """
+    if engine == "xml":
+        from tppt.pptx._tree_xml import ppt2tree_xml
+
+        return ppt2tree_xml(ppt)
 
     # Safely get the slide size
     slide_width = None
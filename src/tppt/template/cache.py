@@ -0,0 +1,65 @@
+"""Process-wide cache of parsed slide master templates."""
+
+import copy
+import os
+from typing import TYPE_CHECKING, Literal
+
+from tppt._cache import CacheInfo, LRUCache
+from tppt.types import FilePath
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation as PptxPresentation
+
+
+TemplateCacheKey = tuple[str, int, int]
+
+
+class TemplateCache:
+    """LRU cache of parsed template packages.
+
+    The parsed package is kept once per template, and every call of `get`
+    returns an independent deep copy of it, so builders never share XML trees.
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        self._cache: LRUCache[TemplateCacheKey, PptxPresentation] = LRUCache(maxsize)
+
+    def get(self, source: Literal["default"] | FilePath) -> "PptxPresentation":
+        """Get an independent copy of the parsed template."""
+
+        def load() -> "PptxPresentation":
+            import pptx
+
+            return pptx.Presentation(None if source == "default" else os.fspath(source))
+
+        return _copy_presentation(self._cache.get(_make_key(source), load))
+
+    def put(self, key: TemplateCacheKey, template: "PptxPresentation") -> None:
+        """Store a parsed template under the key."""
+        self._cache.put(key, template)
+
+    def cache_info(self) -> CacheInfo:
+        """Get the cache statistics."""
+        return self._cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        self._cache.cache_clear()
+
+
+def _make_key(source: Literal["default"] | FilePath) -> TemplateCacheKey:
+    if source == "default":
+        return ("default", 0, 0)
+
+    path = os.path.abspath(os.fspath(source))
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _copy_presentation(template: "PptxPresentation") -> "PptxPresentation":
+    package = copy.deepcopy(template.part.package)
+    return package.presentation_part.presentation
+
+
+template_cache = TemplateCache()
+"""Default template cache used by `PresentationBuilder`."""
@@ -1,5 +1,7 @@
+import functools
 from collections import OrderedDict
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -15,6 +17,7 @@ from typing import (
 from typing_extensions import dataclass_transform
 
 from tppt.exception import (
+    SlideLayoutIndexError,
     SlideMasterAttributeMustBeSlideLayoutError,
     SlideMasterAttributeNotFoundError,
     SlideMasterDoesNotHaveAttributesError,
@@ -28,7 +31,7 @@ from .slide_layout import (
 )
 
 if TYPE_CHECKING:
-    from ..pptx.presentation import Presentation
+    from pptx.slide import SlideLayouts as PptxSlideLayouts
 
 
 GenericSlideMaster = TypeVar("GenericSlideMaster", bound="type[SlideMaster]")
@@ -127,21 +130,29 @@ def slide_master(
 
 
 class SlideMasterProxy:
-    def __init__(self, origin: type[SlideMaster], presentation: "Presentation") -> None:
+    def __init__(
+        self, origin: type[SlideMaster], slide_layouts: "PptxSlideLayouts"
+    ) -> None:
+        from ..pptx.slide_layout import SlideLayout as PptxConvertibleSlideLayout
+
         self._slide_master = origin
-        self._presentation = presentation
+        self._pptx_slide_layouts = slide_layouts
+        self._slide_layouts = [
+            PptxConvertibleSlideLayout.from_pptx(slide_layout)
+            for slide_layout in slide_layouts
+        ]
+        self._slide_layout_indices = get_slide_layout_indices(origin)
 
     def __getattr__(self, key: str) -> SlideLayoutProxy:
-        for i, (key2, slide_layout) in enumerate(
-            get_slide_layouts(self._slide_master).items()
-        ):
-            if key2 == key:
-                return SlideLayoutProxy(
-                    slide_layout, self._presentation.slide_master.slide_layouts[i]
-                )
-        else:
+        if (entry := self._slide_layout_indices.get(key)) is None:
             raise SlideMasterAttributeNotFoundError(key)
 
+        index, slide_layout = entry
+        if index >= len(self._slide_layouts):
+            raise SlideLayoutIndexError(index, self._pptx_slide_layouts)
+
+        return SlideLayoutProxy(slide_layout, self._slide_layouts[index])
+
 
 GenericTpptSlideMaster = TypeVar(
     "GenericTpptSlideMaster",
@@ -153,7 +164,21 @@ def get_slide_layouts(
     slide_master: type[SlideMaster],
 ) -> OrderedDict[str, type[SlideLayout]]:
     """Get an array of slides tagged with Layout."""
-    layouts = OrderedDict()
+    return OrderedDict(
+        (key, slide_layout)
+        for key, (_, slide_layout) in get_slide_layout_indices(slide_master).items()
+    )
+
+
+@functools.cache
+def get_slide_layout_indices(
+    slide_master: type[SlideMaster],
+) -> "MappingProxyType[str, tuple[int, type[SlideLayout]]]":
+    """Get the index in the slide master and the layout type of each Layout.
+
+    The result is computed once per slide master class.
+    """
+    layouts: dict[str, tuple[int, type[SlideLayout]]] = {}
 
     for attr_name, annotation in slide_master.__annotations__.items():
         origin = get_origin(annotation)
@@ -162,6 +187,9 @@ def get_slide_layouts(
             # Identify Layout using class comparison instead of string name
             if len(args) > 1:
                 if args[1].__class__ is Layout:
-                    layouts[attr_name] = getattr(slide_master, attr_name)
+                    layouts[attr_name] = (
+                        len(layouts),
+                        getattr(slide_master, attr_name),
+                    )
 
-    return layouts
+    return MappingProxyType(layouts)
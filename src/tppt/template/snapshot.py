@@ -0,0 +1,182 @@
+"""Snapshots of parsed templates, to seed the template cache of other processes.
+
+A snapshot keeps the serialized parts of a template and their relationships
+in one uncompressed pickle, so that loading it skips the zip archive,
+the content types and the relationship XML of the template file.
+
+Snapshots are pickles: only load snapshots written by a trusted process.
+"""
+
+import os
+import pickle
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING, Literal
+
+from tppt.exception import TemplateSnapshotVersionError
+from tppt.types import FilePath
+
+from .cache import TemplateCache, TemplateCacheKey, _make_key, template_cache
+
+if TYPE_CHECKING:
+    from pptx.opc.package import Part as PptxPart
+    from pptx.opc.package import _Relationships as PptxRelationships
+    from pptx.presentation import Presentation as PptxPresentation
+
+    from tppt.pptx._slide_copy import PartPayload, RelPayload
+
+_MAGIC = b"TPPTSNAP"
+
+SNAPSHOT_FORMAT = 1
+"""Version of the snapshot format."""
+
+
+@dataclass(frozen=True)
+class TemplateSnapshot:
+    """Parts of a parsed template.
+
+    Internal relationships target the index of a part in `parts`.
+    """
+
+    key: TemplateCacheKey
+    """Key of the template in the template cache."""
+
+    versions: tuple[int, str]
+    """Versions of the snapshot format and of python-pptx that wrote it."""
+
+    parts: "tuple[PartPayload, ...]"
+
+    rels: "tuple[RelPayload, ...]"
+    """Relationships of the package."""
+
+
+def dump_template_snapshot(
+    source: Literal["default"] | FilePath,
+    file: FilePath | IO[bytes],
+    cache: TemplateCache | None = None,
+) -> None:
+    """Write a snapshot of the parsed template, loading it through the cache."""
+    snapshot = _export((cache or template_cache).get(source), _make_key(source))
+
+    if isinstance(file, os.PathLike | str):
+        with open(file, "wb") as f:
+            _write(snapshot, f)
+    else:
+        _write(snapshot, file)
+
+
+def load_template_snapshot(
+    file: FilePath | IO[bytes],
+    cache: TemplateCache | None = None,
+) -> TemplateCacheKey:
+    """Put the template of the snapshot into the cache, returning its key.
+
+    A template file changed since the snapshot was written has another key,
+    so the cache parses the file again instead of using the stale snapshot.
+    """
+    if isinstance(file, os.PathLike | str):
+        with open(file, "rb") as f:
+            snapshot = _read(f)
+    else:
+        snapshot = _read(file)
+
+    (cache or template_cache).put(snapshot.key, _restore(snapshot))
+
+    return snapshot.key
+
+
+def _versions() -> tuple[int, str]:
+    import pptx
+
+    return (SNAPSHOT_FORMAT, pptx.__version__)
+
+
+def _write(snapshot: TemplateSnapshot, file: IO[bytes]) -> None:
+    file.write(_MAGIC)
+    pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _read(file: IO[bytes]) -> TemplateSnapshot:
+    if file.read(len(_MAGIC)) != _MAGIC:
+        raise TemplateSnapshotVersionError(None, _versions())
+
+    snapshot = pickle.load(file)
+    if not isinstance(snapshot, TemplateSnapshot) or snapshot.versions != _versions():
+        raise TemplateSnapshotVersionError(
+            getattr(snapshot, "versions", None), _versions()
+        )
+
+    return snapshot
+
+
+def _export(template: "PptxPresentation", key: TemplateCacheKey) -> TemplateSnapshot:
+    from tppt.pptx._slide_copy import PartPayload
+
+    package = template.part.package
+    parts = list(package.iter_parts())
+    indices = {part: index for index, part in enumerate(parts)}
+
+    return TemplateSnapshot(
+        key,
+        _versions(),
+        tuple(
+            PartPayload(
+                str(part.partname),
+                part.content_type,
+                part.blob,
+                _export_rels(part.rels, indices),
+            )
+            for part in parts
+        ),
+        _export_rels(package._rels, indices),
+    )
+
+
+def _export_rels(
+    rels: "PptxRelationships", indices: "dict[PptxPart, int]"
+) -> "tuple[RelPayload, ...]":
+    from tppt.pptx._slide_copy import RelPayload
+
+    return tuple(
+        RelPayload(
+            r_id,
+            rel.reltype,
+            rel.target_ref if rel.is_external else indices[rel.target_part],
+            rel.is_external,
+        )
+        for r_id, rel in rels.items()
+    )
+
+
+def _restore(snapshot: TemplateSnapshot) -> "PptxPresentation":
+    from pptx.opc.package import PartFactory
+    from pptx.opc.packuri import PackURI
+    from pptx.package import Package
+
+    package = Package(os.devnull)
+    parts = [
+        PartFactory(PackURI(part.partname), part.content_type, package, part.blob)
+        for part in snapshot.parts
+    ]
+    for part, payload in zip(parts, snapshot.parts):
+        _restore_rels(part.rels, payload.rels, parts)
+    _restore_rels(package._rels, snapshot.rels, parts)
+
+    return package.presentation_part.presentation
+
+
+def _restore_rels(
+    rels: "PptxRelationships",
+    payloads: "tuple[RelPayload, ...]",
+    parts: "list[PptxPart]",
+) -> None:
+    from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+    from pptx.opc.package import _Relationship
+
+    for rel in payloads:
+        rels._rels[rel.r_id] = _Relationship(
+            rels._base_uri,
+            rel.r_id,
+            rel.reltype,
+            RTM.EXTERNAL if rel.is_external else RTM.INTERNAL,
+            rel.target if rel.is_external else parts[rel.target],  # type: ignore[index]
+        )
@@ -1,9 +1,7 @@
 """tppt types."""
 
 import pathlib
-from typing import TypeAlias
-
-from tppt.pptx.shape import RangeProps as _RangeProps
+from typing import TYPE_CHECKING, Any, TypeAlias
 
 from ._color import Color as Color
 from ._color import LiteralColor as LiteralColor
@@ -31,4 +29,21 @@ from ._length import (
 )
 
 FilePath = str | pathlib.Path
-Range: TypeAlias = _RangeProps
+
+if TYPE_CHECKING:
+    from tppt.pptx.shape import RangeProps as _RangeProps
+
+    Range: TypeAlias = _RangeProps
+
+
+def __getattr__(name: str) -> Any:
+    # NOTE: Range is resolved on first access,
+    #       because tppt.pptx imports this module while it is being initialized.
+    if name == "Range":
+        from tppt.pptx.shape import RangeProps
+
+        globals()[name] = RangeProps
+
+        return RangeProps
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
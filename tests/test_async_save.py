@@ -0,0 +1,112 @@
+"""Tests for async save of presentations."""
+
+import asyncio
+import io
+import pathlib
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pptx
+import pytest
+
+import tppt
+from tppt.pptx import _async_io
+
+LOGO = pathlib.Path(__file__).parent.parent / "examples" / "images" / "python-logo.png"
+
+
+class _AsyncStream:
+    """Async stream collecting the written chunks, like an HTTP response."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.chunks: list[bytes] = []
+        self.fail_after = fail_after
+
+    async def write(self, data: bytes) -> None:
+        if self.fail_after is not None and len(self.chunks) >= self.fail_after:
+            raise ConnectionResetError("client disconnected")
+
+        await asyncio.sleep(0)
+        self.chunks.append(data)
+
+
+def _builder():
+    builder = tppt.Presentation.builder()
+    for i in range(20):
+        builder.slide(
+            lambda slide, i=i: (
+                slide.BlankLayout()
+                .builder()
+                .text(
+                    f"Slide {i}",
+                    left=(1, "in"),
+                    top=(1, "in"),
+                    width=(5, "in"),
+                    height=(1, "in"),
+                )
+                .picture(LOGO, left=(1, "in"), top=(2, "in"), width=(2, "in"))
+            )
+        )
+
+    return builder
+
+
+def test_asave_to_path(output: pathlib.Path) -> None:
+    """Test saving to a path in an executor."""
+    presentation = _builder().build()
+
+    async def save() -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await presentation.asave(output / "async_save.pptx", executor=executor)
+
+    asyncio.run(save())
+
+    assert len(pptx.Presentation(str(output / "async_save.pptx")).slides) == 20
+
+
+def test_asave_to_async_stream_keeps_loop_running(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that an async stream is written in chunks while the loop runs."""
+    monkeypatch.setattr(_async_io, "CHUNK_SIZE", 1024)
+    presentation = _builder().build()
+    stream = _AsyncStream()
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def save() -> None:
+        ticker = asyncio.create_task(tick())
+        await presentation.asave(stream, streaming=True)
+        ticker.cancel()
+
+    asyncio.run(save())
+
+    assert ticks > 1
+    assert len(stream.chunks) > 1
+    with zipfile.ZipFile(io.BytesIO(b"".join(stream.chunks))) as zip_file:
+        assert zip_file.testzip() is None
+    assert len(pptx.Presentation(io.BytesIO(b"".join(stream.chunks))).slides) == 20
+
+
+def test_asave_stops_on_stream_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an error of the async stream is raised and stops the save."""
+    monkeypatch.setattr(_async_io, "CHUNK_SIZE", 1024)
+    presentation = _builder().build()
+    stream = _AsyncStream(fail_after=1)
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(presentation.asave(stream))
+
+
+def test_builder_asave() -> None:
+    """Test building and saving from a builder without blocking the loop."""
+    stream = _AsyncStream()
+
+    asyncio.run(_builder().asave(stream))
+
+    assert len(pptx.Presentation(io.BytesIO(b"".join(stream.chunks))).slides) == 20
@@ -0,0 +1,86 @@
+"""Tests for batch module."""
+
+import pathlib
+
+import pytest
+
+import tppt
+from tppt.batch import render
+from tppt.pptx.presentation import PresentationBuilder
+from tppt.template.default import DefaultSlideMaster
+
+
+def greeting_recipe(
+    builder: PresentationBuilder[DefaultSlideMaster], name: str
+) -> PresentationBuilder[DefaultSlideMaster]:
+    return builder.slide(
+        lambda slide: (
+            slide.BlankLayout()
+            .builder()
+            .text(
+                f"Hello, {name}!",
+                left=(1, "in"),
+                top=(1, "in"),
+                width=(5, "in"),
+                height=(1, "in"),
+            )
+        )
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_render(tmp_path: pathlib.Path, workers: int) -> None:
+    """Test rendering one deck per record."""
+    names = ["Alice", "Bob", "Carol"]
+
+    results = render(
+        DefaultSlideMaster,
+        greeting_recipe,
+        iter(names),
+        tmp_path,
+        workers=workers,
+        filename="greeting_{index}.pptx",
+    )
+
+    assert [result.index for result in results] == [0, 1, 2]
+    for result, name in zip(results, names):
+        assert result.path == tmp_path / f"greeting_{result.index}.pptx"
+        assert result.seconds >= 0
+
+        slide = tppt.Presentation(result.path).to_pptx().slides[0]
+        assert any(
+            getattr(shape, "text", "") == f"Hello, {name}!" for shape in slide.shapes
+        )
+
+
+def test_batch_render_filename_callable(tmp_path: pathlib.Path) -> None:
+    """Test naming the decks from the records."""
+    results = render(
+        DefaultSlideMaster,
+        greeting_recipe,
+        ["Alice", "Bob"],
+        tmp_path,
+        workers=1,
+        filename=lambda index, name: f"{name.lower()}.pptx",
+    )
+
+    assert [result.path.name for result in results] == ["alice.pptx", "bob.pptx"]
+
+
+def test_batch_render_from_template_snapshot(tmp_path: pathlib.Path) -> None:
+    """Test that the workers load the template from a snapshot."""
+    from tppt.template.snapshot import dump_template_snapshot
+
+    dump_template_snapshot("default", tmp_path / "default.snapshot")
+
+    results = render(
+        DefaultSlideMaster,
+        greeting_recipe,
+        ["Alice", "Bob"],
+        tmp_path,
+        workers=2,
+        template_snapshot=tmp_path / "default.snapshot",
+    )
+
+    assert len(results) == 2
+    assert all(result.path.exists() for result in results)
@@ -0,0 +1,29 @@
+"""Tests for the shared LRU cache."""
+
+from tppt._cache import CacheInfo, LRUCache
+
+
+def test_lru_cache_drops_least_recently_used() -> None:
+    """Test that a hit keeps a value, and the least recently used one is dropped."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    loads: list[str] = []
+
+    def get(key: str) -> int:
+        return cache.get(key, lambda: loads.append(key) or len(loads))
+
+    assert [get("a"), get("b"), get("a"), get("c")] == [1, 2, 1, 3]
+    assert get("a") == 1
+    assert get("b") == 4
+    assert loads == ["a", "b", "c", "b"]
+    assert cache.cache_info() == CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
+
+
+def test_lru_cache_without_size_and_clear() -> None:
+    """Test that a cache of size 0 stores nothing, and that clearing resets it."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=0)
+    cache.get("a", lambda: 1)
+    cache.get("a", lambda: 1)
+    assert cache.cache_info() == CacheInfo(hits=0, misses=2, maxsize=0, currsize=0)
+
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=0, currsize=0)
@@ -0,0 +1,148 @@
+"""Tests for lazy slide and shape collections."""
+
+import pathlib
+from collections.abc import Sequence
+
+import pptx
+from pptx.shapes.placeholder import PlaceholderPicture
+
+import tppt
+
+LOGO = pathlib.Path(__file__).parent.parent / "examples" / "images" / "python-logo.png"
+
+
+def _presentation(count: int) -> tppt.Presentation:
+    builder = tppt.Presentation.builder()
+    for i in range(count):
+        builder.slide(
+            lambda slide, i=i: (
+                slide.BlankLayout()
+                .builder()
+                .text(
+                    f"Slide {i}",
+                    left=(1, "in"),
+                    top=(1, "in"),
+                    width=(5, "in"),
+                    height=(1, "in"),
+                )
+            )
+        )
+
+    return builder.build()
+
+
+def test_slides_are_a_sequence() -> None:
+    """Test the length, indexing and slicing of the slides."""
+    presentation = _presentation(5)
+    slides = presentation.slides
+
+    assert isinstance(slides, Sequence)
+    assert len(slides) == 5
+    slide_ids = [slide.slide_id for slide in presentation.to_pptx().slides]
+    assert slides[-1].slide_id == slide_ids[-1]
+    assert [slide.slide_id for slide in slides[1:3]] == slide_ids[1:3]
+
+
+def test_slides_keep_identity() -> None:
+    """Test that slides are wrapped once."""
+    presentation = _presentation(3)
+
+    assert presentation.slides is presentation.slides
+    assert presentation.slides[1] is presentation.slides[1]
+    assert list(presentation.slides)[2] is presentation.slides[2]
+
+
+def test_slides_get_by_id() -> None:
+    """Test looking up slides by slide id."""
+    presentation = _presentation(3)
+    slide = presentation.slides[2]
+
+    assert presentation.slides.get(slide.slide_id) is slide
+    assert presentation.slides.get(-1) is None
+
+
+def test_slides_get_by_name() -> None:
+    """Test looking up slides by name, also after renaming them."""
+    presentation = _presentation(3)
+    presentation.slides[1].name = "Agenda"
+
+    assert presentation.slides.get_by_name("Agenda") is presentation.slides[1]
+    assert presentation.slides.get_by_name("Summary") is None
+
+    presentation.slides[1].name = "Intro"
+    presentation.slides[2].name = "Agenda"
+
+    assert presentation.slides.get_by_name("Agenda") is presentation.slides[2]
+
+
+def test_slides_follow_added_slides() -> None:
+    """Test that slides added after the first access are listed."""
+    presentation = _presentation(2)
+    first = presentation.slides[0]
+    pptx_presentation = presentation.to_pptx()
+    pptx_presentation.slides.add_slide(pptx_presentation.slide_layouts[6])
+
+    assert len(presentation.slides) == 3
+    assert presentation.slides[0] is first
+    assert presentation.slides.get(presentation.slides[2].slide_id) is not None
+
+
+def test_shapes_follow_added_shapes() -> None:
+    """Test that shapes are wrapped once and follow added shapes."""
+    presentation = _presentation(1)
+    slide = presentation.slides[0]
+    shape = slide.shapes[0]
+
+    assert slide.shapes[0] is shape
+
+    slide.to_pptx().shapes.add_textbox(0, 0, 100, 100)
+
+    assert len(slide.shapes) == 2
+    assert slide.shapes[0] is shape
+
+
+def test_slides_follow_reordered_slides() -> None:
+    """Test that slides follow a reordering of the slide list."""
+    presentation = _presentation(2)
+    first, second = presentation.slides[0], presentation.slides[1]
+    sld_id_lst = presentation.to_pptx().part._element.sldIdLst
+    sld_id_lst.append(sld_id_lst[0])
+
+    assert [slide.slide_id for slide in presentation.slides] == [
+        slide.slide_id for slide in presentation.to_pptx().slides
+    ]
+    assert presentation.slides[0] is second
+    assert presentation.slides[1] is first
+    assert presentation.slides.get(first.slide_id) is first
+
+
+def test_slides_follow_slides_moved_in_the_middle() -> None:
+    """Test that slides follow a move that keeps the first and last slide."""
+    presentation = _presentation(5)
+    slides = list(presentation.slides)
+    sld_id_lst = presentation.to_pptx().part._element.sldIdLst
+    sld_id_lst.insert(1, sld_id_lst[3])
+
+    expected = [slides[0], slides[3], slides[1], slides[2], slides[4]]
+    assert [presentation.slides[i] for i in range(5)] == expected
+    assert presentation.slides.get(slides[2].slide_id) is slides[2]
+    assert presentation.slides[1:4] == expected[1:4]
+
+    sld_id_lst.remove(sld_id_lst[2])
+
+    assert presentation.slides[1] is slides[3]
+    assert list(presentation.slides) == [slides[0], slides[3], slides[2], slides[4]]
+    assert len(presentation.slides) == 4
+
+
+def test_placeholders_follow_replaced_placeholder() -> None:
+    """Test that a placeholder replaced by a picture is not listed anymore."""
+    presentation = pptx.Presentation()
+    pptx_slide = presentation.slides.add_slide(presentation.slide_layouts[8])
+    slide = tppt.Presentation(presentation).slides[0]
+    placeholder = slide.placeholders[1]
+
+    pptx_slide.placeholders[1].insert_picture(str(LOGO))  # type: ignore[attr-defined]
+
+    assert slide.placeholders[1] is not placeholder
+    assert isinstance(slide.placeholders[1].to_pptx(), PlaceholderPicture)
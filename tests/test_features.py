@@ -0,0 +1,59 @@
+"""Tests for optional dependency detection."""
+
+import subprocess
+import sys
+
+import pytest
+
+from tppt import _features
+from tppt.pptx.table.table import dataframe2list
+
+OPTIONAL_MODULES = ("pandas", "polars", "pyarrow", "pydantic")
+
+
+def _loaded_optional_modules(code: str) -> str:
+    """Run the code in a fresh interpreter and list the optional modules it imported."""
+    script = (
+        f"import sys; {code}; "
+        f"print([name for name in {OPTIONAL_MODULES!r} if name in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_optional_dependencies() -> None:
+    """Test that `import tppt` does not import any optional dependency."""
+    assert _loaded_optional_modules("import tppt, tppt.pptx.table") == "[]"
+
+
+def test_feature_flags_do_not_import_modules() -> None:
+    """Test that the `USE_*` flags only look the modules up."""
+    code = (
+        "from tppt import _features; "
+        "_features.USE_PANDAS, _features.USE_POLARS, _features.USE_PYARROW, "
+        "_features.USE_PYDANTIC"
+    )
+
+    assert _loaded_optional_modules(code) == "[]"
+
+
+def test_is_instance_of_unloaded_module() -> None:
+    """Test that objects are never matched against a module that is not imported."""
+    assert not _features.is_instance_of([], "tppt_not_existing_module", "DataFrame")
+
+
+@pytest.mark.skipif(not _features.USE_POLARS, reason="Polars not installed")
+def test_dataframe2list_detects_polars() -> None:
+    """Test that polars frames are detected once polars is imported."""
+    import polars as pl  # type: ignore[import]
+
+    df = pl.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+    assert _features.is_instance_of(df, "polars", "DataFrame")
+    assert dataframe2list(df) == [["a", "b"], ["1", "x"], ["2", "y"]]
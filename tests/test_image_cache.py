@@ -0,0 +1,91 @@
+"""Tests for image cache module."""
+
+import io
+import os
+import pathlib
+import shutil
+from typing import cast
+
+from pptx.shapes.picture import Picture as PptxPicture
+from pptx.util import Inches as PptxInches
+
+import tppt
+from tppt.pptx.image_cache import ImageCache
+
+LOGO = pathlib.Path(__file__).parent.parent / "examples" / "images" / "python-logo.png"
+
+
+def _logo_slide(slide, image):
+    """Build a slide showing the image."""
+    return (
+        slide.BlankLayout()
+        .builder()
+        .picture(image, left=(1, "in"), top=(1, "in"), width=(2, "in"))
+    )
+
+
+def test_image_cache_shares_image_part_across_slides(output: pathlib.Path) -> None:
+    """Test that an image added to many slides is loaded and stored once."""
+    cache = ImageCache()
+    builder = tppt.Presentation.builder().image_cache(cache)
+    for _ in range(5):
+        builder.slide(lambda slide: _logo_slide(slide, LOGO))
+
+    presentation = builder.build()
+    presentation.save(output / "image_cache_logo.pptx")
+
+    info = cache.cache_info()
+    assert info.misses == 1
+    assert info.hits == 4
+
+    pictures = [
+        cast(PptxPicture, slide.shapes[0]) for slide in presentation.to_pptx().slides
+    ]
+    assert len({picture.image.sha1 for picture in pictures}) == 1
+
+    media = [
+        part
+        for part in presentation.to_pptx().part.package.iter_parts()
+        if part.partname.startswith("/ppt/media/")
+    ]
+    assert len(media) == 1
+
+
+def test_image_cache_keeps_picture_size() -> None:
+    """Test that the picture size matches `SlideShapes.add_picture`."""
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(lambda slide: _logo_slide(slide, LOGO))
+        .build()
+    )
+
+    pptx_slide = presentation.to_pptx().slides[0]
+    expected = pptx_slide.shapes.add_picture(os.fspath(LOGO), 0, 0, width=PptxInches(2))
+    picture = pptx_slide.shapes[0]
+    assert (picture.width, picture.height) == (expected.width, expected.height)
+
+
+def test_image_cache_binary_stream() -> None:
+    """Test that binary streams are cached by their content."""
+    cache = ImageCache()
+    blob = LOGO.read_bytes()
+
+    first = cache.load(io.BytesIO(blob))
+    second = cache.load(io.BytesIO(blob))
+
+    assert first is second
+    assert cache.cache_info().hits == 1
+
+
+def test_image_cache_reloads_modified_file(tmp_path: pathlib.Path) -> None:
+    """Test that a file is loaded again after it is modified."""
+    cache = ImageCache()
+    image = tmp_path / "logo.png"
+    shutil.copy(LOGO, image)
+
+    first = cache.load(image)
+    image.write_bytes((LOGO.parent / "python-powered-w.png").read_bytes())
+    second = cache.load(image)
+
+    assert first.sha1 != second.sha1
+    assert cache.cache_info().misses == 2
@@ -0,0 +1,81 @@
+"""Tests for image optimizer module."""
+
+import io
+import pathlib
+from typing import cast
+
+from PIL import Image
+from pptx.shapes.picture import Picture as PptxPicture
+from pptx.util import Inches as PptxInches
+
+import tppt
+from tppt.pptx.image_optimizer import ImageOptimizer
+
+
+def _photo(size: tuple[int, int], image_format: str) -> io.BytesIO:
+    """Create a noisy image that does not compress well."""
+    image = Image.effect_noise(size, 64).convert("RGB")
+    stream = io.BytesIO()
+    image.save(stream, image_format, quality=95)
+    stream.seek(0)
+    return stream
+
+
+def _build(optimizer: ImageOptimizer, image: io.BytesIO) -> tppt.Presentation:
+    """Build a presentation with the image in a 2 x 1.5 inch box."""
+    return (
+        tppt.Presentation.builder()
+        .optimize_images(optimizer)
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .picture(
+                    image,
+                    left=(1, "in"),
+                    top=(1, "in"),
+                    width=(2, "in"),
+                    height=(1.5, "in"),
+                )
+            )
+        )
+        .build()
+    )
+
+
+def test_optimize_images_downscales_to_picture_size(output: pathlib.Path) -> None:
+    """Test that a large photo is resampled to the picture size at the DPI."""
+    photo = _photo((3000, 2250), "JPEG")
+    original_size = len(photo.getvalue())
+
+    presentation = _build(ImageOptimizer(dpi=150), photo)
+    presentation.save(output / "image_optimizer_photo.pptx")
+
+    picture = cast(PptxPicture, presentation.to_pptx().slides[0].shapes[0])
+    assert picture.image.size == (300, 225)
+    assert picture.image.content_type == "image/jpeg"
+    assert len(picture.image.blob) < original_size
+    assert picture.width == PptxInches(2)
+
+
+def test_optimize_images_converts_webp_to_png() -> None:
+    """Test that WebP images, which PowerPoint cannot show, are embedded as PNG."""
+    presentation = _build(ImageOptimizer(), _photo((400, 300), "WEBP"))
+
+    picture = cast(PptxPicture, presentation.to_pptx().slides[0].shapes[0])
+    assert picture.image.content_type == "image/png"
+    assert picture.image.ext == "png"
+    assert picture.image.size == (300, 225)
+
+
+def test_optimize_images_caches_results() -> None:
+    """Test that results are cached by the image hash and the target size."""
+    optimizer = ImageOptimizer(workers=2)
+    photo = _photo((1200, 900), "JPEG")
+
+    _build(optimizer, photo)
+    _build(optimizer, photo)
+
+    info = optimizer.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
@@ -0,0 +1,41 @@
+"""Tests for lazy loading of the top-level package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import tppt
+
+
+def test_import_does_not_load_python_pptx() -> None:
+    """Test that `import tppt` does not import python-pptx and the templates."""
+    script = (
+        "import sys, tppt; "
+        "print([name for name in ('pptx', 'tppt.pptx', 'tppt.template') "
+        "if name in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_attributes() -> None:
+    """Test that the public attributes are resolved on first access."""
+    from tppt.pptx.presentation import Presentation
+    from tppt.template.slide_master import SlideMaster, slide_master
+
+    assert tppt.Presentation is Presentation
+    assert tppt.SlideMaster is SlideMaster
+    assert tppt.slide_master is slide_master
+    assert tppt.types.Points(1) == (1, "pt")
+    assert isinstance(tppt.__version__, str)
+    assert {"Presentation", "pptx", "types"} <= set(dir(tppt))
+
+
+def test_unknown_attribute() -> None:
+    """Test that an unknown attribute raises AttributeError."""
+    with pytest.raises(AttributeError):
+        tppt.NotExistingAttribute  # type: ignore[attr-defined]  # noqa: B018
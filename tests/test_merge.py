@@ -0,0 +1,144 @@
+"""Tests for merging decks."""
+
+import os
+import pathlib
+import zipfile
+
+import pptx
+import pytest
+
+import tppt
+
+EXAMPLES = pathlib.Path(__file__).parent.parent / "examples"
+LOGO = EXAMPLES / "images" / "python-logo.png"
+BASE_DECK = EXAMPLES / "custom_slide_master_base.pptx"
+
+
+def _deck(path: pathlib.Path, name: str, movie: pathlib.Path) -> pathlib.Path:
+    (
+        tppt.Presentation.builder()
+        .slide(lambda slide: slide.TitleLayout(title=f"{name} title"))
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .picture(LOGO, left=(1, "in"), top=(1, "in"), width=(2, "in"))
+                .movie(
+                    movie,
+                    left=(4, "in"),
+                    top=(1, "in"),
+                    width=(4, "in"),
+                    height=(3, "in"),
+                    poster_frame_image=LOGO,
+                    mime_type="video/mp4",
+                )
+            )
+        )
+        .save(path / f"{name}.pptx")
+    )
+
+    return path / f"{name}.pptx"
+
+
+def _media(path: pathlib.Path) -> list[str]:
+    with zipfile.ZipFile(path) as zip_file:
+        return [name for name in zip_file.namelist() if name.startswith("ppt/media/")]
+
+
+def _titles(presentation: pptx.presentation.Presentation) -> list[str]:
+    return [
+        slide.shapes.title.text_frame.text
+        for slide in presentation.slides
+        if slide.shapes.title is not None
+    ]
+
+
+def test_merge(tmp_path: pathlib.Path) -> None:
+    """Test that the slides are concatenated and their images and media shared."""
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(os.urandom(64 * 1024))
+    decks = [_deck(tmp_path, name, movie) for name in ("a", "b", "c")]
+
+    tppt.merge(decks, tmp_path / "merged.pptx")
+
+    merged = pptx.Presentation(str(tmp_path / "merged.pptx"))
+    assert len(merged.slides) == 6
+    assert _titles(merged) == ["a title", "b title", "c title"]
+    # One image and one movie, besides the poster frame which is the same image.
+    assert sorted(_media(tmp_path / "merged.pptx")) == [
+        "ppt/media/image1.png",
+        "ppt/media/media1.mp4",
+    ]
+    with zipfile.ZipFile(tmp_path / "merged.pptx") as zip_file:
+        assert zip_file.read("ppt/media/media1.mp4") == movie.read_bytes()
+    partnames = [str(part.partname) for part in merged.part.package.iter_parts()]
+    assert len(set(partnames)) == len(partnames)
+
+
+def test_merge_different_media(tmp_path: pathlib.Path) -> None:
+    """Test that media with other bytes are copied from their own deck."""
+    movies = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    for movie in movies:
+        movie.write_bytes(os.urandom(1024))
+    decks = [_deck(tmp_path, movie.stem, movie) for movie in movies]
+
+    tppt.merge(decks, tmp_path / "merged.pptx")
+
+    merged = pptx.Presentation(str(tmp_path / "merged.pptx"))
+    blobs = {
+        part.blob
+        for part in merged.part.package.iter_parts()
+        if part.content_type == "video/mp4"
+    }
+    assert blobs == {movie.read_bytes() for movie in movies}
+
+
+def test_merge_into_master(tmp_path: pathlib.Path) -> None:
+    """Test that a master deck gives its layouts but not its slides."""
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(os.urandom(1024))
+    decks = [_deck(tmp_path, name, movie) for name in ("a", "b")]
+
+    tppt.merge(decks, tmp_path / "merged.pptx", master=BASE_DECK)
+
+    merged = pptx.Presentation(str(tmp_path / "merged.pptx"))
+    base = pptx.Presentation(str(BASE_DECK))
+    assert len(merged.slides) == 4
+    assert _titles(merged) == ["a title", "b title"]
+    assert [layout.name for layout in merged.slide_layouts] == [
+        layout.name for layout in base.slide_layouts
+    ]
+
+
+def test_merge_cannot_overwrite_source(tmp_path: pathlib.Path) -> None:
+    """Test that the merged deck cannot replace a deck that is read."""
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(os.urandom(1024))
+    decks = [_deck(tmp_path, name, movie) for name in ("a", "b")]
+
+    with pytest.raises(ValueError):
+        tppt.merge(decks, decks[1])
+
+
+def test_merge_into_master_cannot_overwrite_source(tmp_path: pathlib.Path) -> None:
+    """Test that the first deck is read like the others with a master deck."""
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(os.urandom(1024))
+    decks = [_deck(tmp_path, name, movie) for name in ("a", "b")]
+    blob = decks[0].read_bytes()
+
+    with pytest.raises(ValueError):
+        tppt.merge(decks, decks[0], master=BASE_DECK)
+
+    assert decks[0].read_bytes() == blob
+
+
+def test_merge_over_master(tmp_path: pathlib.Path) -> None:
+    """Test that the merged deck can replace the master deck."""
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(os.urandom(1024))
+    decks = [_deck(tmp_path, name, movie) for name in ("a", "b")]
+
+    tppt.merge(decks, decks[0])
+
+    assert _titles(pptx.Presentation(str(decks[0]))) == ["a title", "b title"]
@@ -0,0 +1,373 @@
+"""Tests for package writer module."""
+
+import io
+import os
+import pathlib
+import shutil
+import zipfile
+from collections.abc import Iterable
+
+import pptx
+import pytest
+
+import tppt
+from tppt.exception import MediaFileChangedError
+from tppt.pptx import package_writer
+from tppt.pptx.media import FileMediaPart
+from tppt.pptx.package_writer import (
+    DEFAULT_COMPRESSION,
+    FAST_COMPRESSION,
+    SMALL_COMPRESSION,
+    CompressionPolicy,
+)
+
+EXAMPLES = pathlib.Path(__file__).parent.parent / "examples"
+LOGO = EXAMPLES / "images" / "python-logo.png"
+BASE_DECK = EXAMPLES / "custom_slide_master_base.pptx"
+
+
+class _Pipe:
+    """Write-only stream that cannot seek or tell, like a pipe."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self.data += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def _movie_presentation(
+    movie: pathlib.Path, link_media: bool = False
+) -> tppt.Presentation:
+    builder = tppt.Presentation.builder()
+    if link_media:
+        builder.link_media()
+
+    return builder.slide(
+        lambda slide: (
+            slide.BlankLayout()
+            .builder()
+            .movie(
+                movie,
+                left=(1, "in"),
+                top=(1, "in"),
+                width=(4, "in"),
+                height=(3, "in"),
+                poster_frame_image=LOGO,
+                mime_type="video/mp4",
+            )
+        )
+    ).build()
+
+
+def test_streaming_save_matches_save() -> None:
+    """Test that the streaming writer writes the same entries as python-pptx."""
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .text(
+                    "text",
+                    left=(1, "in"),
+                    top=(1, "in"),
+                    width=(2, "in"),
+                    height=(1, "in"),
+                )
+                .picture(LOGO, left=(1, "in"), top=(2, "in"), width=(2, "in"))
+            )
+        )
+        .build()
+    )
+
+    expected, actual = io.BytesIO(), io.BytesIO()
+    presentation.save(expected)
+    presentation.save(actual, streaming=True)
+
+    with (
+        zipfile.ZipFile(expected) as expected_zip,
+        zipfile.ZipFile(actual) as actual_zip,
+    ):
+        assert actual_zip.namelist() == expected_zip.namelist()
+        for name in expected_zip.namelist():
+            assert actual_zip.read(name) == expected_zip.read(name)
+
+
+def test_streaming_save_to_non_seekable_output(tmp_path: pathlib.Path) -> None:
+    """Test writing to a stream that cannot seek, through data descriptors."""
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(os.urandom(3 * 1024 * 1024))
+    pipe = _Pipe()
+
+    _movie_presentation(movie).save(pipe, streaming=True)
+
+    with zipfile.ZipFile(io.BytesIO(bytes(pipe.data))) as zip_file:
+        assert zip_file.testzip() is None
+        assert zip_file.read("ppt/media/media1.mp4") == movie.read_bytes()
+
+    assert len(pptx.Presentation(io.BytesIO(bytes(pipe.data))).slides) == 1
+
+
+def test_movie_media_is_read_from_file(tmp_path: pathlib.Path) -> None:
+    """Test that a linked movie added from a path does not keep its bytes in memory."""
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(os.urandom(1024))
+
+    presentation = _movie_presentation(movie, link_media=True)
+
+    media_parts = [
+        part
+        for part in presentation.to_pptx().part.package.iter_parts()
+        if part.partname.startswith("/ppt/media/media")
+    ]
+    assert len(media_parts) == 1
+    assert isinstance(media_parts[0], FileMediaPart)
+    assert media_parts[0]._blob is None
+    assert media_parts[0].blob == movie.read_bytes()
+
+
+def test_movie_media_is_kept_in_memory(tmp_path: pathlib.Path) -> None:
+    """Test that a movie is saved with its bytes when it was added, by default."""
+    movie = tmp_path / "movie.mp4"
+    data = os.urandom(1024)
+    movie.write_bytes(data)
+
+    presentation = _movie_presentation(movie)
+    movie.unlink()
+
+    for streaming in (False, True):
+        file = io.BytesIO()
+        presentation.save(file, streaming=streaming)
+        with zipfile.ZipFile(file) as zip_file:
+            assert zip_file.read("ppt/media/media1.mp4") == data
+
+
+def test_movie_media_file_changed(tmp_path: pathlib.Path) -> None:
+    """Test that saving fails when a linked movie file changed after it was added."""
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(os.urandom(1024))
+
+    presentation = _movie_presentation(movie, link_media=True)
+    movie.write_bytes(os.urandom(2048))
+
+    with pytest.raises(MediaFileChangedError):
+        presentation.save(io.BytesIO(), streaming=True)
+
+    movie.unlink()
+    with pytest.raises(MediaFileChangedError):
+        presentation.save(io.BytesIO())
+
+
+def test_compression_policy_stores_compressed_media() -> None:
+    """Test that already compressed media are stored and XML is deflated."""
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .picture(LOGO, left=(1, "in"), top=(1, "in"), width=(2, "in"))
+            )
+        )
+        .build()
+    )
+
+    default, fast = io.BytesIO(), io.BytesIO()
+    presentation.save(default, compression=DEFAULT_COMPRESSION)
+    presentation.save(fast, compression=FAST_COMPRESSION)
+
+    with zipfile.ZipFile(default) as zip_file:
+        assert zip_file.getinfo("ppt/media/image1.png").compress_type == (
+            zipfile.ZIP_DEFLATED
+        )
+
+    with zipfile.ZipFile(fast) as zip_file:
+        assert zip_file.getinfo("ppt/media/image1.png").compress_type == (
+            zipfile.ZIP_STORED
+        )
+        assert zip_file.getinfo("ppt/slides/slide1.xml").compress_type == (
+            zipfile.ZIP_DEFLATED
+        )
+        assert zip_file.read("ppt/media/image1.png") == LOGO.read_bytes()
+
+    assert len(pptx.Presentation(fast).slides) == 1
+
+
+def test_compression_policy_levels() -> None:
+    """Test that a higher deflate level does not make the XML larger."""
+    policy = CompressionPolicy(xml_level=0)
+    assert policy.compression_for("application/xml") == (zipfile.ZIP_DEFLATED, 0)
+    assert policy.compression_for("image/png") == (zipfile.ZIP_DEFLATED, None)
+
+    presentation = tppt.Presentation.builder().build()
+    sizes = []
+    for level in (1, 9):
+        file = io.BytesIO()
+        presentation.save(file, compression=CompressionPolicy(xml_level=level))
+        sizes.append(len(file.getvalue()))
+
+    assert sizes[1] <= sizes[0]
+
+
+def _copy_base_deck(tmp_path: pathlib.Path) -> pathlib.Path:
+    deck = tmp_path / "base.pptx"
+    shutil.copy(BASE_DECK, deck)
+    return deck
+
+
+def _entry_fingerprints(path: pathlib.Path) -> dict[str, tuple[int, int, int]]:
+    with zipfile.ZipFile(path) as zip_file:
+        return {
+            info.filename: (info.CRC, info.compress_type, info.compress_size)
+            for info in zip_file.infolist()
+        }
+
+
+def test_incremental_save_copies_untouched_parts(tmp_path: pathlib.Path) -> None:
+    """Test that only the edited slide of a loaded deck is written again."""
+    deck = _copy_base_deck(tmp_path)
+    presentation = tppt.Presentation(deck)
+    slide = presentation.slides[0]
+    slide.to_pptx().shapes[0].text_frame.text = "Edited"
+
+    saved = tmp_path / "saved.pptx"
+    presentation.save(saved)
+
+    source, target = _entry_fingerprints(deck), _entry_fingerprints(saved)
+    assert target["ppt/slides/slide1.xml"] != source["ppt/slides/slide1.xml"]
+    for name in (
+        "ppt/slideMasters/slideMaster1.xml",
+        "ppt/slideLayouts/slideLayout1.xml",
+        "ppt/theme/theme1.xml",
+        "ppt/media/image3.jpeg",
+    ):
+        assert target[name] == source[name]
+
+    with zipfile.ZipFile(saved) as zip_file:
+        assert zip_file.testzip() is None
+
+    reopened = pptx.Presentation(os.fspath(saved))
+    assert reopened.slides[0].shapes[0].text_frame.text == "Edited"
+
+
+def test_incremental_save_over_source(tmp_path: pathlib.Path) -> None:
+    """Test saving a loaded deck over its own file, twice."""
+    deck = _copy_base_deck(tmp_path)
+    presentation = tppt.Presentation(deck)
+    presentation.slides[0].to_pptx().shapes[0].text_frame.text = "First"
+    presentation.save(deck)
+
+    presentation.slides[0].to_pptx().shapes[0].text_frame.text = "Second"
+    presentation.save(deck)
+
+    reopened = pptx.Presentation(os.fspath(deck))
+    assert reopened.slides[0].shapes[0].text_frame.text == "Second"
+    assert [path.name for path in tmp_path.iterdir()] == ["base.pptx"]
+
+
+@pytest.mark.parametrize("path", ["base.pptx", "saved.pptx"])
+def test_incremental_save_edits_through_held_wrappers(
+    tmp_path: pathlib.Path, path: str
+) -> None:
+    """Test that edits through wrappers held over a save are saved again."""
+    deck = _copy_base_deck(tmp_path)
+    presentation = tppt.Presentation(deck)
+    slide = presentation.slides[0]
+    shape = slide.shapes[0]
+    presentation.save(tmp_path / path)
+
+    slide.to_pptx().shapes[0].text_frame.text = "Slide"
+    presentation.save(tmp_path / path)
+    assert _first_text(tmp_path / path) == "Slide"
+
+    shape.to_pptx().text_frame.text = "Shape"
+    presentation.save(tmp_path / path)
+    assert _first_text(tmp_path / path) == "Shape"
+
+
+def test_incremental_save_with_changed_source(tmp_path: pathlib.Path) -> None:
+    """Test that all parts are written when the source file has changed."""
+    deck = _copy_base_deck(tmp_path)
+    presentation = tppt.Presentation(deck)
+    deck.write_bytes(b"")
+
+    saved = tmp_path / "saved.pptx"
+    presentation.save(saved)
+
+    assert len(pptx.Presentation(os.fspath(saved)).slides) == 1
+
+
+def test_incremental_save_with_compression(tmp_path: pathlib.Path) -> None:
+    """Test that a compression policy also applies to the parts of a loaded deck."""
+    deck = _copy_base_deck(tmp_path)
+    presentation = tppt.Presentation(deck)
+
+    sizes = {}
+    for name, policy in (("kept", None), ("fast", FAST_COMPRESSION)):
+        saved = tmp_path / f"{name}.pptx"
+        presentation.save(saved, compression=policy)
+        sizes[name] = saved.stat().st_size
+        with zipfile.ZipFile(saved) as zip_file:
+            assert zip_file.testzip() is None
+    sizes["small"] = len(_save(presentation, SMALL_COMPRESSION))
+
+    kept = _entry_fingerprints(tmp_path / "kept.pptx")
+    assert {name: kept[name] for name in _part_entries(kept)} == {
+        name: fingerprint
+        for name, fingerprint in _entry_fingerprints(deck).items()
+        if name in _part_entries(kept)
+    }
+    with zipfile.ZipFile(tmp_path / "fast.pptx") as zip_file:
+        assert zip_file.getinfo("ppt/media/image3.jpeg").compress_type == (
+            zipfile.ZIP_STORED
+        )
+    assert sizes["fast"] != sizes["kept"]
+    assert sizes["small"] != sizes["fast"]
+
+
+def test_incremental_save_copies_entries_of_same_compression(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a deck saved by a policy is copied when saved by it again."""
+    deck = _copy_base_deck(tmp_path)
+    presentation = tppt.Presentation(deck)
+    presentation.save(tmp_path / "fast.pptx", compression=FAST_COMPRESSION)
+
+    copied: list[str] = []
+    copy_entry = package_writer._copy_entry
+    monkeypatch.setattr(
+        package_writer,
+        "_copy_entry",
+        lambda zip_file, source_file, info, membername: (
+            copied.append(membername),
+            copy_entry(zip_file, source_file, info, membername),
+        ),
+    )
+    presentation.save(tmp_path / "saved.pptx", compression=FAST_COMPRESSION)
+
+    with zipfile.ZipFile(tmp_path / "saved.pptx") as zip_file:
+        assert set(copied) == _part_entries(zip_file.namelist())
+
+
+def _first_text(path: pathlib.Path) -> str:
+    return pptx.Presentation(os.fspath(path)).slides[0].shapes[0].text_frame.text
+
+
+def _save(presentation: tppt.Presentation, policy: CompressionPolicy) -> bytes:
+    file = io.BytesIO()
+    presentation.save(file, compression=policy)
+    return file.getvalue()
+
+
+def _part_entries(names: Iterable[str]) -> set[str]:
+    """Names of the entries of parts, as the relationships are always written."""
+    return {
+        name
+        for name in names
+        if name != "[Content_Types].xml" and not name.endswith(".rels")
+    }
@@ -0,0 +1,106 @@
+"""Tests for parallel slide building."""
+
+import functools
+import pathlib
+
+import tppt
+from tppt.template.default import DefaultSlideMaster
+
+LOGO = pathlib.Path(__file__).parent.parent / "examples" / "images" / "python-logo.png"
+
+
+def text_slide(slide: type[DefaultSlideMaster], text: str):
+    return (
+        slide.BlankLayout()
+        .builder()
+        .text(text, left=(1, "in"), top=(1, "in"), width=(5, "in"), height=(1, "in"))
+    )
+
+
+def logo_slide(slide: type[DefaultSlideMaster]):
+    return (
+        slide.BlankLayout()
+        .builder()
+        .picture(LOGO, left=(1, "in"), top=(1, "in"), width=(2, "in"))
+    )
+
+
+def table_slide(slide: type[DefaultSlideMaster]):
+    data = [["no"], *[[str(i)] for i in range(25)]]
+    return (
+        slide.BlankLayout()
+        .builder()
+        .table(
+            data,
+            left=(1, "in"),
+            top=(1, "in"),
+            width=(6, "in"),
+            height=(5, "in"),
+            max_rows_per_slide=10,
+        )
+    )
+
+
+def _slide_texts(presentation: tppt.Presentation) -> list[list[str]]:
+    return [
+        [shape.text for shape in slide.shapes if shape.has_text_frame]
+        for slide in presentation.to_pptx().slides
+    ]
+
+
+def test_parallel_build_keeps_slide_order(output: pathlib.Path) -> None:
+    """Test that slides built by workers are added in the recipe order."""
+    builder = tppt.Presentation.builder().parallel(workers=2)
+    for i in range(10):
+        builder.slide(functools.partial(text_slide, text=f"Slide {i}"))
+
+    presentation = builder.build()
+    presentation.save(output / "parallel_text.pptx")
+
+    assert _slide_texts(presentation) == [[f"Slide {i}"] for i in range(10)]
+    assert _slide_texts(tppt.Presentation(output / "parallel_text.pptx")) == [
+        [f"Slide {i}"] for i in range(10)
+    ]
+
+
+def test_parallel_build_matches_sequential_build() -> None:
+    """Test that continuation slides and layouts are the same as a sequential build."""
+
+    def build(builder):
+        return (
+            builder.slide(functools.partial(text_slide, text="Title"))
+            .slide(table_slide)
+            .slide(functools.partial(text_slide, text="End"))
+            .build()
+        )
+
+    sequential = build(tppt.Presentation.builder())
+    parallel = build(tppt.Presentation.builder().parallel(workers=2))
+
+    sequential_slides = sequential.to_pptx().slides
+    parallel_slides = parallel.to_pptx().slides
+    assert len(parallel_slides) == len(sequential_slides) == 5
+    assert [slide.slide_layout.name for slide in parallel_slides] == [
+        slide.slide_layout.name for slide in sequential_slides
+    ]
+    assert [
+        [shape.shape_id for shape in slide.shapes] for slide in parallel_slides
+    ] == [[shape.shape_id for shape in slide.shapes] for slide in sequential_slides]
+
+
+def test_parallel_build_shares_media(output: pathlib.Path) -> None:
+    """Test that an image used by slides of many workers is stored once."""
+    builder = tppt.Presentation.builder().parallel(workers=2)
+    for _ in range(6):
+        builder.slide(logo_slide)
+
+    presentation = builder.build()
+    presentation.save(output / "parallel_logo.pptx")
+
+    media = [
+        part
+        for part in presentation.to_pptx().part.package.iter_parts()
+        if part.partname.startswith("/ppt/media/")
+    ]
+    assert len(media) == 1
+    assert len(tppt.Presentation(output / "parallel_logo.pptx").to_pptx().slides) == 6
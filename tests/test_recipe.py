@@ -0,0 +1,173 @@
+"""Tests for compiled slide recipes."""
+
+import pathlib
+
+import pptx
+import pytest
+
+import tppt
+from tppt.exception import SlotNotFoundError, SlotValueMissingError
+from tppt.pptx.recipe import CompiledSlide, CompileReport
+
+LOGO = pathlib.Path(__file__).parent.parent / "examples" / "images" / "python-logo.png"
+
+
+def _card(slide, title: str = tppt.Slot("title"), revenue: str = tppt.Slot("revenue")):
+    return (
+        slide.TitleLayout(title=title)
+        .builder()
+        .text(
+            f"Revenue: {revenue}",
+            left=(1, "in"),
+            top=(3, "in"),
+            width=(5, "in"),
+            height=(1, "in"),
+        )
+        .picture(LOGO, left=(1, "in"), top=(4, "in"), width=(1, "in"))
+    )
+
+
+def _texts(slide: pptx.slide.Slide) -> list[str]:
+    return [
+        shape.text_frame.text
+        for shape in slide.shapes
+        if shape.has_text_frame and shape.text_frame.text
+    ]
+
+
+def test_compiled_slides_are_filled(output: pathlib.Path) -> None:
+    """Test that slides copied from the template have their own values."""
+    card = tppt.compile_slide(_card)
+    builder = tppt.Presentation.builder()
+    for i in range(3):
+        builder.slide(card.fill(title=f"Region {i}", revenue=f"{i * 100} <USD>"))
+    builder.build().save(output / "compiled_slides.pptx")
+
+    assert card.report == CompileReport(True, None, frozenset({"title", "revenue"}))
+
+    presentation = pptx.Presentation(str(output / "compiled_slides.pptx"))
+    assert [_texts(slide) for slide in presentation.slides] == [
+        [f"Region {i}", f"Revenue: {i * 100} <USD>"] for i in range(3)
+    ]
+    # The image is shared by the copied slides.
+    image_parts = {
+        shape._pic.blip_rId and slide.part.related_part(shape._pic.blip_rId)
+        for slide in presentation.slides
+        for shape in slide.shapes
+        if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE
+    }
+    assert len(image_parts) == 1
+
+
+def test_compiled_slides_match_built_slides() -> None:
+    """Test that a copied slide has the XML of a slide built from the recipe."""
+    card = tppt.compile_slide(_card)
+    compiled = (
+        tppt.Presentation.builder()
+        .slide(card.fill(title="A", revenue="1"))
+        .slide(card.fill(title="B", revenue="2"))
+        .build()
+        .to_pptx()
+    )
+    built = (
+        tppt.Presentation.builder()
+        .slide(card.fill(title="B", revenue="2"))
+        .build()
+        .to_pptx()
+    )
+
+    assert compiled.slides[1].part.blob == built.slides[0].part.blob
+
+
+def _paragraphs(slide: pptx.slide.Slide) -> list[list[str]]:
+    return [
+        [paragraph.text for paragraph in shape.text_frame.paragraphs]
+        for shape in slide.shapes
+        if shape.has_text_frame
+    ]
+
+
+def _fill_twice(card: CompiledSlide, **values: str) -> pptx.slide.Slides:
+    """Slides built from the recipe, then copied from its template."""
+    return (
+        tppt.Presentation.builder()
+        .slide(card.fill(**values))
+        .slide(card.fill(**values))
+        .build()
+        .to_pptx()
+        .slides
+    )
+
+
+def test_slot_line_feeds_start_paragraphs() -> None:
+    """Test that line feeds of slot values start paragraphs, like placeholder text."""
+    card = tppt.compile_slide(_card)
+    slides = _fill_twice(card, title="Region\nNorth", revenue="100\n<USD>")
+    expected = (
+        tppt.Presentation.builder()
+        .slide(lambda slide: slide.TitleLayout(title="Region\nNorth"))
+        .build()
+        .to_pptx()
+    )
+
+    for slide in slides:
+        assert _paragraphs(slide)[0] == _paragraphs(expected.slides[0])[0]
+        assert _paragraphs(slide)[2] == ["Revenue: 100", "<USD>"]
+
+
+def test_slot_control_characters_are_escaped() -> None:
+    """Test that control characters of slot values are escaped like python-pptx."""
+    card = tppt.compile_slide(_card)
+    value = "bell\x07, tab\t and escape\x1b"
+    slides = _fill_twice(card, title=value, revenue=value)
+    expected = (
+        tppt.Presentation.builder()
+        .slide(lambda slide: _card(slide, value, value))
+        .build()
+        .to_pptx()
+    )
+
+    for slide in slides:
+        assert _paragraphs(slide) == _paragraphs(expected.slides[0])
+        assert "bell_x0007_, tab\t and escape_x001B_" in _texts(slide)
+
+
+def test_tap_falls_back_to_building() -> None:
+    """Test that a recipe with a tap() callback is built every time."""
+    card = tppt.compile_slide(
+        lambda slide: (
+            slide.TitleLayout(title=tppt.Slot("title"))
+            .builder()
+            .tap(lambda slide: None)
+        )
+    )
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(card.fill(title="A"))
+        .slide(card.fill(title="B"))
+        .build()
+    )
+
+    assert card.report is not None
+    assert not card.report.compiled
+    assert card.report.reason is not None and "tap()" in card.report.reason
+    assert card.report.slots == frozenset({"title"})
+    assert [_texts(slide) for slide in presentation.to_pptx().slides] == [["A"], ["B"]]
+
+
+def test_slot_values_are_checked() -> None:
+    """Test that missing and unknown slot values are reported."""
+    card = tppt.compile_slide(_card)
+    builder = tppt.Presentation.builder().slide(card.fill(title="A", revenue="1"))
+
+    with pytest.raises(SlotValueMissingError):
+        builder.slide(card.fill(title="B"))
+
+    with pytest.raises(SlotNotFoundError):
+        builder.slide(card.fill(title="B", revenue="2", region="C"))
+
+
+def test_slot_name_must_be_identifier() -> None:
+    """Test that slot names are checked."""
+    with pytest.raises(ValueError):
+        tppt.Slot("not a name")
@@ -0,0 +1,95 @@
+"""Tests for shape id allocation of slide builders."""
+
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
+from pptx.util import Emu
+
+import tppt
+
+
+def _shape_ids(presentation: tppt.Presentation) -> list[int]:
+    return [shape.shape_id for shape in presentation.to_pptx().slides[0].shapes]
+
+
+def test_shape_ids_are_unique_and_sequential() -> None:
+    """Test that the shapes of a slide are numbered in order."""
+    builder = tppt.Presentation.builder().slide(
+        lambda slide: (
+            slide.TitleLayout(title="Title")
+            .builder()
+            .text("a", left=(1, "in"), top=(1, "in"), width=(1, "in"), height=(1, "in"))
+            .add_shape(
+                MSO_AUTO_SHAPE_TYPE.OVAL,
+                left=(1, "in"),
+                top=(2, "in"),
+                width=(1, "in"),
+                height=(1, "in"),
+            )
+            .table(
+                [["a", "b"], [1, 2]],
+                left=(1, "in"),
+                top=(3, "in"),
+                width=(4, "in"),
+                height=(1, "in"),
+            )
+        )
+    )
+
+    shape_ids = _shape_ids(builder.build())
+
+    assert len(set(shape_ids)) == len(shape_ids)
+    assert shape_ids[-3:] == list(range(shape_ids[-3], shape_ids[-3] + 3))
+
+
+def test_shape_ids_after_tap_with_group_shape() -> None:
+    """Test that shapes added by a callback are not numbered twice."""
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .tap(lambda slide: slide.to_pptx().shapes._spTree.add_grpSp())
+                .text(
+                    "a",
+                    left=(1, "in"),
+                    top=(1, "in"),
+                    width=(1, "in"),
+                    height=(1, "in"),
+                )
+            )
+        )
+        .build()
+    )
+
+    shape_ids = _shape_ids(presentation)
+
+    assert len(set(shape_ids)) == len(shape_ids) == 2
+
+
+def test_allocator_is_released_after_build() -> None:
+    """Test that shapes added after the build are numbered by python-pptx."""
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .text(
+                    "a",
+                    left=(1, "in"),
+                    top=(1, "in"),
+                    width=(1, "in"),
+                    height=(1, "in"),
+                )
+            )
+        )
+        .build()
+    )
+    shapes = presentation.to_pptx().slides[0].shapes
+
+    assert not shapes.turbo_add_enabled
+
+    shapes._spTree.add_grpSp()
+    shapes.add_textbox(Emu(0), Emu(0), Emu(1), Emu(1))
+
+    assert len(set(_shape_ids(presentation))) == 3
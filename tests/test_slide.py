@@ -1,5 +1,6 @@
 """Tests for slide module."""
 
+from collections.abc import Sequence
 from typing import cast
 
 from pptx.shapes.autoshape import Shape as PptxShape
@@ -39,7 +40,7 @@ def test_slide_placeholders() -> None:
     placeholders = slide.placeholders
 
     # Check that placeholders is a list
-    assert isinstance(placeholders, list)
+    assert isinstance(placeholders, Sequence)
     assert len(placeholders) != 0
 
     # Verify each placeholder is a SlidePlaceholder instance
@@ -223,12 +224,12 @@ def test_notes_slide_properties(output) -> None:
 
     # Test placeholders
     placeholders = notes.placeholders
-    assert isinstance(placeholders, list)
+    assert isinstance(placeholders, Sequence)
     assert len(placeholders) > 0
 
     # Test shapes
     shapes = notes.shapes
-    assert isinstance(shapes, list)
+    assert isinstance(shapes, Sequence)
     assert len(shapes) > 0
     for shape in shapes:
         assert isinstance(shape, BaseShape)
@@ -0,0 +1,97 @@
+"""Tests for cloning slides and copying them between presentations."""
+
+import pathlib
+
+import pptx
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+import tppt
+
+LOGO = pathlib.Path(__file__).parent.parent / "examples" / "images" / "python-logo.png"
+BASE_DECK = (
+    pathlib.Path(__file__).parent.parent / "examples" / "custom_slide_master_base.pptx"
+)
+
+
+def _library(count: int) -> tppt.Presentation:
+    builder = tppt.Presentation.builder()
+    for i in range(count):
+        builder.slide(
+            lambda slide, i=i: (
+                slide.TitleLayout(title=f"Slide {i}")
+                .builder()
+                .picture(LOGO, left=(1, "in"), top=(2, "in"), width=(2, "in"))
+            )
+        )
+
+    return builder.build()
+
+
+def _image_parts(presentation: pptx.presentation.Presentation) -> set:
+    return {
+        slide.part.related_part(shape._pic.blip_rId)
+        for slide in presentation.slides
+        for shape in slide.shapes
+        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE
+    }
+
+
+def _title(slide: pptx.slide.Slide) -> str:
+    assert slide.shapes.title is not None
+    return slide.shapes.title.text_frame.text
+
+
+def test_clone_slide(output: pathlib.Path) -> None:
+    """Test that a cloned slide is a copy sharing the image of the original."""
+    presentation = _library(2)
+    original = presentation.slides[0]
+
+    clone = presentation.clone_slide(original)
+    clone.to_pptx().shapes.title.text_frame.text = "Clone"  # type: ignore[union-attr]
+    presentation.save(output / "clone_slide.pptx")
+
+    assert presentation.slides[-1] is clone
+    assert clone.slide_layout.to_pptx() == original.slide_layout.to_pptx()
+
+    reopened = pptx.Presentation(str(output / "clone_slide.pptx"))
+    assert [_title(slide) for slide in reopened.slides] == [
+        "Slide 0",
+        "Slide 1",
+        "Clone",
+    ]
+    assert len(_image_parts(reopened)) == 1
+
+
+def test_import_slides(output: pathlib.Path) -> None:
+    """Test copying slides into a presentation with other slide layouts."""
+    library = _library(3)
+    presentation = tppt.Presentation(BASE_DECK)
+    count = len(presentation.slides)
+    images = len(_image_parts(pptx.Presentation(str(BASE_DECK))))
+
+    imported = presentation.import_slides(library, library.slides[1:])
+    presentation.save(output / "import_slides.pptx")
+
+    assert len(imported) == 2
+    assert presentation.slides[count:] == imported
+
+    reopened = pptx.Presentation(str(output / "import_slides.pptx"))
+    assert [_title(slide) for slide in reopened.slides][count:] == [
+        "Slide 1",
+        "Slide 2",
+    ]
+    assert len(_image_parts(reopened)) == images + 1
+    partnames = [str(part.partname) for part in reopened.part.package.iter_parts()]
+    assert len(set(partnames)) == len(partnames)
+
+
+def test_import_all_slides_twice() -> None:
+    """Test that importing the same slides twice shares their images."""
+    library = _library(2)
+    presentation = tppt.Presentation.builder().build()
+
+    presentation.import_slides(library)
+    presentation.import_slides(library)
+
+    assert len(presentation.slides) == 4
+    assert len(_image_parts(presentation.to_pptx())) == 1
@@ -1,3 +1,7 @@
+import pytest
+
+import tppt
+from tppt.exception import SlideMasterAttributeNotFoundError
 from tppt.template.default import (
     DefaultBlankSlideLayout,
     DefaultComparisonSlideLayout,
@@ -13,7 +17,12 @@ from tppt.template.default import (
     DefaultVerticalTitleAndTextSlideLayout,
 )
 from tppt.template.slide_layout import Placeholder
-from tppt.template.slide_master import Layout, get_slide_layouts
+from tppt.template.slide_master import (
+    Layout,
+    SlideMasterProxy,
+    get_slide_layout_indices,
+    get_slide_layouts,
+)
 
 
 class TestSlideMaster(DefaultSlideMaster):
@@ -57,3 +66,29 @@ def test_get_layouts():
 
     # Verify that MasterLayout is not included
     assert str not in layouts
+
+
+def test_get_slide_layout_indices():
+    """Test that layout indices follow the declaration order and are computed once."""
+    indices = get_slide_layout_indices(TestSlideMaster)
+
+    assert indices["Title"] == (0, DefaultTitleSlideLayout)
+    assert indices["Blank"] == (6, DefaultBlankSlideLayout)
+    assert "title" not in indices
+    assert get_slide_layout_indices(TestSlideMaster) is indices
+
+
+def test_slide_master_proxy_lookup():
+    """Test that the proxy resolves layouts against the presentation package."""
+    pptx_slide_layouts = (
+        tppt.Presentation.builder().build().to_pptx().slide_masters[0].slide_layouts
+    )
+    proxy = SlideMasterProxy(TestSlideMaster, pptx_slide_layouts)
+
+    blank = proxy.Blank
+    assert blank._slide_layout_type is DefaultBlankSlideLayout
+    assert blank._convertible_slide_layout.to_pptx() == pptx_slide_layouts[6]
+    assert proxy.Blank._convertible_slide_layout is blank._convertible_slide_layout
+
+    with pytest.raises(SlideMasterAttributeNotFoundError):
+        proxy.Unknown  # noqa: B018
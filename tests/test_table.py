@@ -1,8 +1,10 @@
 """Tests for table module."""
 
+import asyncio
+import datetime
 import pathlib
 from dataclasses import dataclass
-from typing import cast
+from typing import Any, cast
 
 import pytest
 from pptx.shapes.graphfrm import GraphicFrame as PptxGraphicFrame
@@ -12,11 +14,19 @@ import tppt.pptx.table
 from tppt._features import (
     USE_PANDAS,
     USE_POLARS,
+    USE_PYARROW,
     USE_PYDANTIC,
     Dataclass,
     PydanticModel,
 )
-from tppt.pptx.table.table import ColumnCollection, RowCollection
+from tppt.exception import TableColumnNotFoundError, TableStreamInRunningLoopError
+from tppt.pptx.presentation import PresentationBuilder
+from tppt.pptx.table.table import (
+    ColumnCollection,
+    RowCollection,
+    TableCellStyle,
+    dataframe2list,
+)
 
 
 def test_create_table_with_list_data(output: pathlib.Path) -> None:
@@ -232,6 +242,234 @@ def test_create_table_with_pydantic_model(output: pathlib.Path) -> None:
     presentation.save(output / "table_pydantic_data.pptx")
 
 
+@pytest.mark.skipif(not USE_PYARROW, reason="PyArrow not installed")
+def test_create_table_with_arrow_table(output: pathlib.Path) -> None:
+    """Test creating a table with pyarrow Table."""
+    import pyarrow as pa  # type: ignore[import]
+
+    arrow_table = pa.table(
+        {
+            "地域": ["北海道", "東北", None],
+            "売上": [1200, None, 800],
+            "達成": [True, False, None],
+        }
+    )
+
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .table(
+                    arrow_table,
+                    left=(100, "pt"),
+                    top=(100, "pt"),
+                    width=(400, "pt"),
+                    height=(200, "pt"),
+                    first_row_header=True,
+                )
+            )
+        )
+        .build()
+    )
+    presentation.save(output / "table_arrow_data.pptx")
+
+    table = cast(PptxGraphicFrame, presentation.to_pptx().slides[0].shapes[0]).table
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [
+        ["地域", "売上", "達成"],
+        ["北海道", "1200", "True"],
+        ["東北", "", "False"],
+        ["", "800", ""],
+    ]
+
+
+@pytest.mark.skipif(not USE_PYARROW, reason="PyArrow not installed")
+def test_dataframe2list_with_record_batch_reader() -> None:
+    """Test that a RecordBatchReader is converted batch by batch."""
+    import pyarrow as pa  # type: ignore[import]
+
+    arrow_table = pa.table({"a": [1, 2, 3], "b": [0.5, None, 2.25]})
+    reader = pa.RecordBatchReader.from_batches(
+        arrow_table.schema, arrow_table.to_batches(max_chunksize=2)
+    )
+
+    assert dataframe2list(reader) == [
+        ["a", "b"],
+        ["1", "0.5"],
+        ["2", ""],
+        ["3", "2.25"],
+    ]
+
+
+@pytest.mark.skipif(
+    not (USE_PANDAS and USE_POLARS), reason="Pandas or Polars not installed"
+)
+def test_dataframe2list_columnar_conversion() -> None:
+    """Test that pandas and polars frames are converted to the same strings."""
+    import pandas as pd  # type: ignore[import]
+    import polars as pl  # type: ignore[import]
+
+    data = {"name": ["x", None], "count": [1, 2], "flag": [True, False]}
+    expected = [["name", "count", "flag"], ["x", "1", "True"], ["", "2", "False"]]
+
+    assert dataframe2list(pl.DataFrame(data)) == expected
+    assert dataframe2list(pd.DataFrame(data)) == expected
+
+
+@pytest.mark.skipif(
+    not (USE_PANDAS and USE_POLARS and USE_PYARROW),
+    reason="Pandas, Polars or PyArrow not installed",
+)
+def test_dataframe2list_columnar_conversion_of_floats_and_datetimes() -> None:
+    """Test that floats and datetimes are converted like `str` of the values."""
+    import pandas as pd  # type: ignore[import]
+    import polars as pl  # type: ignore[import]
+    import pyarrow as pa  # type: ignore[import]
+
+    utc = datetime.UTC
+    data = {
+        "amount": [1e-07, 1e16, 123.456, None],
+        "at": [
+            datetime.datetime(2024, 1, 2, 3, 4, 5),
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 500),
+            datetime.datetime(2024, 1, 2),
+            None,
+        ],
+        "at_utc": [
+            datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=utc),
+            None,
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 7, tzinfo=utc),
+            None,
+        ],
+        "time": [datetime.time(1, 2, 3), datetime.time(1, 2, 3, 400), None, None],
+    }
+    expected = [
+        list(data),
+        *(
+            ["" if value is None else str(value) for value in row]
+            for row in zip(*data.values(), strict=True)
+        ),
+    ]
+
+    assert expected[1] == [
+        "1e-07",
+        "2024-01-02 03:04:05",
+        "2024-01-02 03:04:05+00:00",
+        "01:02:03",
+    ]
+    assert dataframe2list(pl.DataFrame(data)) == expected
+    assert dataframe2list(pd.DataFrame(data)) == expected
+    assert dataframe2list(pa.table(data)) == expected
+
+
+def test_dataframe2list_column_formats_with_list_data() -> None:
+    """Test that column formats apply to all rows except the header row."""
+
+    @dataclass
+    class Sale:
+        region: str
+        amount: float
+        rate: float
+        day: datetime.date
+
+    sales = [
+        Sale("East", 1234567.891, 0.125, datetime.date(2024, 4, 1)),
+        Sale("West", -980.5, 1.0, datetime.date(2024, 12, 31)),
+    ]
+    column_formats = {"amount": ",.2f", "rate": ".1%", -1: "%Y/%m/%d"}
+    expected = [
+        ["region", "amount", "rate", "day"],
+        ["East", "1,234,567.89", "12.5%", "2024/04/01"],
+        ["West", "-980.50", "100.0%", "2024/12/31"],
+    ]
+
+    assert dataframe2list(cast(list[Dataclass], sales), column_formats) == expected
+
+    rows = [
+        ["region", "amount", "rate", "day"],
+        *([sale.region, sale.amount, sale.rate, sale.day] for sale in sales),
+    ]
+    assert dataframe2list(rows, column_formats) == expected
+
+
+@pytest.mark.skipif(
+    not (USE_PANDAS and USE_POLARS and USE_PYARROW),
+    reason="Pandas, Polars or PyArrow not installed",
+)
+def test_dataframe2list_column_formats_are_vectorized() -> None:
+    """Test that DataFrame columns are formatted like Python `format`."""
+    import pandas as pd  # type: ignore[import]
+    import polars as pl  # type: ignore[import]
+    import pyarrow as pa  # type: ignore[import]
+
+    data = {
+        "count": [1234567, -1000, None],
+        "amount": [1234.5, None, -0.125],
+        "day": [datetime.datetime(2024, 4, 1), None, datetime.datetime(2025, 1, 2)],
+    }
+    column_formats = {"count": "+,d", 1: ",.2f", "day": "%d.%m.%Y"}
+    expected = [
+        ["count", "amount", "day"],
+        ["+1,234,567", "1,234.50", "01.04.2024"],
+        ["-1,000", "", ""],
+        ["", "-0.12", "02.01.2025"],
+    ]
+
+    assert dataframe2list(pl.DataFrame(data), column_formats) == expected
+    assert dataframe2list(pd.DataFrame(data), column_formats) == expected
+    assert dataframe2list(pa.table(data), column_formats) == expected
+
+
+def test_dataframe2list_column_formats_missing_values() -> None:
+    """Test that every input gives an empty string for None, NaN and NaT."""
+    import pandas as pd  # type: ignore[import]
+    import polars as pl  # type: ignore[import]
+    import pyarrow as pa  # type: ignore[import]
+
+    nan = float("nan")
+    data = {
+        "amount": [1.5, None, nan],
+        "day": [datetime.datetime(2024, 4, 1), None, pd.NaT],
+    }
+    column_formats = {"amount": ",.1f", "day": "%d.%m.%Y"}
+    expected = [["amount", "day"], ["1.5", "01.04.2024"], ["", ""], ["", ""]]
+
+    rows = [list(row) for row in zip(*data.values(), strict=True)]
+    polars_data = {"amount": data["amount"], "day": data["day"][:2] + [None]}
+
+    assert dataframe2list([list(data), *rows], column_formats) == expected
+    assert dataframe2list(pd.DataFrame(data), column_formats) == expected
+    assert dataframe2list(pd.DataFrame(data, dtype=object), column_formats) == expected
+    assert dataframe2list(pl.DataFrame(polars_data), column_formats) == expected
+    assert dataframe2list(pa.table(polars_data), column_formats) == expected
+
+
+def test_dataframe2list_column_formats_integers_of_floats() -> None:
+    """Test that every input rounds floats for an integer format."""
+    import pandas as pd  # type: ignore[import]
+    import polars as pl  # type: ignore[import]
+    import pyarrow as pa  # type: ignore[import]
+
+    data = {"count": [1234566.6, -2.5, 2.5, None]}
+    column_formats = {"count": ",d"}
+    expected = [["count"], ["1,234,567"], ["-2"], ["2"], [""]]
+
+    rows = [[value] for value in data["count"]]
+
+    assert dataframe2list([["count"], *rows], column_formats) == expected
+    assert dataframe2list(pd.DataFrame(data), column_formats) == expected
+    assert dataframe2list(pd.DataFrame(data, dtype=object), column_formats) == expected
+    assert dataframe2list(pl.DataFrame(data), column_formats) == expected
+    assert dataframe2list(pa.table(data), column_formats) == expected
+
+
+def test_table_column_formats_unknown_column() -> None:
+    """Test that a format for an unknown column is an error."""
+    with pytest.raises(TableColumnNotFoundError):
+        dataframe2list([["a", "b"], [1, 2]], {"c": ",d"})
+
+
 def test_cell_set_chain_methods(output) -> None:
     """Test Cell set_* chain methods return self."""
     from pptx.enum.text import MSO_VERTICAL_ANCHOR
@@ -416,3 +654,393 @@ def test_table_callback(output) -> None:
     # プレゼンテーションを保存
     pptx_path = output / "table_callback.pptx"
     presentation.save(pptx_path)
+
+
+def test_write_table_data_matches_cell_text() -> None:
+    """Test that the bulk XML writer produces the same XML as `cell.text`."""
+    import pptx
+    from lxml import etree
+    from pptx.util import Pt
+
+    from tppt.pptx.table._xml import write_table_data
+
+    data = [
+        ["Header", "", "multi\nline"],
+        ["soft\vbreak", "ctrl\x07char", 1234],
+        ["\n", "<escaped & text>", None],
+    ]
+
+    def new_table() -> PptxGraphicFrame:
+        prs = pptx.Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        return slide.shapes.add_table(3, 3, 0, 0, Pt(300), Pt(100))
+
+    expected = new_table().table
+    for i, row in enumerate(data):
+        for j, value in enumerate(row):
+            expected.cell(i, j).text = str(value)
+
+    actual = new_table().table
+    write_table_data(actual._tbl, data)
+
+    assert etree.tostring(actual._tbl) == etree.tostring(expected._tbl)
+
+
+def test_table_style_rules(output: pathlib.Path) -> None:
+    """Test applying row, column, band and range style rules."""
+    from lxml import etree
+    from pptx.oxml.ns import qn
+
+    from tppt.pptx.table import TableStyleRule
+
+    data = [[f"{i},{j}" for j in range(4)] for i in range(5)]
+    style_rules: list[TableStyleRule] = [
+        {"style": {"font_size": (10, "pt")}},
+        {"band": "odd_rows", "style": {"fill_color": "#EEEEEE"}},
+        {"rows": 0, "style": {"bold": True, "fill_color": "#003366"}},
+        {"cols": -1, "style": {"text_align": "right"}},
+        {
+            "rows": slice(3, None),
+            "cols": slice(1, 3),
+            "style": {"border": {"color": "#FF0000", "width": (1, "pt")}},
+        },
+    ]
+
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .table(
+                    data,
+                    left=(100, "pt"),
+                    top=(100, "pt"),
+                    width=(400, "pt"),
+                    height=(200, "pt"),
+                    style_rules=style_rules,
+                )
+            )
+        )
+        .build()
+    )
+    presentation.save(output / "table_style_rules.pptx")
+
+    pptx_table = cast(
+        PptxGraphicFrame, presentation.to_pptx().slides[0].shapes[0]
+    ).table
+
+    def cell_xml(row: int, col: int) -> str:
+        return etree.tostring(pptx_table.cell(row, col)._tc).decode()
+
+    # All cells share the font size.
+    assert all('sz="1000"' in cell_xml(i, j) for i in range(5) for j in range(4))
+
+    # The header rule overrides the band fill of row 0 (even row, no band).
+    assert 'b="1"' in cell_xml(0, 0)
+    assert "003366" in cell_xml(0, 0)
+    assert "EEEEEE" in cell_xml(1, 0)
+    assert "EEEEEE" not in cell_xml(2, 0)
+
+    # Last column is right aligned.
+    assert 'algn="r"' in cell_xml(2, 3)
+    assert 'algn="r"' not in cell_xml(2, 2)
+
+    # Borders only in the rectangular range, before the fill in tcPr.
+    assert "FF0000" in cell_xml(3, 1)
+    assert "FF0000" not in cell_xml(3, 0)
+    assert "FF0000" not in cell_xml(2, 1)
+    tc_pr = pptx_table.cell(3, 1)._tc.tcPr
+    assert tc_pr is not None
+    assert [child.tag for child in tc_pr] == [
+        qn("a:lnL"),
+        qn("a:lnR"),
+        qn("a:lnT"),
+        qn("a:lnB"),
+        qn("a:solidFill"),
+    ]
+
+
+def test_cell_styles_are_compiled_once_per_distinct_style() -> None:
+    """Test that equal styles share a single compiled style."""
+    from tppt.pptx.table._xml import style_key
+
+    header: TableCellStyle = {"bold": True, "border": {"color": "#000000"}}
+
+    assert style_key(header) == style_key(
+        {"border": {"color": "#000000"}, "bold": True}
+    )
+    assert style_key(header) != style_key({"bold": False})
+
+
+def _table_texts(presentation: tppt.Presentation) -> list[list[list[str]]]:
+    """Get the texts of the first table of each slide."""
+    return [
+        [
+            [cell.text for cell in row.cells]
+            for row in cast(PptxGraphicFrame, slide.shapes[0]).table.rows
+        ]
+        for slide in presentation.to_pptx().slides
+    ]
+
+
+@pytest.mark.skipif(not USE_POLARS, reason="Polars not installed")
+def test_paginated_table_repeats_header(output: pathlib.Path) -> None:
+    """Test that a large DataFrame continues on slides of the same layout."""
+    import polars as pl  # type: ignore[import]
+
+    df = pl.DataFrame({"no": range(25), "name": [f"item {i}" for i in range(25)]})
+
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .table(
+                    df,
+                    left=(1, "in"),
+                    top=(1, "in"),
+                    width=(6, "in"),
+                    height=(5, "in"),
+                    max_rows_per_slide=10,
+                    column_formats={"no": "03d"},
+                )
+            )
+        )
+        .build()
+    )
+    presentation.save(output / "table_paginated.pptx")
+
+    pages = _table_texts(presentation)
+    assert [len(page) for page in pages] == [11, 11, 6]
+    assert all(page[0] == ["no", "name"] for page in pages)
+    assert pages[1][1] == ["010", "item 10"]
+    assert pages[2][-1] == ["024", "item 24"]
+
+    pptx_slides = presentation.to_pptx().slides
+    assert len({slide.slide_layout.name for slide in pptx_slides}) == 1
+    # Rows keep the same height on the shorter last page.
+    heights = [
+        slide.shapes[0].height // len(page) for slide, page in zip(pptx_slides, pages)
+    ]
+    assert len(set(heights)) == 1
+
+
+def test_paginated_table_by_row_height() -> None:
+    """Test that the rows that do not fit in the table height continue."""
+    data = [["key", "value"], *([f"k{i}", str(i)] for i in range(7))]
+
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .table(
+                    data,
+                    left=(1, "in"),
+                    top=(1, "in"),
+                    width=(4, "in"),
+                    height=(2, "in"),
+                    row_height=(0.5, "in"),
+                )
+            )
+        )
+        .build()
+    )
+
+    pages = _table_texts(presentation)
+    assert [len(page) for page in pages] == [4, 4, 2]
+    assert [page[0] for page in pages] == [["key", "value"]] * 3
+    assert [row[0] for page in pages for row in page[1:]] == [f"k{i}" for i in range(7)]
+
+
+@pytest.mark.skipif(not USE_PYARROW, reason="PyArrow not installed")
+def test_table_pager_reads_record_batches_lazily() -> None:
+    """Test that pages of a RecordBatchReader are read on demand."""
+    import pyarrow as pa  # type: ignore[import]
+
+    from tppt.pptx.table._pagination import TablePager
+
+    read_batches: list[int] = []
+
+    def batches():
+        for start in range(0, 9, 3):
+            read_batches.append(start)
+            yield pa.record_batch({"n": list(range(start, start + 3))})
+
+    reader = pa.RecordBatchReader.from_batches(
+        pa.schema([("n", pa.int64())]), batches()
+    )
+    pager = TablePager(reader, 4)
+
+    assert read_batches == []
+    assert pager.next_page() == [["n"], ["0"], ["1"], ["2"], ["3"]]
+    assert read_batches == [0, 3]
+    assert pager.next_page() == [["n"], ["4"], ["5"], ["6"], ["7"]]
+    assert pager.has_next_page()
+    assert pager.next_page() == [["n"], ["8"]]
+    assert not pager.has_next_page()
+    assert pager.next_page() is None
+
+
+def test_streamed_table_from_generator(output: pathlib.Path) -> None:
+    """Test that rows of a generator are written as they are read."""
+    read_rows: list[int] = []
+
+    def cursor():
+        for i in range(5):
+            read_rows.append(i)
+            yield (f"user {i}", i * 1000.5)
+
+    builder = tppt.Presentation.builder().slide(
+        lambda slide: (
+            slide.BlankLayout()
+            .builder()
+            .table(
+                cursor(),
+                columns=["name", "score"],
+                left=(1, "in"),
+                top=(1, "in"),
+                width=(4, "in"),
+                height=(3, "in"),
+                column_formats={"score": ",.1f"},
+                style_rules=[{"rows": 0, "style": {"bold": True}}],
+            )
+        )
+    )
+    # NOTE: The rows are read when the slide is built.
+    presentation = builder.build()
+    presentation.save(output / "table_streamed.pptx")
+
+    assert read_rows == [0, 1, 2, 3, 4]
+    [page] = _table_texts(presentation)
+    assert page == [
+        ["name", "score"],
+        ["user 0", "0.0"],
+        ["user 1", "1,000.5"],
+        ["user 2", "2,001.0"],
+        ["user 3", "3,001.5"],
+        ["user 4", "4,002.0"],
+    ]
+
+    frame = cast(PptxGraphicFrame, presentation.to_pptx().slides[0].shapes[0])
+    assert {row.height for row in frame.table.rows} == {frame.height // 6}
+    assert frame.table.cell(0, 0).text_frame.paragraphs[0].runs[0].font.bold
+
+
+def test_streamed_table_missing_values() -> None:
+    """Test that missing values of streamed rows are empty cells."""
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .table(
+                    iter([("a", None, 1.5), (None, 2, None)]),
+                    columns=["name", "count", "score"],
+                    left=(1, "in"),
+                    top=(1, "in"),
+                    width=(4, "in"),
+                    height=(2, "in"),
+                    column_formats={"score": ".1f"},
+                )
+            )
+        )
+        .build()
+    )
+
+    assert _table_texts(presentation) == [
+        [["name", "count", "score"], ["a", "", "1.5"], ["", "2", ""]]
+    ]
+
+
+def test_streamed_table_from_async_iterable() -> None:
+    """Test that an async iterable of rows is read on a private event loop."""
+
+    async def cursor():
+        for i in range(3):
+            await asyncio.sleep(0)
+            yield [i, i * i]
+
+    presentation = (
+        tppt.Presentation.builder()
+        .slide(
+            lambda slide: (
+                slide.BlankLayout()
+                .builder()
+                .table(
+                    cursor(),
+                    columns=["n", "square"],
+                    left=(1, "in"),
+                    top=(1, "in"),
+                    width=(4, "in"),
+                    height=(2, "in"),
+                    max_rows_per_slide=2,
+                )
+            )
+        )
+        .build()
+    )
+
+    assert _table_texts(presentation) == [
+        [["n", "square"], ["0", "0"], ["1", "1"]],
+        [["n", "square"], ["2", "4"]],
+    ]
+
+
+def _async_table_builder(cursor: Any) -> PresentationBuilder:
+    return tppt.Presentation.builder().slide(
+        lambda slide: (
+            slide.BlankLayout()
+            .builder()
+            .table(
+                cursor,
+                columns=["name", "score"],
+                left=(1, "in"),
+                top=(1, "in"),
+                width=(4, "in"),
+                height=(2, "in"),
+            )
+        )
+    )
+
+
+def test_streamed_table_in_running_loop() -> None:
+    """Test that async rows are read by the running event loop in `abuild`."""
+    loops = []
+
+    async def cursor():
+        # Like a database cursor, the rows need the loop of the service.
+        loops.append(asyncio.get_running_loop())
+        for name in ("a", "b"):
+            await asyncio.sleep(0)
+            yield [name, None]
+
+    async def build() -> tppt.Presentation:
+        builder = _async_table_builder(cursor())
+        assert loops == []
+        presentation = await builder.abuild()
+        assert loops == [asyncio.get_running_loop()]
+        return presentation
+
+    presentation = asyncio.run(build())
+
+    assert _table_texts(presentation) == [[["name", "score"], ["a", ""], ["b", ""]]]
+    frame = cast(PptxGraphicFrame, presentation.to_pptx().slides[0].shapes[0])
+    assert {row.height for row in frame.table.rows} == {frame.height // 3}
+
+
+def test_streamed_table_build_in_running_loop() -> None:
+    """Test that async rows cannot be read by `build` in a running event loop."""
+
+    async def cursor():
+        yield ["a", 1]
+
+    async def build() -> None:
+        _async_table_builder(cursor()).build()
+
+    with pytest.raises(TableStreamInRunningLoopError):
+        asyncio.run(build())
@@ -0,0 +1,143 @@
+"""Tests for template cache module."""
+
+import io
+import os
+import pathlib
+import shutil
+
+import pptx
+import pytest
+
+import tppt
+from tppt.exception import TemplateSnapshotVersionError
+from tppt.template.cache import TemplateCache
+from tppt.template.snapshot import dump_template_snapshot, load_template_snapshot
+
+CUSTOM_TEMPLATE = (
+    pathlib.Path(__file__).parent.parent / "examples" / "custom_slide_master_base.pptx"
+)
+
+
+def test_template_cache_hit_and_miss() -> None:
+    """Test that a template is parsed once and then served from the cache."""
+    cache = TemplateCache()
+
+    cache.get("default")
+    cache.get("default")
+    cache.get("default")
+
+    info = cache.cache_info()
+    assert info.hits == 2
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_template_cache_returns_independent_copies() -> None:
+    """Test that each copy can be modified without affecting the others."""
+    cache = TemplateCache()
+
+    first = cache.get("default")
+    first.slides.add_slide(first.slide_layouts[6])
+
+    second = cache.get("default")
+    assert len(first.slides) == 1
+    assert len(second.slides) == 0
+    assert first.part.package is not second.part.package
+
+
+def test_template_cache_lru_eviction(tmp_path: pathlib.Path) -> None:
+    """Test that the least recently used template is evicted."""
+    cache = TemplateCache(maxsize=2)
+    templates = []
+    for i in range(3):
+        template = tmp_path / f"template{i}.pptx"
+        shutil.copy(CUSTOM_TEMPLATE, template)
+        templates.append(template)
+
+    cache.get(templates[0])
+    cache.get(templates[1])
+    cache.get(templates[0])
+    cache.get(templates[2])
+    cache.get(templates[0])
+    cache.get(templates[1])
+
+    info = cache.cache_info()
+    assert info.currsize == 2
+    assert info.hits == 2
+    assert info.misses == 4
+
+
+def test_template_cache_invalidated_by_file_change(tmp_path: pathlib.Path) -> None:
+    """Test that a modified template file is parsed again."""
+    cache = TemplateCache()
+    template = tmp_path / "template.pptx"
+    shutil.copy(CUSTOM_TEMPLATE, template)
+
+    cache.get(template)
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache.get(template)
+
+    assert cache.cache_info().misses == 2
+
+
+def test_presentation_builder_uses_template_cache() -> None:
+    """Test that builders share the parsed template but not the package."""
+    from tppt.template.cache import template_cache
+
+    template_cache.cache_clear()
+
+    first = tppt.Presentation.builder().build()
+    second = tppt.Presentation.builder().build()
+
+    info = template_cache.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert first.to_pptx() is not second.to_pptx()
+
+
+def test_template_snapshot_seeds_cache(tmp_path: pathlib.Path) -> None:
+    """Test that a loaded snapshot is served by the cache like the parsed file."""
+    template = tmp_path / "template.pptx"
+    shutil.copy(CUSTOM_TEMPLATE, template)
+    dump_template_snapshot(template, tmp_path / "template.snapshot", TemplateCache())
+
+    cache = TemplateCache()
+    load_template_snapshot(tmp_path / "template.snapshot", cache)
+    restored = cache.get(template)
+
+    info = cache.cache_info()
+    assert info.hits == 1
+    assert info.misses == 0
+
+    parsed = pptx.Presentation(str(template))
+    assert [layout.name for layout in restored.slide_layouts] == [
+        layout.name for layout in parsed.slide_layouts
+    ]
+    assert {
+        str(part.partname): part.blob for part in restored.part.package.iter_parts()
+    } == {str(part.partname): part.blob for part in parsed.part.package.iter_parts()}
+
+    restored.slides.add_slide(restored.slide_layouts[0])
+    restored.save(io.BytesIO())
+
+
+def test_stale_template_snapshot_is_not_used(tmp_path: pathlib.Path) -> None:
+    """Test that a template file changed after its snapshot is parsed again."""
+    template = tmp_path / "template.pptx"
+    shutil.copy(CUSTOM_TEMPLATE, template)
+    dump_template_snapshot(template, tmp_path / "template.snapshot", TemplateCache())
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    cache = TemplateCache()
+    load_template_snapshot(tmp_path / "template.snapshot", cache)
+    cache.get(template)
+
+    assert cache.cache_info().misses == 1
+
+
+def test_template_snapshot_version_is_checked() -> None:
+    """Test that a file that is not a snapshot of this version is rejected."""
+    with pytest.raises(TemplateSnapshotVersionError):
+        load_template_snapshot(io.BytesIO(b"PK\x03\x04"), TemplateCache())
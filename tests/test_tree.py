@@ -0,0 +1,120 @@
+"""Tests for the node tree of presentations."""
+
+import copy
+import io
+import pathlib
+
+import pptx
+import pytest
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.enum.text import MSO_UNDERLINE
+from pptx.util import Inches, Pt
+
+import tppt
+from tppt.pptx.tree import ppt2tree
+
+EXAMPLES = pathlib.Path(__file__).parent.parent / "examples"
+LOGO = EXAMPLES / "images" / "python-logo.png"
+
+
+def _mixed_deck() -> bytes:
+    """Deck with the kinds of shapes and text formatting found in the tree."""
+    presentation = pptx.Presentation()
+
+    title_slide = presentation.slides.add_slide(presentation.slide_layouts[0])
+    assert title_slide.shapes.title is not None
+    title_slide.shapes.title.text = "Title\vwith a line break"
+    title_slide.notes_slide.notes_text_frame.text = "Speaker notes"  # type: ignore[union-attr]
+    # A placeholder moved on the slide, with its size from the layout.
+    title_slide.placeholders[1].left = Inches(2)
+
+    content_slide = presentation.slides.add_slide(presentation.slide_layouts[8])
+    content_slide.placeholders[1].insert_picture(str(LOGO))  # type: ignore[attr-defined]
+
+    shapes = presentation.slides.add_slide(presentation.slide_layouts[6]).shapes
+    textbox = shapes.add_textbox(Inches(1), Inches(1), Inches(3), Inches(1))
+    paragraph = textbox.text_frame.paragraphs[0]
+    paragraph.level = 2
+    run = paragraph.add_run()
+    run.text = "styled"
+    run.font.name = "Arial"
+    run.font.size = Pt(13.5)
+    run.font.bold = True
+    run.font.italic = True
+    run.font.underline = MSO_UNDERLINE.DOUBLE_LINE
+    run.font.color.theme_color = MSO_THEME_COLOR.ACCENT_2
+    run.font.color.brightness = -0.25
+    run = paragraph.add_run()
+    run.text = "red"
+    run.font.color.rgb = RGBColor(0xFF, 0x00, 0x00)
+    run.font.color.brightness = 0.4
+    run.font.underline = True
+    run = textbox.text_frame.add_paragraph().add_run()
+    run.text = "gradient"
+    run.font.fill.gradient()
+
+    rectangle = shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1), Inches(3), Inches(2), Inches(1)
+    )
+    rectangle.rotation = 30
+    shapes.add_connector(
+        MSO_CONNECTOR.STRAIGHT, Inches(4), Inches(3), Inches(6), Inches(4)
+    )
+    group = shapes.add_group_shape()
+    group.shapes.add_shape(MSO_SHAPE.OVAL, Inches(7), Inches(1), Inches(1), Inches(1))
+    group.shapes.add_picture(str(LOGO), Inches(7), Inches(3), Inches(1))
+    table = shapes.add_table(2, 3, Inches(1), Inches(5), Inches(6), Inches(1)).table
+    table.cell(0, 0).text = "cell"
+    table.cell(1, 2).text_frame.paragraphs[0].add_run().text = "last"
+    # A cell without a text body, as written by some editors.
+    tc = table.cell(1, 1)._tc
+    tc.remove(tc.txBody)
+
+    file = io.BytesIO()
+    presentation.save(file)
+    return file.getvalue()
+
+
+@pytest.mark.parametrize(
+    "deck",
+    [
+        pytest.param(_mixed_deck, id="mixed"),
+        pytest.param(
+            lambda: (EXAMPLES / "custom_slide_master_base.pptx").read_bytes(),
+            id="custom_slide_master_base",
+        ),
+    ],
+)
+def test_xml_engine_matches_python_pptx_engine(deck) -> None:
+    """Test that both engines give the same tree."""
+    blob = deck()
+
+    expected = ppt2tree(pptx.Presentation(io.BytesIO(blob)), engine="python-pptx")
+    actual = ppt2tree(pptx.Presentation(io.BytesIO(blob)), engine="xml")
+
+    assert actual == expected
+
+
+def test_xml_engine_does_not_change_runs() -> None:
+    """Test that the tree is read without adding properties to the text."""
+    presentation = pptx.Presentation(io.BytesIO(_mixed_deck()))
+    slide = presentation.slides[2]
+    before = copy.deepcopy(slide.part._element)
+
+    ppt2tree(presentation)
+
+    assert pptx.oxml.xmlchemy.serialize_for_reading(
+        slide.part._element
+    ) == pptx.oxml.xmlchemy.serialize_for_reading(before)
+
+
+def test_presentation_tree_uses_xml_engine() -> None:
+    """Test that the tree of a presentation is the tree of the XML engine."""
+    blob = _mixed_deck()
+    presentation = tppt.Presentation(pptx.Presentation(io.BytesIO(blob)))
+
+    assert presentation.tree == ppt2tree(
+        pptx.Presentation(io.BytesIO(blob)), engine="python-pptx"
+    )